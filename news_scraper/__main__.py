@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+헤드리스 실행 진입점
+
+    python -m news_scraper collect [--stream | --worker | --resume | --profile]
+    python -m news_scraper api [--host 127.0.0.1] [--port 8080]
+    python -m news_scraper gui
+    python -m news_scraper archive build|stats|export
+
+명령에 필요한 모듈만 불러옵니다. collect는 GUI 툴킷(tkinter)이나 API 서버 모듈을 불러오지 않고,
+요청/파싱 모듈도 실제로 소스를 가져올 때 불러오므로 cron으로 자주 실행해도 시작 시간이 짧습니다.
+"""
+
+import os
+import sys
+
+# 모듈들이 서로를 패키지 이름 없이 불러오므로 이 디렉터리를 검색 경로에 넣습니다.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+USAGE = """사용법: python -m news_scraper <명령> [옵션]
+
+명령:
+  collect   뉴스 수집 (옵션은 scraper.py와 같음, collect --help 참고)
+  api       뉴스 조회 API 서버 실행
+  gui       GUI 실행
+  archive   분석용 열 저장소 (build/stats/export, archive --help 참고)
+"""
+
+
+def main(argv=None):
+    """명령 이름에 따라 해당 모듈의 main을 실행합니다."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        print(USAGE)
+        return 0 if argv else 2
+
+    command, args = argv[0], argv[1:]
+    # 도움말의 프로그램 이름을 실행한 명령으로 보여줍니다.
+    sys.argv[0] = f"python -m news_scraper {command}"
+    if command == 'collect':
+        from scraper import main as collect_main
+        collect_main(args)
+    elif command == 'api':
+        from api_server import main as api_main
+        api_main(args)
+    elif command == 'gui':
+        from gui_app import main as gui_main
+        gui_main()
+    elif command == 'archive':
+        from archive import main as archive_main
+        return archive_main(args)
+    else:
+        print(f"알 수 없는 명령입니다: {command}\n")
+        print(USAGE)
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+뉴스 조회 API 서버
+누적 저장소(news.db)의 기사를 읽기 전용 HTTP API로 제공합니다.
+다른 서비스가 collected_news.json을 직접 읽다가 저장 도중의 파일을 읽는 문제 없이,
+필요한 만큼만 페이지 단위로 가져갈 수 있습니다.
+
+    GET /api/news                    최신 뉴스 (category, source 필터 가능)
+    GET /api/categories/<카테고리>     카테고리별 최신 뉴스
+    GET /api/sources/<소스 이름>       소스별 최신 뉴스
+    GET /api/search?q=<검색어>         제목/요약 검색
+    GET /api/news/<id>               기사 하나
+
+목록 응답은 {"items": [...], "next_cursor": "..."} 형식이며,
+next_cursor를 cursor 파라미터로 넘기면 다음 페이지를 받습니다.
+
+응답에는 저장소의 마지막 기사 id로 만든 ETag가 붙습니다 (gzip 본문은 ``-gzip``이 붙은 별도 ETag).
+새 기사가 저장되기 전까지 If-None-Match 요청에는 조회 없이 304로 답하고,
+같은 요청은 만들어 둔 응답(gzip 포함)을 재사용합니다.
+
+사용법:
+    python api_server.py [--host 127.0.0.1] [--port 8080]
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from news_store import NewsStore, db_file_from_config
+from scraper import load_config
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# gzip으로 압축할 최소 응답 크기 (바이트)
+GZIP_MIN_SIZE = 1024
+
+# If-None-Match 안의 ETag 하나 (약한 ETag의 W/ 접두사는 무시)
+_ETAG = re.compile(r'(?:W/)?"([^"]*)"')
+
+# 공개하는 기사 필드
+API_FIELDS = ('id', 'source', 'category', 'title', 'link', 'summary', 'published', 'collected_at')
+
+
+class BadRequest(Exception):
+    """잘못된 요청 파라미터"""
+
+
+def encode_cursor(cursor: Tuple[float, int]) -> str:
+    """페이지 커서 (published_ts, id)를 문자열로 바꿉니다."""
+    return base64.urlsafe_b64encode(f"{cursor[0]!r}:{cursor[1]}".encode()).decode().rstrip('=')
+
+
+def decode_cursor(text: str) -> Tuple[float, int]:
+    """
+    encode_cursor로 만든 문자열을 커서로 되돌립니다.
+
+    Raises:
+        BadRequest: 형식이 잘못된 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(text + '=' * (-len(text) % 4)).decode()
+        published_ts, article_id = raw.split(':')
+        return float(published_ts), int(article_id)
+    except (ValueError, UnicodeDecodeError):
+        raise BadRequest('cursor 값이 올바르지 않습니다.')
+
+
+def gzip_etag(etag: str) -> str:
+    """gzip으로 압축한 본문에 쓰는 ETag를 만듭니다 (같은 ETag를 두 인코딩이 나눠 쓰지 않도록)."""
+    return etag[:-1] + '-gzip"'
+
+
+def parse_if_none_match(header: Optional[str]) -> List[str]:
+    """
+    If-None-Match 헤더를 ETag 목록으로 바꿉니다.
+
+    쉼표로 나열된 여러 ETag를 모두 읽고, 약한 비교를 하므로 ``W/`` 접두사는 떼어냅니다.
+
+    Returns:
+        ETag 목록 (따옴표 포함), 헤더가 ``*``면 ['*'], 없으면 빈 목록
+    """
+    if not header:
+        return []
+    if header.strip() == '*':
+        return ['*']
+    return [f'"{tag}"' for tag in _ETAG.findall(header)]
+
+
+class ResponseCache:
+    """(요청, 저장소 버전)별로 만들어 둔 응답을 보관하는 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class NewsAPI:
+    """요청 경로를 저장소 조회로 바꾸는 API 본체 (HTTP 처리와 분리)"""
+
+    def __init__(self, store: NewsStore, cache_entries: int = 256):
+        """
+        Args:
+            store: 뉴스 저장소
+            cache_entries: 보관할 응답 수
+        """
+        self.store = store
+        self.cache = ResponseCache(cache_entries)
+
+    @staticmethod
+    def _page_size(params: Dict) -> int:
+        try:
+            limit = int(params.get('limit', DEFAULT_PAGE_SIZE))
+        except ValueError:
+            raise BadRequest('limit 값은 숫자여야 합니다.')
+        return max(1, min(limit, MAX_PAGE_SIZE))
+
+    @staticmethod
+    def _public(news: Dict) -> Dict:
+        return {field: news.get(field) for field in API_FIELDS}
+
+    def _page(self, params: Dict, category: Optional[str] = None, source: Optional[str] = None) -> Dict:
+        """최신순 한 페이지와 다음 커서를 만듭니다."""
+        limit = self._page_size(params)
+        cursor = decode_cursor(params['cursor']) if params.get('cursor') else None
+        rows = self.store.fetch_page(
+            cursor, limit + 1,
+            category=category or params.get('category'),
+            source=source or params.get('source')
+        )
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor((rows[-1]['published_ts'], rows[-1]['id']))
+        return {'items': [self._public(news) for news in rows], 'next_cursor': next_cursor}
+
+    def _route(self, path: str, params: Dict) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        경로와 파라미터를 검사해 (경로 종류, 경로 인자)로 바꿉니다. 저장소는 조회하지 않습니다.
+
+        Returns:
+            ('news' | 'article' | 'category' | 'source' | 'search', 인자), 지원하지 않는 경로면 None
+
+        Raises:
+            BadRequest: 파라미터가 잘못된 경우
+        """
+        parts = [unquote(part) for part in path.strip('/').split('/')]
+
+        if parts == ['api', 'news']:
+            route = ('news', None)
+        elif len(parts) == 3 and parts[:2] == ['api', 'news']:
+            if not parts[2].isdigit():
+                raise BadRequest('기사 id는 숫자여야 합니다.')
+            return 'article', parts[2]
+        elif len(parts) == 3 and parts[:2] == ['api', 'categories']:
+            route = ('category', parts[2])
+        elif len(parts) == 3 and parts[:2] == ['api', 'sources']:
+            route = ('source', parts[2])
+        elif parts == ['api', 'search']:
+            if not params.get('q', '').strip():
+                raise BadRequest('q 파라미터가 필요합니다.')
+            route = ('search', None)
+        else:
+            return None
+
+        self._page_size(params)
+        if route[0] != 'search' and params.get('cursor'):
+            decode_cursor(params['cursor'])
+        return route
+
+    def handle(self, path: str, params: Dict) -> Tuple[int, Dict]:
+        """
+        요청을 처리합니다.
+
+        Args:
+            path: 요청 경로 (쿼리 제외)
+            params: 쿼리 파라미터 (이름 → 값)
+
+        Returns:
+            (HTTP 상태 코드, 응답 데이터)
+        """
+        try:
+            route = self._route(path, params)
+            if route is None:
+                return 404, {'error': '지원하지 않는 경로입니다.'}
+
+            kind, arg = route
+            if kind == 'article':
+                news = self.store.get(int(arg))
+                if news is None:
+                    return 404, {'error': '기사를 찾을 수 없습니다.'}
+                return 200, self._public(news)
+            if kind == 'search':
+                results = self.store.search(params['q'].strip(), limit=self._page_size(params),
+                                            category=params.get('category'), source=params.get('source'))
+                return 200, {'items': [self._public(news) for news in results], 'next_cursor': None}
+            return 200, self._page(params, category=arg if kind == 'category' else None,
+                                   source=arg if kind == 'source' else None)
+        except BadRequest as e:
+            return 400, {'error': str(e)}
+
+    def respond(self, target: str, accept_gzip: bool, if_none_match: Optional[str] = None) -> Dict:
+        """
+        요청에 대한 응답(ETag, 본문)을 캐시에서 찾거나 새로 만듭니다.
+
+        ETag는 요청과 저장소 버전만으로 정해지므로, 올바른 경로에 대해 클라이언트의 ETag가 같으면
+        저장소를 조회하지 않고 304로 답합니다. gzip 본문에는 ``-gzip``을 붙인 별도 ETag를 씁니다.
+        ``*``는 응답이 200일 때만 304로 답하므로 본문을 만든 뒤 판단합니다.
+
+        Args:
+            target: 요청 경로와 쿼리 문자열
+            accept_gzip: 클라이언트가 gzip을 받는지 여부
+            if_none_match: 요청의 If-None-Match 헤더 값
+
+        Returns:
+            {'status', 'etag', 'body', 'gzip_body'(없으면 None)}
+        """
+        version = self.store.last_id()
+        etag = '"' + hashlib.sha1(f"{version}:{target}".encode('utf-8')).hexdigest()[:20] + '"'
+        split = urlsplit(target)
+        params = {name: values[-1] for name, values in parse_qs(split.query).items()}
+
+        client_etags = parse_if_none_match(if_none_match)
+        if client_etags and client_etags != ['*']:
+            try:
+                routable = self._route(split.path, params) is not None
+            except BadRequest:
+                routable = False
+            if routable:
+                for candidate in (etag, gzip_etag(etag)):
+                    if candidate in client_etags:
+                        return {'status': 304, 'etag': candidate, 'body': b'', 'gzip_body': None}
+
+        key = (target, version)
+        entry = self.cache.get(key)
+
+        if entry is None:
+            status, data = self.handle(split.path, params)
+            body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+            entry = {'status': status, 'etag': etag, 'body': body, 'gzip_body': None}
+            if status == 200:
+                self.cache.put(key, entry)
+
+        if accept_gzip and entry['gzip_body'] is None and len(entry['body']) >= GZIP_MIN_SIZE:
+            entry['gzip_body'] = gzip.compress(entry['body'], compresslevel=6)
+
+        if client_etags == ['*'] and entry['status'] == 200:
+            sent_etag = gzip_etag(etag) if accept_gzip and entry['gzip_body'] is not None else etag
+            return {'status': 304, 'etag': sent_etag, 'body': b'', 'gzip_body': None}
+        return entry
+
+
+def make_handler(api: NewsAPI):
+    """NewsAPI를 사용하는 요청 핸들러 클래스를 만듭니다."""
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = 'NewsAPI/1.0'
+
+        def do_GET(self):
+            accept_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+            try:
+                entry = api.respond(self.path, accept_gzip, self.headers.get('If-None-Match'))
+            except Exception as e:
+                self.send_error(500, explain=str(e))
+                return
+
+            if entry['status'] == 304:
+                self.send_response(304)
+                self.send_header('ETag', entry['etag'])
+                self.send_header('Vary', 'Accept-Encoding')
+                self.end_headers()
+                return
+
+            body = entry['body']
+            self.send_response(entry['status'])
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Vary', 'Accept-Encoding')
+            compressed = accept_gzip and entry['gzip_body'] is not None
+            if entry['status'] == 200:
+                self.send_header('ETag', gzip_etag(entry['etag']) if compressed else entry['etag'])
+                self.send_header('Cache-Control', 'no-cache')
+            if compressed:
+                body = entry['gzip_body']
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def create_server(store: NewsStore, host: str = '127.0.0.1', port: int = 8080) -> ThreadingHTTPServer:
+    """
+    API 서버를 만듭니다 (serve_forever()로 실행).
+
+    Args:
+        store: 뉴스 저장소
+        host: 바인딩 주소
+        port: 포트 (0이면 임의의 빈 포트)
+    """
+    return ThreadingHTTPServer((host, port), make_handler(NewsAPI(store)))
+
+
+def main(argv: Optional[List[str]] = None):
+    """메인 실행 함수"""
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    config = load_config() or {}
+    api_config = config.get('api', {})
+
+    arg_parser = argparse.ArgumentParser(description='뉴스 조회 API 서버')
+    arg_parser.add_argument('--host', default=api_config.get('host', '127.0.0.1'), help='바인딩 주소')
+    arg_parser.add_argument('--port', type=int, default=api_config.get('port', 8080), help='포트')
+    args = arg_parser.parse_args(argv)
+
+    store = NewsStore(db_file_from_config(config))
+    server = create_server(store, args.host, args.port)
+    print(f"🌐 뉴스 API 서버 실행 중: http://{args.host}:{args.port}/api/news")
+    print("   종료하려면 Ctrl+C를 누르세요.\n")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 서버를 종료합니다.")
+    finally:
+        server.server_close()
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
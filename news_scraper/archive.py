@@ -0,0 +1,743 @@
+#!/usr/bin/env python3
+"""
+뉴스 열 저장소(아카이브) 모듈
+월간 보고서처럼 몇 년 치 기사를 훑는 분석을 위해, 수집된 기사를 열(column) 단위로 압축해 보관합니다.
+JSON 스냅숏을 딕셔너리로 모두 읽어 들이지 않고, 필요한 열만 메모리 매핑(mmap)으로 바로 집계합니다.
+
+    archive/current.json              현재 버전 이름 (원자적으로 교체)
+    archive/<버전>/meta.json          행 수, 사전(source/category), 가져온 원본 기록
+    archive/<버전>/published_ts.i64   발행 시각 (UTC epoch 초, int64, 오름차순 정렬)
+    archive/<버전>/link_hash.i64      링크 해시 (중복 제거용, int64)
+    archive/<버전>/source.u16         소스 사전 번호 (uint16)
+    archive/<버전>/category.u16       카테고리 사전 번호 (uint16)
+    archive/<버전>/<title|link|summary>.blocks / .index
+                                      문자열 열 (block_rows개씩 묶어 zlib 압축, 블록 시작 위치 색인)
+
+행은 발행 시각 순으로 정렬되어 있어 기간 조회는 이진 탐색으로 범위를 찾습니다.
+NumPy가 설치되어 있으면 숫자 열을 NumPy 배열로 매핑해 집계하고, 없으면 표준 라이브러리로 집계합니다.
+Parquet 내보내기는 pyarrow가 설치된 경우에만 사용할 수 있습니다.
+
+압축(build)은 기존 버전과 새 기사를 발행 시각 순으로 병합한 새 버전을 만든 뒤 current.json을 교체하므로,
+읽는 쪽은 항상 완성된 버전만 봅니다.
+
+사용법:
+    python archive.py build [--json 스냅숏.json ...] [--no-db]
+    python archive.py stats [--days 30] [--send]
+    python archive.py export archive.parquet
+"""
+
+import argparse
+import array
+import bisect
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import shutil
+import sys
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from atomic_file import atomic_write_json
+
+DEFAULT_ARCHIVE_DIR = 'archive'
+FORMAT_VERSION = 1
+
+# 숫자 열 (이름 → array 타입 코드, 파일 확장자)
+NUMERIC_COLUMNS = {
+    'published_ts': ('q', '.i64'),
+    'link_hash': ('q', '.i64'),
+    'source': ('H', '.u16'),
+    'category': ('H', '.u16'),
+}
+# 사전으로 인코딩하는 열
+DICTIONARY_COLUMNS = ('source', 'category')
+# 블록 단위로 압축하는 문자열 열
+STRING_COLUMNS = ('title', 'link', 'summary')
+
+# 사전 번호 열(uint16)에 담을 수 있는 최대 값 종류 수
+MAX_DICTIONARY_SIZE = 65535
+
+_numpy = None
+
+
+def _load_numpy():
+    """NumPy를 처음 필요할 때 불러옵니다 (설치되어 있지 않으면 None)."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+def link_hash(link: str) -> int:
+    """링크를 중복 제거용 64비트 정수로 바꿉니다."""
+    return int.from_bytes(hashlib.blake2b(link.encode('utf-8'), digest_size=8).digest(), 'little', signed=True)
+
+
+def archive_dir_from_config(config: Optional[Dict]) -> str:
+    """설정 파일의 archive.dir 값을 반환합니다."""
+    return (config or {}).get('archive', {}).get('dir', DEFAULT_ARCHIVE_DIR)
+
+
+def _current_version(directory: str) -> Optional[str]:
+    """현재 버전 이름 (아직 만들지 않았으면 None)"""
+    try:
+        with open(os.path.join(directory, 'current.json'), 'r', encoding='utf-8') as f:
+            return json.load(f).get('version')
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+class NewsArchive:
+    """메모리 매핑으로 읽는 뉴스 열 저장소 (읽기 전용)"""
+
+    def __init__(self, directory: str = DEFAULT_ARCHIVE_DIR):
+        """
+        Args:
+            directory: 아카이브 디렉터리
+
+        Raises:
+            FileNotFoundError: 아카이브가 아직 없는 경우
+            ValueError: 형식이 맞지 않는 경우
+        """
+        version = _current_version(directory)
+        if version is None:
+            raise FileNotFoundError(f"아카이브가 없습니다: {directory} (python archive.py build로 만드세요)")
+
+        self.directory = directory
+        self.version = version
+        self.path = os.path.join(directory, version)
+        with open(os.path.join(self.path, 'meta.json'), 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get('format') != FORMAT_VERSION or self.meta.get('byteorder') != sys.byteorder:
+            raise ValueError(f"아카이브 형식이 맞지 않습니다: {self.path}")
+
+        self.rows = self.meta['rows']
+        self.block_rows = self.meta['block_rows']
+        self.dictionaries: Dict[str, List[str]] = self.meta['dictionaries']
+
+        self._files = []
+        self._maps = []
+        self._columns = {}
+        np = _load_numpy()
+        for name, (typecode, suffix) in NUMERIC_COLUMNS.items():
+            buffer = self._map(name + suffix)
+            if np is not None:
+                self._columns[name] = np.frombuffer(buffer, dtype=np.dtype(typecode))
+            else:
+                self._columns[name] = memoryview(buffer).cast(typecode)
+
+        self._block_index = {}
+        for name in STRING_COLUMNS:
+            offsets = array.array('q')
+            with open(os.path.join(self.path, name + '.index'), 'rb') as f:
+                offsets.frombytes(f.read())
+            self._block_index[name] = offsets
+        self._block_cache: Dict[str, Tuple[int, List[str]]] = {}
+
+    def _map(self, filename: str):
+        """열 파일을 읽기 전용으로 매핑합니다 (빈 파일은 빈 버퍼)."""
+        path = os.path.join(self.path, filename)
+        if os.path.getsize(path) == 0:
+            return b''
+        f = open(path, 'rb')
+        self._files.append(f)
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return mapped
+
+    def close(self):
+        """매핑을 닫습니다."""
+        self._columns = {}
+        self._block_cache = {}
+        for mapped in self._maps:
+            try:
+                mapped.close()
+            except BufferError:
+                # 호출한 쪽이 아직 열 배열을 들고 있으면 참조가 사라질 때 함께 정리됩니다.
+                pass
+        for f in self._files:
+            f.close()
+        self._maps = []
+        self._files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def column(self, name: str):
+        """
+        숫자 열을 반환합니다 (복사 없이 파일에 매핑된 배열).
+
+        Args:
+            name: published_ts, link_hash, source, category
+
+        Returns:
+            NumPy가 있으면 numpy.ndarray, 없으면 memoryview
+        """
+        return self._columns[name]
+
+    def row_range(self, start: Optional[float] = None, end: Optional[float] = None) -> Tuple[int, int]:
+        """
+        발행 시각이 [start, end)인 행의 범위를 찾습니다.
+
+        Args:
+            start: 시작 시각 (epoch 초, None이면 처음부터)
+            end: 끝 시각 (epoch 초, None이면 끝까지)
+
+        Returns:
+            (시작 행, 끝 행)
+        """
+        # 정수 열과 같은 타입으로 맞춰야 NumPy가 열 전체를 실수로 변환하지 않습니다.
+        start = math.ceil(start) if start is not None else None
+        end = math.ceil(end) if end is not None else None
+        published = self._columns['published_ts']
+        np = _load_numpy()
+        if np is not None:
+            lo = int(np.searchsorted(published, start, 'left')) if start is not None else 0
+            hi = int(np.searchsorted(published, end, 'left')) if end is not None else self.rows
+        else:
+            lo = bisect.bisect_left(published, start) if start is not None else 0
+            hi = bisect.bisect_left(published, end) if end is not None else self.rows
+        return lo, max(lo, hi)
+
+    def value_counts(self, name: str, start: Optional[float] = None,
+                     end: Optional[float] = None) -> Dict[str, int]:
+        """
+        사전 인코딩 열의 값별 행 수를 셉니다 (많은 순).
+
+        Args:
+            name: source 또는 category
+            start: 시작 시각 (epoch 초)
+            end: 끝 시각 (epoch 초)
+
+        Returns:
+            값 → 행 수
+        """
+        lo, hi = self.row_range(start, end)
+        codes = self._columns[name][lo:hi]
+        dictionary = self.dictionaries[name]
+        np = _load_numpy()
+        if np is not None:
+            counts = np.bincount(codes, minlength=len(dictionary)).tolist()
+            pairs = [(dictionary[code], count) for code, count in enumerate(counts) if count]
+        else:
+            pairs = [(dictionary[code], count) for code, count in Counter(codes).items()]
+        return dict(sorted(pairs, key=lambda pair: pair[1], reverse=True))
+
+    def daily_counts(self, start: Optional[float] = None, end: Optional[float] = None) -> Dict[str, int]:
+        """
+        로컬 날짜별 행 수를 셉니다.
+
+        Args:
+            start: 시작 시각 (epoch 초)
+            end: 끝 시각 (epoch 초)
+
+        Returns:
+            'YYYY-MM-DD' → 행 수 (날짜순)
+        """
+        lo, hi = self.row_range(start, end)
+        offset = datetime.now().astimezone().utcoffset().total_seconds()
+        published = self._columns['published_ts'][lo:hi]
+        np = _load_numpy()
+        if np is not None:
+            days, counts = np.unique((published + int(offset)) // 86400, return_counts=True)
+            pairs = zip(days.tolist(), counts.tolist())
+        else:
+            pairs = Counter((ts + int(offset)) // 86400 for ts in published).items()
+        epoch = datetime(1970, 1, 1)
+        return {(epoch + timedelta(days=day)).strftime('%Y-%m-%d'): count for day, count in sorted(pairs)}
+
+    def summary_stats(self, start: Optional[float] = None, end: Optional[float] = None) -> Dict:
+        """
+        기간 안의 총 기사 수와 소스별/카테고리별 기사 수를 계산합니다 (텔레그램 통계 메시지와 같은 내용).
+
+        Args:
+            start: 시작 시각 (epoch 초)
+            end: 끝 시각 (epoch 초)
+
+        Returns:
+            {'total', 'sources', 'categories', 'first_ts', 'last_ts'}
+        """
+        lo, hi = self.row_range(start, end)
+        published = self._columns['published_ts']
+        return {
+            'total': hi - lo,
+            'sources': self.value_counts('source', start, end),
+            'categories': self.value_counts('category', start, end),
+            'first_ts': int(published[lo]) if hi > lo else None,
+            'last_ts': int(published[hi - 1]) if hi > lo else None,
+        }
+
+    def _block(self, name: str, block: int) -> List[str]:
+        """문자열 열의 블록 하나를 풀어 반환합니다 (직전 블록은 캐시)."""
+        cached = self._block_cache.get(name)
+        if cached is not None and cached[0] == block:
+            return cached[1]
+
+        offsets = self._block_index[name]
+        with open(os.path.join(self.path, name + '.blocks'), 'rb') as f:
+            f.seek(offsets[block])
+            data = f.read(offsets[block + 1] - offsets[block])
+        values = json.loads(zlib.decompress(data))
+        self._block_cache[name] = (block, values)
+        return values
+
+    def iter_rows(self, start: Optional[float] = None, end: Optional[float] = None) -> Iterator[Dict]:
+        """
+        기간 안의 기사를 발행 시각 순으로 하나씩 돌려줍니다 (collected_news.json과 같은 항목 형식).
+
+        Args:
+            start: 시작 시각 (epoch 초)
+            end: 끝 시각 (epoch 초)
+        """
+        lo, hi = self.row_range(start, end)
+        columns = self._columns
+        sources = self.dictionaries['source']
+        categories = self.dictionaries['category']
+        for index in range(lo, hi):
+            block, position = divmod(index, self.block_rows)
+            published_ts = int(columns['published_ts'][index])
+            yield {
+                'source': sources[columns['source'][index]],
+                'title': self._block('title', block)[position],
+                'link': self._block('link', block)[position],
+                'summary': self._block('summary', block)[position],
+                'published': datetime.fromtimestamp(published_ts).astimezone().isoformat(),
+                'published_ts': published_ts,
+                'category': categories[columns['category'][index]],
+            }
+
+    def _iter_raw(self) -> Iterator[Tuple]:
+        """병합용: 저장된 행을 (발행 시각, 링크 해시, 소스, 카테고리, 제목, 링크, 요약) 값으로 돌려줍니다."""
+        columns = self._columns
+        sources = self.dictionaries['source']
+        categories = self.dictionaries['category']
+        for index in range(self.rows):
+            block, position = divmod(index, self.block_rows)
+            yield (
+                int(columns['published_ts'][index]),
+                int(columns['link_hash'][index]),
+                sources[columns['source'][index]],
+                categories[columns['category'][index]],
+                self._block('title', block)[position],
+                self._block('link', block)[position],
+                self._block('summary', block)[position],
+            )
+
+    def existing_hashes(self, hashes: Iterable[int]) -> set:
+        """주어진 링크 해시 중 이미 저장된 것만 골라 반환합니다."""
+        wanted = set(hashes)
+        if not wanted or not self.rows:
+            return set()
+        stored = self._columns['link_hash']
+        np = _load_numpy()
+        if np is not None:
+            candidates = np.fromiter(wanted, dtype=np.int64, count=len(wanted))
+            return set(candidates[np.isin(candidates, stored)].tolist())
+        return wanted.intersection(stored)
+
+
+class _ArchiveWriter:
+    """새 버전 디렉터리에 열 파일을 순서대로 써 나가는 도구"""
+
+    def __init__(self, path: str, block_rows: int, dictionaries: Dict[str, List[str]]):
+        self.path = path
+        self.block_rows = block_rows
+        self.dictionaries = {name: list(values) for name, values in dictionaries.items()}
+        self._codes = {name: {value: code for code, value in enumerate(values)}
+                       for name, values in self.dictionaries.items()}
+        self.rows = 0
+        os.makedirs(path)
+        self._numeric_files = {
+            name: open(os.path.join(path, name + suffix), 'wb') for name, (_, suffix) in NUMERIC_COLUMNS.items()
+        }
+        self._string_files = {name: open(os.path.join(path, name + '.blocks'), 'wb') for name in STRING_COLUMNS}
+        self._offsets = {name: array.array('q', [0]) for name in STRING_COLUMNS}
+        self._reset_block()
+
+    def _reset_block(self):
+        self._numeric = {name: array.array(typecode) for name, (typecode, _) in NUMERIC_COLUMNS.items()}
+        self._strings = {name: [] for name in STRING_COLUMNS}
+
+    def _code(self, name: str, value: str) -> int:
+        code = self._codes[name].get(value)
+        if code is None:
+            if len(self.dictionaries[name]) >= MAX_DICTIONARY_SIZE:
+                raise ValueError(f"{name} 값 종류가 {MAX_DICTIONARY_SIZE}개를 넘었습니다.")
+            code = len(self.dictionaries[name])
+            self.dictionaries[name].append(value)
+            self._codes[name][value] = code
+        return code
+
+    def append(self, row: Tuple):
+        """(발행 시각, 링크 해시, 소스, 카테고리, 제목, 링크, 요약) 한 행을 추가합니다."""
+        published_ts, hashed, source, category, title, link, summary = row
+        self._numeric['published_ts'].append(published_ts)
+        self._numeric['link_hash'].append(hashed)
+        self._numeric['source'].append(self._code('source', source))
+        self._numeric['category'].append(self._code('category', category))
+        self._strings['title'].append(title)
+        self._strings['link'].append(link)
+        self._strings['summary'].append(summary)
+        self.rows += 1
+        if len(self._strings['title']) >= self.block_rows:
+            self._flush_block()
+
+    def _flush_block(self):
+        if not self._strings['title']:
+            return
+        for name, values in self._numeric.items():
+            values.tofile(self._numeric_files[name])
+        for name, values in self._strings.items():
+            data = zlib.compress(json.dumps(values, ensure_ascii=False).encode('utf-8'), 6)
+            self._string_files[name].write(data)
+            self._offsets[name].append(self._offsets[name][-1] + len(data))
+        self._reset_block()
+
+    def finish(self, meta: Dict):
+        """남은 블록과 색인, meta.json을 쓰고 파일을 닫습니다."""
+        self._flush_block()
+        for f in list(self._numeric_files.values()) + list(self._string_files.values()):
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+        for name, offsets in self._offsets.items():
+            with open(os.path.join(self.path, name + '.index'), 'wb') as f:
+                offsets.tofile(f)
+        atomic_write_json(os.path.join(self.path, 'meta.json'), {
+            **meta,
+            'format': FORMAT_VERSION,
+            'byteorder': sys.byteorder,
+            'rows': self.rows,
+            'block_rows': self.block_rows,
+            'dictionaries': self.dictionaries,
+        })
+
+    def abort(self):
+        for f in list(self._numeric_files.values()) + list(self._string_files.values()):
+            f.close()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def _news_row(news: Dict) -> Optional[Tuple]:
+    """뉴스 항목을 병합용 행으로 바꿉니다 (링크가 없으면 None)."""
+    from scraper import published_epoch
+
+    link = news.get('link')
+    if not link:
+        return None
+    published_ts = news.get('published_ts')
+    if published_ts is None:
+        published_ts = published_epoch(news)
+    return (
+        int(published_ts),
+        link_hash(news.get('canonical_link') or link),
+        news.get('source') or '알 수 없음',
+        news.get('category') or 'unknown',
+        news.get('title', ''),
+        link,
+        news.get('summary', '') or '',
+    )
+
+
+def compact(directory: str, news_rows: Iterable[Tuple], imported: Optional[Dict] = None,
+            block_rows: int = 4096) -> Dict:
+    """
+    기존 버전과 새 행을 발행 시각 순으로 병합한 새 버전을 만들고 현재 버전으로 교체합니다.
+
+    이미 저장된 링크(해시 기준)와 새 행끼리 중복된 링크는 건너뜁니다.
+
+    Args:
+        directory: 아카이브 디렉터리
+        news_rows: _news_row 형식의 새 행들
+        imported: meta.json에 기록할 가져온 원본 정보 (기존 기록에 덮어씀)
+        block_rows: 문자열 열을 압축하는 블록 크기 (기존 버전이 있으면 그 값을 유지)
+
+    Returns:
+        {'version', 'rows', 'added'}
+    """
+    os.makedirs(directory, exist_ok=True)
+    old = NewsArchive(directory) if _current_version(directory) else None
+
+    fresh = {}
+    for row in news_rows:
+        fresh.setdefault(row[1], row)
+    if old is not None:
+        for hashed in old.existing_hashes(fresh):
+            del fresh[hashed]
+    added = sorted(fresh.values(), key=lambda row: row[0])
+
+    version = f"v{time.time_ns()}"
+    writer = _ArchiveWriter(
+        os.path.join(directory, version),
+        old.block_rows if old is not None else block_rows,
+        old.dictionaries if old is not None else {name: [] for name in DICTIONARY_COLUMNS}
+    )
+    try:
+        existing = old._iter_raw() if old is not None else iter(())
+        for row in heapq.merge(existing, added, key=lambda row: row[0]):
+            writer.append(row)
+        writer.finish({
+            'built_at': datetime.now().isoformat(),
+            'imported': {**(old.meta.get('imported', {}) if old is not None else {}), **(imported or {})},
+        })
+    except BaseException:
+        writer.abort()
+        raise
+    finally:
+        if old is not None:
+            old.close()
+
+    atomic_write_json(os.path.join(directory, 'current.json'), {'version': version})
+
+    # 지난 버전은 지웁니다 (열어 둔 매핑은 닫힐 때까지 유지됨).
+    for name in os.listdir(directory):
+        if name != version and os.path.isdir(os.path.join(directory, name)):
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+
+    return {'version': version, 'rows': writer.rows, 'added': len(added)}
+
+
+def _iter_db_rows(db_file: str, after_id: int) -> Iterator[Tuple[int, Tuple]]:
+    """누적 저장소에서 after_id 이후 기사를 (id, 행)으로 읽어옵니다."""
+    import sqlite3
+
+    conn = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
+    try:
+        last_id = after_id
+        while True:
+            rows = conn.execute(
+                "SELECT id, link, canonical_link, source, category, title, summary, published_ts "
+                "FROM articles WHERE id > ? ORDER BY id LIMIT 10000", (last_id,)
+            ).fetchall()
+            if not rows:
+                return
+            for article_id, link, canonical_link, source, category, title, summary, published_ts in rows:
+                yield article_id, (int(published_ts), link_hash(canonical_link), source, category, title, link,
+                                   summary or '')
+            last_id = rows[-1][0]
+    finally:
+        conn.close()
+
+
+def build_archive(directory: str = DEFAULT_ARCHIVE_DIR, db_file: Optional[str] = None,
+                  json_files: Iterable[str] = (), block_rows: int = 4096, batch_rows: int = 500000) -> Dict:
+    """
+    누적 저장소와 collected_news.json 스냅숏의 새 기사를 아카이브로 압축합니다.
+
+    저장소는 지난번에 가져온 기사 id 이후만, 스냅숏은 수정 시각이 바뀐 파일만 읽습니다.
+    새 기사가 batch_rows개를 넘으면 나눠서 병합하므로 메모리 사용량이 일정하게 유지됩니다.
+
+    Args:
+        directory: 아카이브 디렉터리
+        db_file: 누적 저장소 파일 (None이면 읽지 않음)
+        json_files: 가져올 collected_news.json 스냅숏 목록
+        block_rows: 문자열 열 압축 블록 크기
+        batch_rows: 한 번에 병합할 최대 새 기사 수
+
+    Returns:
+        {'rows', 'added', 'sources'}
+    """
+    imported = {}
+    if _current_version(directory):
+        with NewsArchive(directory) as current:
+            imported = dict(current.meta.get('imported', {}))
+
+    result = {'rows': 0, 'added': 0, 'sources': 0}
+    pending: List[Tuple] = []
+    pending_imported: Dict = {}
+
+    def flush():
+        if not pending and not pending_imported:
+            return
+        compacted = compact(directory, pending, pending_imported, block_rows)
+        result['rows'] = compacted['rows']
+        result['added'] += compacted['added']
+        pending.clear()
+        pending_imported.clear()
+
+    if db_file and os.path.exists(db_file):
+        key = f"db:{os.path.abspath(db_file)}"
+        for article_id, row in _iter_db_rows(db_file, imported.get(key, 0)):
+            pending.append(row)
+            pending_imported[key] = article_id
+            if len(pending) >= batch_rows:
+                flush()
+        result['sources'] += 1
+
+    for json_file in json_files:
+        key = f"json:{os.path.abspath(json_file)}"
+        mtime = os.path.getmtime(json_file)
+        if imported.get(key) == mtime:
+            continue
+        with open(json_file, 'r', encoding='utf-8') as f:
+            news_list = json.load(f).get('news', [])
+        pending.extend(row for row in map(_news_row, news_list) if row is not None)
+        pending_imported[key] = mtime
+        result['sources'] += 1
+        if len(pending) >= batch_rows:
+            flush()
+
+    flush()
+    if not result['rows'] and _current_version(directory):
+        with NewsArchive(directory) as current:
+            result['rows'] = len(current)
+    return result
+
+
+def export_parquet(archive: NewsArchive, path: str, compression: str = 'zstd'):
+    """
+    아카이브를 Parquet 파일로 내보냅니다 (pyarrow 필요).
+
+    source/category는 사전 인코딩 열, 발행 시각은 int64 기반 timestamp(초, UTC) 열로 씁니다.
+
+    Args:
+        archive: 열린 아카이브
+        path: 출력 파일 경로
+        compression: Parquet 압축 방식
+
+    Raises:
+        ImportError: pyarrow가 설치되어 있지 않은 경우
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    dictionaries = {name: pa.array(archive.dictionaries[name], type=pa.string()) for name in DICTIONARY_COLUMNS}
+    schema = pa.schema([
+        ('published', pa.timestamp('s', tz='UTC')),
+        ('source', pa.dictionary(pa.uint16(), pa.string())),
+        ('category', pa.dictionary(pa.uint16(), pa.string())),
+        ('title', pa.string()),
+        ('link', pa.string()),
+        ('summary', pa.string()),
+    ])
+
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        for block in range(len(archive._block_index['title']) - 1):
+            lo = block * archive.block_rows
+            hi = min(lo + archive.block_rows, len(archive))
+            published = array.array('q', archive.column('published_ts')[lo:hi])
+            columns = [pa.array(published, type=pa.int64()).cast(pa.timestamp('s', tz='UTC'))]
+            for name in DICTIONARY_COLUMNS:
+                codes = pa.array(array.array('H', archive.column(name)[lo:hi]), type=pa.uint16())
+                columns.append(pa.DictionaryArray.from_arrays(codes, dictionaries[name]))
+            for name in STRING_COLUMNS:
+                columns.append(pa.array(archive._block(name, block), type=pa.string()))
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """아카이브 명령 실행 함수"""
+    parser = argparse.ArgumentParser(description='뉴스 열 저장소 (아카이브)')
+    parser.add_argument('--dir', help=f'아카이브 디렉터리 (기본값: config.json의 archive.dir 또는 {DEFAULT_ARCHIVE_DIR})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='누적 저장소/스냅숏의 새 기사를 아카이브로 압축')
+    build.add_argument('--json', nargs='*', default=[], help='가져올 collected_news.json 스냅숏들')
+    build.add_argument('--no-db', action='store_true', help='누적 저장소(news.db)는 읽지 않음')
+
+    stats = commands.add_parser('stats', help='기간별 기사 통계')
+    stats.add_argument('--days', type=float, help='최근 N일만 집계 (기본값: 전체)')
+    stats.add_argument('--daily', action='store_true', help='날짜별 기사 수도 출력')
+    stats.add_argument('--send', action='store_true', help='통계를 텔레그램으로 전송')
+
+    export = commands.add_parser('export', help='Parquet 파일로 내보내기 (pyarrow 필요)')
+    export.add_argument('output', help='출력 파일 경로 (.parquet)')
+
+    args = parser.parse_args(argv)
+
+    # 스냅숏 경로는 실행한 위치 기준으로 해석한 뒤 스크립트 디렉터리로 이동합니다.
+    json_files = [os.path.abspath(path) for path in getattr(args, 'json', [])]
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    from telegram_notifier import load_config
+    config = load_config() if os.path.exists('config.json') else None
+    archive_config = (config or {}).get('archive', {})
+    directory = args.dir or archive_dir_from_config(config)
+
+    if args.command == 'build':
+        from news_store import db_file_from_config
+
+        started = time.perf_counter()
+        result = build_archive(
+            directory,
+            db_file=None if args.no_db else db_file_from_config(config),
+            json_files=json_files + archive_config.get('snapshots', []),
+            block_rows=archive_config.get('block_rows', 4096),
+            batch_rows=archive_config.get('batch_rows', 500000)
+        )
+        print(f"🗄️  아카이브 압축 완료: 새 기사 {result['added']:,}개, 전체 {result['rows']:,}개 "
+              f"({time.perf_counter() - started:.1f}초)")
+        return 0
+
+    try:
+        archive = NewsArchive(directory)
+    except FileNotFoundError as e:
+        print(f"❌ {str(e)}")
+        return 1
+
+    with archive:
+        if args.command == 'export':
+            try:
+                export_parquet(archive, args.output)
+            except ImportError:
+                print("❌ Parquet 내보내기에는 pyarrow가 필요합니다: pip install pyarrow")
+                return 1
+            print(f"💾 {args.output}에 {len(archive):,}개 기사를 저장했습니다.")
+            return 0
+
+        start = time.time() - args.days * 86400 if args.days else None
+        started = time.perf_counter()
+        summary = archive.summary_stats(start)
+        elapsed = time.perf_counter() - started
+
+        period = '전체 기간'
+        if summary['total']:
+            first = datetime.fromtimestamp(summary['first_ts']).strftime('%Y년 %m월 %d일')
+            last = datetime.fromtimestamp(summary['last_ts']).strftime('%Y년 %m월 %d일')
+            period = f"{first} ~ {last}"
+
+        print(f"\n📊 {period}: 기사 {summary['total']:,}개 (집계 {elapsed * 1000:.1f}ms)\n")
+        print("📌 소스별:")
+        for source, count in summary['sources'].items():
+            print(f"   {source}: {count:,}")
+        print("\n🌍 카테고리별:")
+        for category, count in summary['categories'].items():
+            print(f"   {category}: {count:,}")
+        if args.daily:
+            print("\n📅 날짜별:")
+            for day, count in archive.daily_counts(start).items():
+                print(f"   {day}: {count:,}")
+        print()
+
+        if args.send:
+            from telegram_notifier import notifier_from_config
+
+            if not config or not config.get('telegram', {}).get('enabled', False):
+                print("⚠️  텔레그램 알림이 설정되지 않았습니다.")
+                return 1
+            heading = f"최근 {args.days:g}일 AI 뉴스 통계" if args.days else 'AI 뉴스 누적 통계'
+            notifier = notifier_from_config(config)
+            message = notifier.format_summary_stats(
+                summary['total'], summary['sources'], summary['categories'], heading=heading, period=period)
+            return 0 if notifier.send_message(message) else 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
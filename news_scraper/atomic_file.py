@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+원자적 파일 쓰기 모듈
+같은 디렉터리의 임시 파일에 끝까지 쓰고 디스크에 반영(fsync)한 뒤 이름을 바꾸므로,
+쓰는 도중 프로세스가 죽어도 읽는 쪽에는 이전 파일 또는 새 파일만 보이고 쓰다 만 파일은 남지 않습니다.
+
+체크포인트, 상태 파일, 피드, 메트릭 파일 등 파일로 결과를 남기는 모든 모듈이 이 함수를 사용합니다.
+"""
+
+import json
+import os
+import tempfile
+from typing import Optional, Union
+
+
+def atomic_write(path: str, data: Union[str, bytes], mode: int = 0o644):
+    """
+    파일을 원자적으로 씁니다 (임시 파일에 쓴 뒤 교체).
+
+    Args:
+        path: 파일 경로
+        data: 저장할 내용 (문자열이면 UTF-8로 저장)
+        mode: 파일 권한 (임시 파일은 0600으로 만들어지므로 교체 전에 바꿉니다)
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def atomic_write_json(path: str, data, indent: Optional[int] = None):
+    """
+    JSON 파일을 원자적으로 씁니다.
+
+    Args:
+        path: 파일 경로
+        data: 저장할 데이터
+        indent: JSON 들여쓰기
+    """
+    atomic_write(path, json.dumps(data, ensure_ascii=False, indent=indent))
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+뉴스 수집기 벤치마크
+녹화된 RSS/Atom/HTML 픽스처와 대용량 합성 피드를 로컬 HTTP 서버로 제공하고,
+수집 과정을 단계별로 측정합니다.
+
+사용법:
+    python benchmark.py
+    python benchmark.py --items 50000 --repeat 5
+    python benchmark.py --compare bench_results/이전결과.json
+    python benchmark.py --imports-only     # 모듈 불러오기 시간 예산만 검사 (초과 시 종료 코드 1)
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_fixtures')
+RESULT_DIR = 'bench_results'
+
+# 픽스처 안의 {{rfc822:-90}}, {{iso:-90}}, {{date:-90}} 토큰은 "현재 시각 - N분"으로 바뀝니다.
+# 녹화 시점과 상관없이 항목들이 최근 24시간 필터를 통과하도록 하기 위함입니다.
+_DATE_TOKEN = re.compile(r'\{\{(rfc822|iso|date):(-?\d+)\}\}')
+
+FIXTURE_SOURCES = [
+    ('aitimes_rss.xml', {'name': 'AI타임스', 'type': 'rss', 'category': 'korean'}),
+    ('openai_atom.xml', {'name': 'OpenAI Blog', 'type': 'rss', 'category': 'english'}),
+    ('etnews_section.html', {
+        'name': '전자신문 AI섹션',
+        'type': 'scraping',
+        'category': 'korean',
+        'selectors': {
+            'article': 'section.article_list ul li',
+            'title': 'a strong',
+            'link': 'a',
+            'date': 'span.date'
+        }
+    }),
+]
+
+
+# 모듈별 불러오기 시간 예산 (밀리초, -X importtime의 누적 시간 기준)
+# 매분 도는 cron 실행은 수명의 상당 부분을 import에 쓰므로, 예산을 넘으면 --imports-only 검사가 실패합니다.
+IMPORT_BUDGETS_MS = {
+    'scraper': 50,
+    'cluster': 70,
+    'api_server': 90,
+    # 창을 띄우기 전까지의 시간 (tkinter 포함, 저장소/피드/텔레그램 모듈은 버튼을 누를 때 불러옴)
+    'gui_app': 60,
+}
+
+# 실제로 요청/파싱할 때만 불러와야 하는 무거운 모듈
+LAZY_MODULES = ('requests', 'bs4', 'lxml', 'dateutil', 'numpy')
+
+_IMPORT_LINE = re.compile(r'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)')
+
+
+def _render_date(kind: str, minutes: int) -> str:
+    """날짜 토큰을 실제 날짜 문자열로 변환합니다."""
+    moment = datetime.now(timezone.utc) + timedelta(minutes=minutes)
+    if kind == 'rfc822':
+        return format_datetime(moment)
+    if kind == 'iso':
+        return moment.isoformat()
+    return moment.astimezone().strftime('%Y-%m-%d %H:%M')
+
+
+def load_fixture(filename: str) -> bytes:
+    """픽스처 파일을 읽고 날짜 토큰을 채웁니다."""
+    with open(os.path.join(FIXTURE_DIR, filename), 'r', encoding='utf-8') as f:
+        text = f.read()
+    text = _DATE_TOKEN.sub(lambda m: _render_date(m.group(1), int(m.group(2))), text)
+    return text.encode('utf-8')
+
+
+def synthetic_rss(items: int) -> bytes:
+    """대용량 합성 RSS 피드를 생성합니다."""
+    now = datetime.now(timezone.utc)
+    parts = ['<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>합성 피드</title>']
+    for i in range(items):
+        pub_date = format_datetime(now - timedelta(seconds=i * 3))
+        parts.append(
+            f'<item><title>합성 AI 뉴스 {i}번 - 대규모 언어모델 동향</title>'
+            f'<link>https://bench.local/rss/{i}</link>'
+            f'<description><![CDATA[<p>합성 기사 {i}의 요약입니다. '
+            f'<b>생성형 AI</b>와 반도체 시장 소식을 담고 있습니다.</p>]]></description>'
+            f'<pubDate>{pub_date}</pubDate></item>'
+        )
+    parts.append('</channel></rss>')
+    return ''.join(parts).encode('utf-8')
+
+
+def synthetic_atom(items: int) -> bytes:
+    """대용량 합성 Atom 피드를 생성합니다."""
+    now = datetime.now(timezone.utc)
+    parts = ['<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Synthetic</title>']
+    for i in range(items):
+        stamp = (now - timedelta(seconds=i * 3)).isoformat()
+        parts.append(
+            f'<entry><title>Synthetic AI story {i}</title>'
+            f'<link href="https://bench.local/atom/{i}" rel="alternate"/>'
+            f'<id>https://bench.local/atom/{i}</id><published>{stamp}</published>'
+            f'<summary type="html">&lt;p&gt;Synthetic summary {i} about model releases.&lt;/p&gt;</summary></entry>'
+        )
+    parts.append('</feed>')
+    return ''.join(parts).encode('utf-8')
+
+
+class FixtureServer:
+    """픽스처를 제공하는 로컬 HTTP 서버 (실제 뉴스 사이트 대역)"""
+
+    def __init__(self, documents: Dict[str, bytes]):
+        """
+        Args:
+            documents: 경로 → 응답 본문
+        """
+        documents_ref = documents
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = documents_ref.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                content_type = 'text/html' if self.path.endswith('.html') else 'application/xml'
+                self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def measure(func: Callable[[], object], repeat: int) -> Tuple[float, int, object]:
+    """
+    함수를 반복 실행해 실행 시간 중앙값과 최대 메모리 사용량을 측정합니다.
+
+    tracemalloc은 실행 속도에 영향을 주므로 메모리는 별도 1회 실행에서 잽니다.
+
+    Returns:
+        (중앙값 초, 최대 메모리 바이트, 마지막 실행 결과)
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return statistics.median(timings), peak, result
+
+
+def measure_import(module: str, runs: int = 5) -> Dict:
+    """
+    새 인터프리터에서 모듈을 불러오는 시간을 -X importtime으로 측정합니다.
+
+    프로세스마다 디스크 캐시 상태가 달라 흔들리므로 여러 번 실행해 가장 짧은 값을 씁니다.
+
+    Args:
+        module: 모듈 이름
+        runs: 실행 횟수
+
+    Returns:
+        {'ms': 누적 시간(밀리초), 'lazy_loaded': 함께 불러온 LAZY_MODULES 목록}
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    best = None
+    lazy_loaded = set()
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True, text=True, cwd=script_dir
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"{module} 모듈을 불러오지 못했습니다:\n{completed.stderr[-500:]}")
+
+        for line in completed.stderr.splitlines():
+            match = _IMPORT_LINE.match(line)
+            if not match:
+                continue
+            name = match.group(4)
+            if name == module and not match.group(3).strip(' '):
+                cumulative = int(match.group(2)) / 1000
+                best = cumulative if best is None else min(best, cumulative)
+            if name.split('.')[0] in LAZY_MODULES:
+                lazy_loaded.add(name.split('.')[0])
+
+    return {'ms': round(best or 0.0, 2), 'lazy_loaded': sorted(lazy_loaded)}
+
+
+def measure_imports(runs: int = 5) -> Dict[str, Dict]:
+    """IMPORT_BUDGETS_MS의 모든 모듈을 측정하고 예산을 함께 기록합니다."""
+    results = {}
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        result = measure_import(module, runs)
+        result['budget_ms'] = budget
+        result['ok'] = result['ms'] <= budget and not result['lazy_loaded']
+        results[module] = result
+    return results
+
+
+def print_import_report(imports: Dict[str, Dict]):
+    """모듈 불러오기 시간과 예산을 표로 출력합니다."""
+    print(f"{'모듈':<16}{'시간(ms)':>12}{'예산(ms)':>12}  결과")
+    for module, result in imports.items():
+        status = '✅' if result['ok'] else '❌'
+        if result['lazy_loaded']:
+            status += f" 미리 불러온 모듈: {', '.join(result['lazy_loaded'])}"
+        print(f"{module:<16}{result['ms']:>12.2f}{result['budget_ms']:>12}  {status}")
+
+
+def _git_commit() -> str:
+    """현재 git 커밋 해시를 반환합니다."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except Exception:
+        return 'unknown'
+
+
+def run_benchmark(items: int = 20000, repeat: int = 3) -> Dict:
+    """
+    전체 벤치마크를 실행합니다.
+
+    Args:
+        items: 합성 피드 항목 수
+        repeat: 단계별 반복 횟수
+
+    Returns:
+        단계별 측정 결과
+    """
+    from bs4 import BeautifulSoup
+    from dateutil import parser as date_parser
+    from scraper import NewsCollector, PARSERS, merge_news_streams
+    from telegram_notifier import TelegramNotifier
+
+    documents = {}
+    sources = []
+    for filename, source in FIXTURE_SOURCES:
+        documents['/' + filename] = load_fixture(filename)
+        sources.append((filename, dict(source)))
+    documents['/synthetic_rss.xml'] = synthetic_rss(items)
+    documents['/synthetic_atom.xml'] = synthetic_atom(items)
+    sources.append(('synthetic_rss.xml', {'name': '합성 RSS', 'type': 'rss', 'category': 'korean'}))
+    sources.append(('synthetic_atom.xml', {'name': 'Synthetic Atom', 'type': 'rss', 'category': 'english'}))
+
+    total_bytes = sum(len(body) for body in documents.values())
+    stages = {}
+
+    def record(name: str, seconds: float, peak: int, count: int, nbytes: int = 0):
+        stages[name] = {
+            'seconds': round(seconds, 6),
+            'items': count,
+            'items_per_sec': round(count / seconds, 1) if seconds > 0 else None,
+            'mb_per_sec': round(nbytes / seconds / 1e6, 2) if seconds > 0 and nbytes else None,
+            'peak_kb': round(peak / 1024, 1)
+        }
+
+    work_dir = tempfile.TemporaryDirectory()
+    with FixtureServer(documents) as server:
+        for filename, source in sources:
+            source['url'] = f"{server.base_url}/{filename}"
+
+        # 로컬 서버를 가리키는 sources.json으로 수집기를 만듭니다.
+        sources_file = os.path.join(work_dir.name, 'sources.json')
+        with open(sources_file, 'w', encoding='utf-8') as f:
+            json.dump({'sources': [source for _, source in sources]}, f, ensure_ascii=False)
+        collector = NewsCollector(sources_file=sources_file)
+
+        # 1. 네트워크 요청 (로컬 서버)
+        seconds, peak, bodies = measure(
+            lambda: [collector.fetch_source(source) for source in collector.sources], repeat)
+        record('fetch', seconds, peak, len(sources), total_bytes)
+
+    rss_bodies = [body for (_, source), body in zip(sources, bodies) if source['type'] == 'rss']
+    rss_bytes = sum(len(body) for body in rss_bodies)
+
+    # 2. XML 파싱 (항목 탐색까지)
+    def parse_feeds():
+        found = []
+        for body in rss_bodies:
+            soup = BeautifulSoup(body, 'xml')
+            found.append(soup.find_all('item') or soup.find_all('entry'))
+        return found
+
+    seconds, peak, parsed = measure(parse_feeds, repeat)
+    feed_items = [item for entries in parsed for item in entries]
+    record('parse', seconds, peak, len(feed_items), rss_bytes)
+
+    # 3. 날짜 파싱
+    date_texts = []
+    summary_texts = []
+    for item in feed_items:
+        tag = item.find('pubDate') or item.find('published') or item.find('updated')
+        if tag:
+            date_texts.append(tag.get_text(strip=True))
+        desc = item.find('description') or item.find('summary')
+        if desc:
+            summary_texts.append(desc.get_text())
+
+    seconds, peak, _ = measure(lambda: [date_parser.parse(text) for text in date_texts], repeat)
+    record('date_parse', seconds, peak, len(date_texts))
+
+    # 4. 요약 추출 (HTML 태그 제거)
+    seconds, peak, _ = measure(
+        lambda: [BeautifulSoup(text, 'html.parser').get_text(strip=True)[:200] for text in summary_texts],
+        repeat)
+    record('summary', seconds, peak, len(summary_texts))
+
+    # 5. 전체 파싱 (소스별 파서 = 2~4단계 합계)
+    seconds, peak, streams = measure(
+        lambda: [PARSERS[source['type']](body, source) for (_, source), body in zip(sources, bodies)],
+        repeat)
+    news_count = sum(len(stream) for stream in streams)
+    record('collect_parse', seconds, peak, news_count, total_bytes)
+
+    # 6. 정렬 (소스별 병합)
+    seconds, peak, merged = measure(lambda: merge_news_streams(streams), repeat)
+    record('sort', seconds, peak, len(merged))
+
+    # 7. JSON 저장
+    collector.collected_news = merged
+    output_file = os.path.join(work_dir.name, 'collected_news.json')
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        seconds, peak, _ = measure(lambda: collector.save_to_json(output_file), repeat)
+    record('save', seconds, peak, len(merged), os.path.getsize(output_file))
+    work_dir.cleanup()
+
+    # 8. 텔레그램 메시지 렌더링 (전송 없음)
+    notifier = TelegramNotifier('benchmark', '0')
+
+    def render():
+        parts = notifier._split_message(notifier.format_category_message(merged))
+        parts += notifier._split_message(notifier.format_news_message(merged, max_news=50))
+        return parts
+
+    seconds, peak, _ = measure(render, repeat)
+    record('telegram_render', seconds, peak, len(merged))
+
+    # 9. 브리핑 스냅숏에서 렌더링 (채팅을 여러 개 보낼 때 두 번째 채팅부터의 비용)
+    from briefing_snapshot import BriefingSnapshot
+    snapshot = BriefingSnapshot.build(merged)
+    seconds, peak, _ = measure(
+        lambda: notifier._split_message(notifier.format_category_message(merged, snapshot=snapshot)), repeat)
+    record('telegram_snapshot', seconds, peak, len(merged))
+
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'created_at': datetime.now().isoformat(),
+            'synthetic_items': items,
+            'repeat': repeat,
+            'fixture_bytes': total_bytes
+        },
+        'stages': stages,
+        'imports': measure_imports()
+    }
+
+
+def print_report(result: Dict, baseline: Optional[Dict] = None):
+    """측정 결과를 표로 출력합니다."""
+    meta = result['meta']
+    print("=" * 78)
+    print(f"📊 벤치마크 결과 (커밋 {meta['commit']}, Python {meta['python']}, 합성 {meta['synthetic_items']}개)")
+    if baseline:
+        print(f"   비교 대상: 커밋 {baseline['meta']['commit']}")
+    print("=" * 78)
+    print(f"{'단계':<16}{'시간(ms)':>12}{'항목/초':>14}{'MB/초':>10}{'최대메모리(KB)':>16}{'변화':>10}")
+
+    for name, stage in result['stages'].items():
+        change = ''
+        if baseline and name in baseline.get('stages', {}):
+            before = baseline['stages'][name]['seconds']
+            if before > 0:
+                change = f"{(stage['seconds'] - before) / before * 100:+.1f}%"
+        print(f"{name:<16}{stage['seconds'] * 1000:>12.2f}"
+              f"{stage['items_per_sec'] or 0:>14,.0f}"
+              f"{stage['mb_per_sec'] or 0:>10.2f}"
+              f"{stage['peak_kb']:>16,.1f}{change:>10}")
+    if result.get('imports'):
+        print("-" * 78)
+        print_import_report(result['imports'])
+    print("=" * 78)
+
+
+def main():
+    """벤치마크 실행 함수"""
+    parser = argparse.ArgumentParser(description='AI 뉴스 수집기 벤치마크')
+    parser.add_argument('--items', type=int, default=20000, help='합성 피드 항목 수 (기본값: 20000)')
+    parser.add_argument('--repeat', type=int, default=3, help='단계별 반복 횟수 (기본값: 3)')
+    parser.add_argument('--output', help=f'결과 JSON 경로 (기본값: {RESULT_DIR}/<커밋>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON 경로')
+    parser.add_argument('--imports-only', action='store_true',
+                        help='모듈 불러오기 시간 예산만 검사합니다 (초과 시 종료 코드 1)')
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(script_dir)
+
+    if args.imports_only:
+        print("\n⏱️  모듈 불러오기 시간 측정 중...\n")
+        imports = measure_imports()
+        print_import_report(imports)
+        print()
+        sys.exit(0 if all(result['ok'] for result in imports.values()) else 1)
+
+    print(f"\n⏱️  벤치마크 실행 중 (합성 {args.items}개, 반복 {args.repeat}회)...\n")
+    result = run_benchmark(items=args.items, repeat=args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print_report(result, baseline)
+
+    output_file = args.output or os.path.join(RESULT_DIR, f"{result['meta']['commit']}.json")
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"💾 {output_file}에 저장 완료!\n")
+
+
+if __name__ == '__main__':
+    main()
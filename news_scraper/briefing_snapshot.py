@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+브리핑 스냅숏 모듈
+수집이 끝날 때 알림용 뉴스 리스트를 한 번만 훑어 카테고리/소스별 개수와
+카테고리별 메시지 조각(미리 렌더링한 HTML)을 만들어 두고, collected_news.json 옆에 저장합니다.
+
+알림 전송(채팅이 여러 개여도), 수집 통계, GUI의 뉴스 보기 창은 이 스냅숏을 읽기만 하므로
+뉴스 리스트 전체를 다시 분류하지 않습니다. 스냅숏은 뉴스 리스트의 구성(링크, 제목, 소스, 카테고리)이
+바뀔 때만 다시 만들며, 그때도 미리보기 뉴스나 개수가 바뀐 카테고리의 조각만 다시 렌더링합니다.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from atomic_file import atomic_write_json
+from links import news_key
+from metrics import metrics
+from telegram_notifier import CATEGORY_PREVIEW, TelegramNotifier
+
+SNAPSHOT_VERSION = 1
+
+# 뉴스별 서명 조각 캐시 (news_key → (서명에 넣는 값, 해시))
+# 같은 뉴스가 다음 호출에도 들어오면 값만 비교하고 다시 해시하지 않습니다.
+_item_digests: Dict[str, Tuple[tuple, bytes]] = {}
+MAX_CACHED_DIGESTS = 100000
+
+
+def _preview_key(news: Dict) -> List[str]:
+    """카테고리 조각에 렌더링되는 값 (링크, 제목, 소스)"""
+    return [news.get('link') or '', news.get('title') or '', news.get('source') or '']
+
+
+def _item_digest(news: Dict) -> bytes:
+    """뉴스 하나의 서명 조각 (링크, 제목, 소스, 카테고리의 해시)"""
+    fields = (news.get('link') or '', news.get('title') or '', news.get('source') or '', news.get('category') or '')
+    key = news_key(news)
+    cached = _item_digests.get(key)
+    if cached is not None and cached[0] == fields:
+        return cached[1]
+
+    digest = hashlib.blake2b('\x1f'.join(fields).encode('utf-8'), digest_size=16).digest()
+    if len(_item_digests) >= MAX_CACHED_DIGESTS:
+        _item_digests.clear()
+    _item_digests[key] = (fields, digest)
+    return digest
+
+
+def news_signature(news_list: List[Dict]) -> str:
+    """
+    뉴스 리스트의 구성(순서 포함)으로 스냅숏이 유효한지 확인할 서명을 만듭니다.
+
+    링크가 같아도 제목이나 소스가 고쳐지면 메시지 조각이 달라지고,
+    카테고리가 바뀌면 개수가 달라지므로 모두 서명에 넣습니다.
+    뉴스별 해시는 캐시해 두므로, 바뀌지 않은 뉴스는 값 비교만 합니다.
+
+    Args:
+        news_list: 뉴스 리스트
+
+    Returns:
+        서명 문자열
+    """
+    digest = hashlib.sha256(b''.join([_item_digest(news) for news in news_list]))
+    return f"{len(news_list)}:{digest.hexdigest()[:32]}"
+
+
+class BriefingSnapshot:
+    """
+    뉴스 리스트 하나에 대한 분류 결과와 렌더링된 카테고리 조각
+
+    categories는 카테고리별 메시지의 출력 순서(리스트에 처음 나온 순서)이고,
+    fragments[카테고리]는 TelegramNotifier.format_category_section의 결과입니다.
+    previews[카테고리]는 조각에 들어간 뉴스의 [링크, 제목, 소스] 목록으로, 다시 만들 때 조각을 재사용할지 판단하는 데 씁니다.
+    """
+
+    def __init__(self, signature: str, total: int, categories: List[str], category_counts: Dict[str, int],
+                 source_counts: Dict[str, int], previews: Dict[str, List[List[str]]], fragments: Dict[str, str],
+                 created_at: Optional[str] = None):
+        self.signature = signature
+        self.total = total
+        self.categories = categories
+        self.category_counts = category_counts
+        self.source_counts = source_counts
+        self.previews = previews
+        self.fragments = fragments
+        self.created_at = created_at or datetime.now().isoformat()
+
+    @classmethod
+    def build(cls, news_list: List[Dict], previous: Optional['BriefingSnapshot'] = None,
+              signature: Optional[str] = None) -> 'BriefingSnapshot':
+        """
+        뉴스 리스트를 한 번 훑어 스냅숏을 만듭니다.
+
+        Args:
+            news_list: 뉴스 리스트 (최신순)
+            previous: 이전 스냅숏 (개수와 미리보기 뉴스가 같은 카테고리는 조각을 재사용)
+            signature: 이미 계산한 news_signature (None이면 계산)
+
+        Returns:
+            새 스냅숏
+        """
+        category_counts: Dict[str, int] = {}
+        source_counts: Dict[str, int] = {}
+        preview_items: Dict[str, List[Dict]] = {}
+
+        for news in news_list:
+            category = news.get('category', 'unknown')
+            count = category_counts.get(category, 0)
+            if count < CATEGORY_PREVIEW:
+                preview_items.setdefault(category, []).append(news)
+            category_counts[category] = count + 1
+
+            source = news.get('source', '알 수 없음')
+            source_counts[source] = source_counts.get(source, 0) + 1
+
+        previews: Dict[str, List[List[str]]] = {}
+        fragments: Dict[str, str] = {}
+        reused = 0
+        for category, count in category_counts.items():
+            items = preview_items[category]
+            previews[category] = [_preview_key(news) for news in items]
+            if (previous is not None and previous.category_counts.get(category) == count
+                    and previous.previews.get(category) == previews[category]):
+                fragments[category] = previous.fragments[category]
+                reused += 1
+            else:
+                fragments[category] = TelegramNotifier.format_category_section(category, count, items)
+
+        metrics.incr('briefing_fragments_total', len(fragments) - reused, result='rendered')
+        metrics.incr('briefing_fragments_total', reused, result='reused')
+
+        return cls(
+            signature=signature or news_signature(news_list),
+            total=len(news_list),
+            categories=list(category_counts),
+            category_counts=category_counts,
+            source_counts=source_counts,
+            previews=previews,
+            fragments=fragments
+        )
+
+    def to_dict(self) -> Dict:
+        """JSON으로 저장할 딕셔너리"""
+        return {
+            'version': SNAPSHOT_VERSION,
+            'signature': self.signature,
+            'created_at': self.created_at,
+            'total': self.total,
+            'categories': [
+                {
+                    'category': category,
+                    'count': self.category_counts[category],
+                    'preview': self.previews[category],
+                    'fragment': self.fragments[category],
+                }
+                for category in self.categories
+            ],
+            'sources': self.source_counts,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'BriefingSnapshot':
+        """to_dict로 저장한 딕셔너리에서 스냅숏을 복원합니다."""
+        categories = data['categories']
+        return cls(
+            signature=data['signature'],
+            total=data['total'],
+            categories=[entry['category'] for entry in categories],
+            category_counts={entry['category']: entry['count'] for entry in categories},
+            source_counts=data['sources'],
+            previews={entry['category']: entry['preview'] for entry in categories},
+            fragments={entry['category']: entry['fragment'] for entry in categories},
+            created_at=data.get('created_at')
+        )
+
+    def save(self, snapshot_file: str):
+        """스냅숏을 파일에 원자적으로 저장합니다."""
+        atomic_write_json(snapshot_file, self.to_dict())
+
+    @classmethod
+    def load(cls, snapshot_file: str) -> Optional['BriefingSnapshot']:
+        """
+        저장된 스냅숏을 읽습니다.
+
+        Returns:
+            스냅숏 (파일이 없거나 형식이 다르면 None)
+        """
+        try:
+            with open(snapshot_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != SNAPSHOT_VERSION:
+                return None
+            return cls.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+def snapshot_for(news_list: List[Dict], snapshot_file: Optional[str] = None) -> BriefingSnapshot:
+    """
+    뉴스 리스트의 스냅숏을 돌려줍니다.
+    저장된 스냅숏의 서명이 같으면 그대로 쓰고, 다르면 다시 만들어 저장합니다.
+
+    Args:
+        news_list: 뉴스 리스트
+        snapshot_file: 스냅숏 파일 경로 (None이면 저장하지 않음)
+
+    Returns:
+        스냅숏
+    """
+    signature = news_signature(news_list)
+    previous = BriefingSnapshot.load(snapshot_file) if snapshot_file else None
+    if previous is not None and previous.signature == signature:
+        metrics.incr('briefing_snapshot_total', result='reused')
+        return previous
+
+    snapshot = BriefingSnapshot.build(news_list, previous=previous, signature=signature)
+    metrics.incr('briefing_snapshot_total', result='rebuilt')
+    if snapshot_file:
+        try:
+            snapshot.save(snapshot_file)
+        except OSError as e:
+            print(f"⚠️  브리핑 스냅숏 저장 실패: {str(e)}")
+    return snapshot
+
+
+def snapshot_file_from_config(config: Optional[Dict]) -> str:
+    """설정 파일의 notification.snapshot_file 경로 (기본값: briefing_snapshot.json)"""
+    return (config or {}).get('notification', {}).get('snapshot_file', 'briefing_snapshot.json')
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+수집 체크포인트 모듈
+수집 도중 프로세스가 죽어도(타임아웃, 메모리 부족, cron에 의한 종료 등) 이미 끝난 소스의 결과를
+잃지 않도록, 소스 하나가 끝날 때마다 결과를 저널 디렉터리에 기록합니다.
+
+    checkpoints/<실행 주체>/run.json                  실행 정보 (시작 시각)
+    checkpoints/<실행 주체>/sources/<소스 키>.json     소스별 수집 결과
+
+실행 주체(CLI, GUI)마다 저널 디렉터리가 따로 있어, 한쪽이 새로 시작하며 저널을 지워도
+다른 쪽이 이어받을 저널은 남습니다.
+
+모든 파일은 임시 파일에 쓴 뒤 이름을 바꾸는 방식으로 원자적으로 기록되므로,
+중간에 죽어도 쓰다 만 파일이 남지 않습니다. 이어서 실행(resume)하면 끝나지 않은 소스만 다시 수집합니다.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from typing import Dict, List, Optional
+
+from atomic_file import atomic_write_json
+
+
+def source_key(source: Dict) -> str:
+    """소스 설정으로 체크포인트 파일 이름을 만듭니다 (이름/주소/타입이 바뀌면 다른 소스로 취급)."""
+    raw = json.dumps([source.get('name'), source.get('url'), source.get('type')], ensure_ascii=False)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+class CheckpointJournal:
+    """소스별 수집 결과를 기록하는 체크포인트 저널"""
+
+    def __init__(self, directory: str = 'checkpoints', resume: bool = False, max_age_hours: float = 6):
+        """
+        Args:
+            directory: 저널 디렉터리
+            resume: 기존 저널을 이어서 사용할지 여부 (False면 새로 시작)
+            max_age_hours: 이보다 오래된 저널은 이어받지 않음 (오래된 뉴스를 보내지 않도록)
+        """
+        self.directory = directory
+        self.sources_dir = os.path.join(directory, 'sources')
+        self.completed: Dict[str, List[Dict]] = {}
+
+        if resume:
+            self._load(max_age_hours)
+        else:
+            self.clear()
+
+        os.makedirs(self.sources_dir, exist_ok=True)
+        if not os.path.exists(os.path.join(directory, 'run.json')):
+            atomic_write_json(os.path.join(directory, 'run.json'), {'started_at': time.time()})
+
+    def _load(self, max_age_hours: float):
+        """기존 저널을 읽어옵니다."""
+        try:
+            with open(os.path.join(self.directory, 'run.json'), 'r', encoding='utf-8') as f:
+                started_at = json.load(f).get('started_at', 0)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.clear()
+            return
+
+        if time.time() - started_at > max_age_hours * 3600:
+            print(f"⚠️  체크포인트가 {max_age_hours}시간보다 오래되어 새로 수집합니다.")
+            self.clear()
+            return
+
+        try:
+            filenames = os.listdir(self.sources_dir)
+        except FileNotFoundError:
+            filenames = []
+
+        for filename in filenames:
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.sources_dir, filename), 'r', encoding='utf-8') as f:
+                    self.completed[filename[:-len('.json')]] = json.load(f)['news']
+            except (json.JSONDecodeError, KeyError, OSError):
+                continue
+
+        if self.completed:
+            print(f"♻️  체크포인트에서 완료된 소스 {len(self.completed)}개를 이어받습니다.")
+
+    def is_done(self, source: Dict) -> bool:
+        """이미 수집이 끝난 소스인지 확인합니다."""
+        return source_key(source) in self.completed
+
+    def pending(self, sources: List[Dict]) -> List[Dict]:
+        """아직 수집하지 않은 소스만 반환합니다."""
+        return [source for source in sources if not self.is_done(source)]
+
+    def completed_results(self, sources: List[Dict]) -> List[List[Dict]]:
+        """현재 소스 목록 중 완료된 소스들의 수집 결과를 반환합니다."""
+        return [self.completed[source_key(source)] for source in sources if self.is_done(source)]
+
+    def record(self, source: Dict, news_list: List[Dict]):
+        """
+        소스 하나의 수집 결과를 기록합니다.
+
+        Args:
+            source: 뉴스 소스 정보
+            news_list: 수집된 뉴스 리스트
+        """
+        key = source_key(source)
+        atomic_write_json(os.path.join(self.sources_dir, key + '.json'),
+                          {'source': source.get('name'), 'news': news_list})
+        self.completed[key] = news_list
+
+    def clear(self):
+        """저널을 지웁니다 (실행이 끝까지 완료된 뒤 호출)."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.completed = {}
+
+
+def journal_from_config(config: Optional[Dict], resume: bool = False,
+                        name: str = 'cli', auto_resume: bool = True) -> Optional[CheckpointJournal]:
+    """
+    설정 파일의 checkpoint 항목으로 저널을 만듭니다.
+    checkpoint.enabled가 true일 때만 만들며, 설정이 없으면 체크포인트를 쓰지 않습니다 (None).
+
+    Args:
+        config: 전체 설정 딕셔너리
+        resume: 기존 저널을 이어서 사용할지 여부
+        name: 실행 주체 이름 (checkpoint.dir 아래 이 이름의 디렉터리를 저널로 사용)
+        auto_resume: checkpoint.auto_resume이 true면 resume과 상관없이 이어서 사용할지 여부
+                     (GUI는 사용자가 고른 값만 따르도록 False로 호출)
+    """
+    checkpoint_config = (config or {}).get('checkpoint', {})
+    if not checkpoint_config.get('enabled', False):
+        return None
+
+    return CheckpointJournal(
+        directory=os.path.join(checkpoint_config.get('dir', 'checkpoints'), name),
+        resume=resume or (auto_resume and checkpoint_config.get('auto_resume', False)),
+        max_age_hours=checkpoint_config.get('max_age_hours', 6)
+    )
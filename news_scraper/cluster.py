@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+다중 노드 수집 모듈
+여러 노드가 공유 작업 대기열(work_queue)에서 소스를 나눠 가져와 수집하고,
+결과는 공통 저장소(news.db)에 링크 기준으로 중복 없이 기록합니다.
+
+알림은 저장소의 알림 대기열(outbox)을 통해 보냅니다.
+새 기사는 저장과 같은 트랜잭션에서 대기열에 들어가고, 한 노드가 점유한 뒤 전송하므로
+같은 기사가 여러 노드에서 중복 전송되지 않으며, 전송 전에 죽은 노드의 몫은 다른 노드가 이어받습니다.
+
+    python scraper.py --worker [--worker-id node-1] [--run-id 20260101T0900]
+"""
+
+import os
+import socket
+import time
+from typing import Callable, Dict, List, Optional
+
+from news_store import NewsStore, bloom_from_config, db_file_from_config
+from relevance import filter_news
+from scraper import NewsCollector, merge_news_streams, published_epoch
+from work_queue import Heartbeat, current_run_id, queue_from_config
+
+
+def drain_outbox(store: NewsStore, owner: str, notify: Optional[Callable[[List[Dict]], bool]],
+                 sources: List[Dict], config: Dict, lease_seconds: float = 120) -> int:
+    """
+    알림 대기열의 뉴스를 점유해 관련도 필터를 거쳐 전송합니다.
+
+    Args:
+        store: 공통 뉴스 저장소
+        owner: 노드 이름
+        notify: 뉴스 묶음을 전송하는 함수 (None이면 전송하지 않고 처리 완료로 표시)
+        sources: 뉴스 소스 설정 목록 (소스별 기준 점수)
+        config: 전체 설정
+        lease_seconds: 점유 시간 (초)
+
+    Returns:
+        전송한 뉴스 수
+    """
+    sent = 0
+    while True:
+        token, claimed = store.claim_outbox(owner, limit=100, lease_seconds=lease_seconds)
+        if not claimed:
+            return sent
+
+        claimed.sort(key=published_epoch, reverse=True)
+        selected = filter_news(claimed, sources, config.get('filter')) if notify is not None else []
+        selected_links = {news['link'] for news in selected}
+        skipped = [news['link'] for news in claimed if news['link'] not in selected_links]
+        if skipped:
+            store.finish_outbox(token, skipped, 'skipped')
+
+        if not selected:
+            continue
+
+        print(f"📤 새 뉴스 {len(selected)}개 전송 중...")
+        if notify(selected):
+            store.finish_outbox(token, list(selected_links), 'sent')
+            sent += len(selected)
+        else:
+            # 전송에 실패한 뉴스는 대기열로 되돌려 다음 기회에 다시 보냅니다.
+            store.finish_outbox(token, list(selected_links), 'pending')
+            print("❌ 텔레그램 알림 전송 실패 (대기열로 되돌림)")
+            return sent
+
+
+def run_worker(config: Optional[Dict], notify: Optional[Callable[[List[Dict]], bool]] = None,
+               collector: Optional[NewsCollector] = None, worker_id: Optional[str] = None,
+               run_id: Optional[str] = None) -> Dict:
+    """
+    작업 대기열에서 소스를 가져와 수집하는 노드 하나를 실행합니다.
+    남은 작업이 없어질 때까지(다른 노드가 점유 중인 작업이 끝나거나 만료될 때까지) 동작합니다.
+
+    Args:
+        config: 설정 딕셔너리
+        notify: 뉴스 묶음을 전송하는 함수
+        collector: 사용할 수집기 (None이면 새로 생성)
+        worker_id: 노드 이름 (None이면 호스트 이름-PID)
+        run_id: 실행 id (None이면 현재 실행 구간으로 계산)
+
+    Returns:
+        {'run_id', 'worker_id', 'sources', 'collected', 'new', 'sent'}
+    """
+    config = config or {}
+    cluster_config = config.get('cluster', {})
+    collector = collector or NewsCollector(source_defaults=config.get('scraper'))
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    run_id = run_id or current_run_id(cluster_config.get('run_interval_minutes', 60))
+    lease_seconds = cluster_config.get('visibility_timeout', 120)
+
+    queue = queue_from_config(config)
+    added = queue.enqueue(run_id, collector.sources)
+    print(f"\n🚀 [{worker_id}] 실행 {run_id} 참여 (새로 등록한 소스 {added}개)\n")
+
+    stats = {'run_id': run_id, 'worker_id': worker_id, 'sources': 0, 'collected': 0, 'new': 0, 'sent': 0}
+    collector.new_news = []
+    collected = []
+
+    try:
+        with NewsStore(db_file_from_config(config), bloom_from_config(config)) as store, \
+                Heartbeat(queue, run_id, worker_id, cluster_config.get('heartbeat_interval', 30)):
+            while True:
+                # 실행 도중 sources.json이 바뀌면 이후 작업부터 새 설정으로 수집합니다.
+                collector.refresh_sources()
+                jobs = queue.lease(run_id, worker_id, cluster_config.get('lease_batch', 2))
+                if not jobs:
+                    if queue.remaining(run_id) == 0:
+                        break
+                    # 다른 노드가 처리 중인 작업이 끝나거나 만료되기를 기다립니다.
+                    time.sleep(cluster_config.get('poll_interval', 5))
+                    continue
+
+                for source in jobs:
+                    # collect_source는 요청/파싱 실패를 errors에 기록하고 빈 목록을 반환하므로,
+                    # 작업마다 비우고 확인해야 실패한 소스를 완료 처리하지 않고 다시 시도할 수 있습니다.
+                    collector.errors.clear()
+                    try:
+                        news_list = collector.collect_source(source)
+                        if source['name'] in collector.errors:
+                            queue.release(run_id, source['name'], worker_id, collector.errors[source['name']])
+                            continue
+                        fresh = store.insert_new(news_list, outbox=True)
+                    except Exception as e:
+                        print(f"  ❌ {source['name']} 처리 실패: {str(e)}")
+                        queue.release(run_id, source['name'], worker_id, str(e))
+                        continue
+
+                    if not queue.complete(run_id, source['name'], worker_id):
+                        print(f"  ⚠️  {source['name']}: 점유 시간이 지나 다른 노드가 이어받았습니다.")
+                    collected.append(news_list)
+                    collector.new_news.extend(fresh)
+                    stats['sources'] += 1
+                    stats['collected'] += len(news_list)
+                    stats['new'] += len(fresh)
+
+                stats['sent'] += drain_outbox(store, worker_id, notify, collector.sources, config, lease_seconds)
+
+            # 다른 노드가 점유한 채 남긴 알림까지 정리합니다.
+            stats['sent'] += drain_outbox(store, worker_id, notify, collector.sources, config, lease_seconds)
+    finally:
+        queue.close()
+
+    collector.collected_news = merge_news_streams(collected)
+    print(f"\n📊 [{worker_id}] 소스 {stats['sources']}개 처리, 뉴스 {stats['collected']}개 수집 "
+          f"(새 뉴스 {stats['new']}개), {stats['sent']}개 전송\n")
+    return stats
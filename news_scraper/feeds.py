@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+피드 출력 모듈
+수집된 뉴스를 표준 피드 파일(RSS 2.0, Atom, JSON Feed)로 만들어
+정적 웹 서버가 그대로 제공할 수 있게 합니다. 카테고리별 피드도 함께 만듭니다.
+
+    feeds/all.xml, all.atom, all.json
+    feeds/category-<카테고리>.xml, .atom, .json
+    feeds/etags.json    (파일 이름 → ETag)
+
+피드 내용은 기사만으로 정해지므로(생성 시각을 넣지 않음), 내용이 바뀐 파일만 다시 씁니다.
+바뀌지 않은 파일은 수정 시각도 그대로여서 웹 서버의 캐시 검증(ETag/Last-Modified)이 유지됩니다.
+파일은 임시 파일에 쓴 뒤 원자적으로 교체하므로 읽는 쪽이 쓰다 만 파일을 보지 않습니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, List, Optional
+
+from atomic_file import atomic_write
+from links import news_key
+from scraper import published_epoch
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+
+# 카테고리별 피드 파일 이름 접두사 (all, etags 같은 고정 파일 이름과 겹치지 않게 함)
+CATEGORY_PREFIX = 'category-'
+
+# 피드 형식별 확장자
+FEED_FORMATS = {
+    'rss': '.xml',
+    'atom': '.atom',
+    'json': '.json',
+}
+
+
+def _slug(name: str) -> str:
+    """
+    카테고리 이름을 파일 이름으로 쓸 수 있게 바꿉니다.
+
+    그대로 쓸 수 없는 이름(대문자, 공백, 특수 문자 등)은 바꾼 뒤 원래 이름의 짧은 해시를 붙여,
+    'AI/ML'과 'ai-ml'처럼 같은 형태로 줄어드는 카테고리끼리 파일이 겹치지 않게 합니다.
+    """
+    slug = re.sub(r'[^\w-]+', '-', name.strip().lower()).strip('-') or 'unknown'
+    if slug == name:
+        return slug
+    return f"{slug}-{hashlib.sha1(name.encode('utf-8')).hexdigest()[:6]}"
+
+
+def _published(news: Dict) -> datetime:
+    return datetime.fromtimestamp(published_epoch(news), tz=timezone.utc)
+
+
+def _xml_bytes(root: ET.Element) -> bytes:
+    return ET.tostring(root, encoding='utf-8', xml_declaration=True)
+
+
+def render_rss(news_list: List[Dict], title: str, link: str, description: str) -> bytes:
+    """RSS 2.0 문서를 만듭니다."""
+    rss = ET.Element('rss', version='2.0')
+    channel = ET.SubElement(rss, 'channel')
+    ET.SubElement(channel, 'title').text = title
+    ET.SubElement(channel, 'link').text = link
+    ET.SubElement(channel, 'description').text = description
+    ET.SubElement(channel, 'language').text = 'ko'
+    if news_list:
+        ET.SubElement(channel, 'lastBuildDate').text = format_datetime(_published(news_list[0]))
+
+    for news in news_list:
+        item = ET.SubElement(channel, 'item')
+        ET.SubElement(item, 'title').text = news.get('title', '')
+        ET.SubElement(item, 'link').text = news['link']
+        ET.SubElement(item, 'guid', isPermaLink='true').text = news['link']
+        ET.SubElement(item, 'description').text = news.get('summary', '') or ''
+        ET.SubElement(item, 'category').text = news.get('category', 'unknown')
+        ET.SubElement(item, 'source', url=link).text = news.get('source', '')
+        ET.SubElement(item, 'pubDate').text = format_datetime(_published(news))
+
+    return _xml_bytes(rss)
+
+
+def render_atom(news_list: List[Dict], title: str, link: str, feed_id: str) -> bytes:
+    """Atom 1.0 문서를 만듭니다."""
+    feed = ET.Element('feed', xmlns=ATOM_NS)
+    ET.SubElement(feed, 'title').text = title
+    ET.SubElement(feed, 'id').text = feed_id
+    ET.SubElement(feed, 'link', rel='self', href=feed_id)
+    ET.SubElement(feed, 'link', rel='alternate', href=link)
+    updated = _published(news_list[0]) if news_list else datetime.fromtimestamp(0, tz=timezone.utc)
+    ET.SubElement(feed, 'updated').text = updated.isoformat()
+
+    for news in news_list:
+        entry = ET.SubElement(feed, 'entry')
+        ET.SubElement(entry, 'title').text = news.get('title', '')
+        ET.SubElement(entry, 'id').text = news['link']
+        ET.SubElement(entry, 'link', href=news['link'])
+        ET.SubElement(entry, 'updated').text = _published(news).isoformat()
+        author = ET.SubElement(entry, 'author')
+        ET.SubElement(author, 'name').text = news.get('source', '')
+        ET.SubElement(entry, 'category', term=news.get('category', 'unknown'))
+        if news.get('summary'):
+            ET.SubElement(entry, 'summary').text = news['summary']
+
+    return _xml_bytes(feed)
+
+
+def render_json_feed(news_list: List[Dict], title: str, link: str, feed_url: str) -> bytes:
+    """JSON Feed 1.1 문서를 만듭니다."""
+    document = {
+        'version': 'https://jsonfeed.org/version/1.1',
+        'title': title,
+        'home_page_url': link,
+        'feed_url': feed_url,
+        'language': 'ko',
+        'items': [
+            {
+                'id': news['link'],
+                'url': news['link'],
+                'title': news.get('title', ''),
+                'summary': news.get('summary', '') or '',
+                'date_published': _published(news).isoformat(),
+                'authors': [{'name': news.get('source', '')}],
+                'tags': [news.get('category', 'unknown')],
+            }
+            for news in news_list
+        ],
+    }
+    return json.dumps(document, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def compute_etag(body: bytes) -> str:
+    """본문 내용으로 ETag를 계산합니다."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def write_if_changed(path: str, body: bytes) -> bool:
+    """
+    내용이 바뀐 경우에만 파일을 원자적으로 교체합니다.
+
+    Args:
+        path: 파일 경로
+        body: 새 내용
+
+    Returns:
+        파일을 새로 썼는지 여부
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == body:
+                return False
+    except FileNotFoundError:
+        pass
+
+    atomic_write(path, body)
+    return True
+
+
+class FeedWriter:
+    """수집 결과를 피드 파일로 내보내는 클래스"""
+
+    def __init__(self, output_dir: str = 'feeds', base_url: str = 'http://localhost/feeds/',
+                 title: str = 'AI 뉴스', max_items: int = 50, per_category: bool = True):
+        """
+        Args:
+            output_dir: 피드 파일을 쓸 디렉터리
+            base_url: 피드 파일이 제공될 주소 (피드 안의 self 링크에 사용)
+            title: 피드 제목
+            max_items: 피드당 최대 기사 수
+            per_category: 카테고리별 피드도 만들지 여부
+        """
+        self.output_dir = output_dir
+        self.base_url = base_url if base_url.endswith('/') else base_url + '/'
+        self.title = title
+        self.max_items = max_items
+        self.per_category = per_category
+
+    def _render(self, fmt: str, news_list: List[Dict], name: str, title: str) -> bytes:
+        feed_url = self.base_url + name + FEED_FORMATS[fmt]
+        if fmt == 'rss':
+            return render_rss(news_list, title, self.base_url, f"{title} 자동 수집 피드")
+        if fmt == 'atom':
+            return render_atom(news_list, title, self.base_url, feed_url)
+        return render_json_feed(news_list, title, self.base_url, feed_url)
+
+    def write(self, news_list: List[Dict]) -> Dict[str, str]:
+        """
+        뉴스 목록으로 피드 파일들을 씁니다.
+
+        저장소와 같은 기준(정규화 링크)으로 같은 기사는 한 번만 넣고, 최신순 상위 max_items개만 사용합니다.
+
+        Args:
+            news_list: 뉴스 리스트 (최신순)
+
+        Returns:
+            파일 이름 → ETag
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        unique = []
+        seen = set()
+        for news in news_list:
+            key = news_key(news)
+            if key and key not in seen:
+                seen.add(key)
+                unique.append(news)
+
+        feeds = {'all': (self.title, unique[:self.max_items])}
+        if self.per_category:
+            by_category = {}
+            for news in unique:
+                by_category.setdefault(news.get('category', 'unknown'), []).append(news)
+            for category, items in sorted(by_category.items()):
+                feeds[CATEGORY_PREFIX + _slug(category)] = (f"{self.title} - {category}", items[:self.max_items])
+
+        etags = {}
+        written = 0
+        for name, (title, items) in feeds.items():
+            for fmt, extension in FEED_FORMATS.items():
+                body = self._render(fmt, items, name, title)
+                filename = name + extension
+                if write_if_changed(os.path.join(self.output_dir, filename), body):
+                    written += 1
+                etags[filename] = compute_etag(body)
+
+        manifest = json.dumps(etags, ensure_ascii=False, indent=2, sort_keys=True).encode('utf-8')
+        write_if_changed(os.path.join(self.output_dir, 'etags.json'), manifest)
+
+        print(f"📰 피드 {len(etags)}개 중 {written}개 갱신 ({self.output_dir}/)")
+        return etags
+
+
+def feed_writer_from_config(config: Optional[Dict]) -> Optional[FeedWriter]:
+    """설정 파일의 feeds 항목으로 FeedWriter를 만듭니다 (비활성이면 None)."""
+    feeds_config = (config or {}).get('feeds', {})
+    if not feeds_config.get('enabled', False):
+        return None
+
+    return FeedWriter(
+        output_dir=feeds_config.get('output_dir', 'feeds'),
+        base_url=feeds_config.get('base_url', 'http://localhost/feeds/'),
+        title=feeds_config.get('title', 'AI 뉴스'),
+        max_items=feeds_config.get('max_items', 50),
+        per_category=feeds_config.get('per_category', True)
+    )
@@ -2,16 +2,31 @@
 """
 AI 뉴스 수집기 - GUI 버전
 바탕화면에서 쉽게 실행할 수 있는 그래픽 인터페이스
+
+창을 빨리 띄우기 위해 요청/파싱 모듈(requests, BeautifulSoup 등)과 저장소/피드/텔레그램 모듈은
+수집, 전송, 뉴스 보기를 시작할 때 불러옵니다 (benchmark.py --imports-only로 불러오기 시간 확인).
 """
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import threading
+import contextlib
+import queue
 import json
 import os
 from datetime import datetime
 from scraper import NewsCollector, load_config
-from telegram_notifier import TelegramNotifier
+from metrics import metrics, configure_metrics
+from transport import configure_transport, prewarm_from_config
+from profiling import create_profiler
+
+
+# 로그 창에 유지할 최대 줄 수
+MAX_LOG_LINES = 2000
+
+# 이벤트 큐를 비우는 주기 (밀리초)와 한 번에 처리할 최대 이벤트 수
+EVENT_POLL_INTERVAL_MS = 100
+EVENT_BATCH_SIZE = 500
 
 
 class NewsScraperGUI:
@@ -19,6 +34,9 @@ class NewsScraperGUI:
 
     def __init__(self, root):
         self.root = root
+
+        # 작업 스레드에서 Tk 위젯을 직접 건드리지 않도록 이벤트 큐를 사용합니다.
+        self.events = queue.Queue()
         self.root.title("🤖 AI 뉴스 자동 수집기")
         self.root.geometry("900x700")
 
@@ -36,12 +54,40 @@ class NewsScraperGUI:
 
         # 설정 로드
         self.config = load_config()
+        configure_metrics(self.config)
+        configure_transport(self.config)
         self.update_config_status()
 
+        # scraper.parse_workers > 0이면 창을 띄운 뒤 파싱 워커를 미리 띄워 두고 창을 닫을 때까지 재사용합니다.
+        self.parse_pool = None
+        self._pool_ready = threading.Thread(target=self.start_parse_pool, daemon=True)
+        self._pool_ready.start()
+
         # 현재 디렉토리를 스크립트 위치로 변경
         script_dir = os.path.dirname(os.path.abspath(__file__))
         os.chdir(script_dir)
 
+        # 이벤트 큐 처리 시작
+        self.root.after(EVENT_POLL_INTERVAL_MS, self.process_events)
+
+    def start_parse_pool(self):
+        """파싱 프로세스 풀을 띄우고 워커에 파서 모듈을 미리 불러옵니다 (백그라운드)."""
+        if (self.config or {}).get('scraper', {}).get('parse_workers', 0) <= 0:
+            return
+        try:
+            from parse_pool import pool_from_config
+            self.parse_pool = pool_from_config(self.config, warm=True)
+            self.log(f"⚙️  파싱 프로세스 {self.parse_pool.workers}개를 준비했습니다.", "INFO")
+        except Exception as e:
+            self.log(f"⚠️  파싱 프로세스를 띄우지 못해 현재 프로세스에서 파싱합니다: {str(e)}", "WARNING")
+
+    def shutdown(self):
+        """창을 닫은 뒤 파싱 프로세스 풀을 정리합니다."""
+        self._pool_ready.join()
+        if self.parse_pool is not None:
+            self.parse_pool.close()
+            self.parse_pool = None
+
     def setup_styles(self):
         """스타일 설정"""
         style = ttk.Style()
@@ -134,6 +180,24 @@ class NewsScraperGUI:
         )
         view_btn.pack(side=tk.LEFT, padx=5, ipady=10)
 
+        # 프로파일링 옵션
+        self.profile_var = tk.BooleanVar(value=False)
+        profile_check = ttk.Checkbutton(
+            control_frame,
+            text="🔬 프로파일링",
+            variable=self.profile_var
+        )
+        profile_check.pack(side=tk.RIGHT, padx=5)
+
+        # 중단된 수집 이어받기 옵션 (checkpoint.enabled일 때만 사용, 기본값은 checkpoint.auto_resume)
+        self.resume_var = tk.BooleanVar(value=False)
+        self.resume_check = ttk.Checkbutton(
+            control_frame,
+            text="♻️ 이어서 수집",
+            variable=self.resume_var
+        )
+        self.resume_check.pack(side=tk.RIGHT, padx=5)
+
         # 진행 상태 표시
         progress_frame = tk.Frame(self.root)
         progress_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -197,8 +261,16 @@ class NewsScraperGUI:
         else:
             self.telegram_status_label.config(text="❌ 미설정", fg="red")
 
+        checkpoint_config = (self.config or {}).get('checkpoint', {})
+        self.resume_var.set(checkpoint_config.get('auto_resume', False))
+        self.resume_check.config(state=tk.NORMAL if checkpoint_config.get('enabled', False) else tk.DISABLED)
+
     def log(self, message, level="INFO"):
-        """로그 메시지 출력"""
+        """
+        로그 메시지 출력
+
+        어느 스레드에서 호출해도 안전하며, 실제 출력은 메인 루프에서 일괄 처리됩니다.
+        """
         timestamp = datetime.now().strftime("%H:%M:%S")
 
         # 레벨별 아이콘
@@ -212,9 +284,60 @@ class NewsScraperGUI:
 
         log_message = f"[{timestamp}] {icon} {message}\n"
 
-        self.log_text.insert(tk.END, log_message)
+        self.events.put(('log', log_message))
+
+    def post(self, callback, *args):
+        """
+        메인 루프에서 실행할 UI 작업을 예약합니다.
+
+        Args:
+            callback: 메인 스레드에서 호출할 함수
+            *args: 함수 인자
+        """
+        self.events.put(('call', callback, args))
+
+    def process_events(self):
+        """이벤트 큐에 쌓인 로그와 UI 작업을 한 번에 처리합니다."""
+        lines = []
+        try:
+            for _ in range(EVENT_BATCH_SIZE):
+                event = self.events.get_nowait()
+                if event[0] == 'log':
+                    lines.append(event[1])
+                    continue
+
+                # UI 작업 전에 앞서 쌓인 로그를 먼저 출력해 순서를 유지합니다.
+                self._append_log(lines)
+                lines = []
+                _, callback, args = event
+                try:
+                    callback(*args)
+                except Exception as e:
+                    self._append_log([f"UI 작업 오류: {str(e)}\n"])
+        except queue.Empty:
+            pass
+
+        self._append_log(lines)
+        self.root.after(EVENT_POLL_INTERVAL_MS, self.process_events)
+
+    def _append_log(self, lines):
+        """로그 줄들을 한 번에 추가하고 최대 줄 수를 넘으면 오래된 줄을 지웁니다."""
+        if not lines:
+            return
+
+        self.log_text.insert(tk.END, ''.join(lines))
+
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > MAX_LOG_LINES:
+            self.log_text.delete('1.0', f'{line_count - MAX_LOG_LINES + 1}.0')
+
         self.log_text.see(tk.END)
-        self.root.update()
+
+    def finish_scraping(self):
+        """수집 완료 후 진행 표시와 버튼 상태를 되돌립니다 (메인 스레드)."""
+        self.progress_bar.stop()
+        self.progress_label.config(text="완료", fg="#27ae60")
+        self.start_button.config(state=tk.NORMAL)
 
     def start_scraping(self):
         """뉴스 수집 시작"""
@@ -226,58 +349,111 @@ class NewsScraperGUI:
         self.log("🚀 뉴스 수집을 시작합니다...", "INFO")
 
         # 별도 스레드에서 실행
-        thread = threading.Thread(target=self.run_scraping, daemon=True)
+        thread = threading.Thread(
+            target=self.run_scraping,
+            kwargs={'profile': self.profile_var.get(), 'resume': self.resume_var.get()},
+            daemon=True
+        )
         thread.start()
 
-    def run_scraping(self):
-        """뉴스 수집 실행 (백그라운드)"""
-        try:
-            # 뉴스 수집기 초기화
-            collector = NewsCollector()
-
-            # 각 소스에서 수집
-            for source in collector.sources:
-                self.log(f"📡 {source['name']}에서 수집 중...", "INFO")
-
-                if source.get('type') == 'rss':
-                    news = collector.collect_from_rss(source)
-                elif source.get('type') == 'scraping':
-                    news = collector.collect_from_scraping(source)
-                else:
-                    news = []
-
-                collector.collected_news.extend(news)
-                self.log(f"   {len(news)}개의 뉴스 수집 완료", "SUCCESS")
-
-            # 정렬
-            collector.collected_news.sort(
-                key=lambda x: x.get('published', ''),
-                reverse=True
-            )
+    def run_scraping(self, profile=False, resume=False):
+        """
+        뉴스 수집 실행 (백그라운드)
+
+        Args:
+            profile: 실행을 프로파일링할지 여부
+            resume: 중단된 수집의 체크포인트를 이어받을지 여부 (False면 남은 체크포인트를 지우고 새로 수집)
+        """
+        from briefing_snapshot import snapshot_file_from_config, snapshot_for
+        from checkpoint import journal_from_config
+        from feeds import feed_writer_from_config
+        from links import resolver_from_config
+        from news_store import bloom_from_config, db_file_from_config
+        from relevance import filter_news
+        from trends import update_trends
+
+        profiler = contextlib.nullcontext()
+        if profile:
+            profiling_config = (self.config or {}).get('profiling', {})
+            profiler = create_profiler(profiling_config.get('mode', 'cprofile'), self.config, label='gui')
 
-            # JSON 저장
-            collector.save_to_json()
-            total = len(collector.collected_news)
-            self.log(f"💾 총 {total}개의 뉴스를 collected_news.json에 저장했습니다.", "SUCCESS")
-
-            # 텔레그램 알림
-            if self.config and self.config.get('telegram', {}).get('enabled', False):
-                self.send_telegram_notification(collector.collected_news)
+        try:
+            with profiler:
+                # 수집하는 동안 텔레그램 API 연결을 미리 열어 둡니다
+                prewarm_from_config(self.config)
+
+                # 뉴스 수집기 초기화 (미리 띄운 파싱 풀이 있으면 사용)
+                self._pool_ready.join()
+                collector = NewsCollector(parse_pool=self.parse_pool,
+                                          link_resolver=resolver_from_config(self.config),
+                                          source_defaults=(self.config or {}).get('scraper'))
+
+                # 이어서 수집을 골랐으면 중단된 수집에서 끝난 소스는 체크포인트의 결과를 사용합니다.
+                journal = journal_from_config(self.config, resume=resume, name='gui', auto_resume=False)
+                if journal is not None and resume:
+                    if journal.completed:
+                        self.log(f"♻️  체크포인트에서 완료된 소스 {len(journal.completed)}개를 이어받습니다.", "INFO")
+                    else:
+                        self.log("♻️  이어받을 체크포인트가 없어 처음부터 수집합니다.", "INFO")
+
+                # 명령줄 실행과 같은 collect_all로 수집하고, 소스가 끝날 때마다 로그 창에 표시합니다.
+                self.log(f"📡 {len(collector.sources)}개 소스에서 수집 중...", "INFO")
+                collector.collect_all(
+                    journal=journal,
+                    on_source=lambda source, news: self.log(
+                        f"   {source['name']}: {len(news)}개의 뉴스 수집 완료", "SUCCESS")
+                )
+                for name, error in collector.errors.items():
+                    self.log(f"   {name}: 수집 실패 ({error})", "ERROR")
+
+                # JSON 저장
+                collector.save_to_json()
+                total = len(collector.collected_news)
+                self.log(f"💾 총 {total}개의 뉴스를 collected_news.json에 저장했습니다.", "SUCCESS")
+
+                # 피드 파일 내보내기
+                feed_writer = feed_writer_from_config(self.config)
+                if feed_writer is not None:
+                    etags = collector.save_to_feeds(feed_writer)
+                    self.log(f"📰 피드 파일 {len(etags)}개를 {feed_writer.output_dir}/에 저장했습니다.", "SUCCESS")
+
+                # 누적 저장소 저장
+                added = collector.save_to_store(db_file_from_config(self.config), bloom_from_config(self.config))
+                self.log(f"🗄️  새 뉴스 {added}개를 저장소에 추가했습니다.", "SUCCESS")
+
+                # 트렌드 갱신 (trends.enabled일 때만 적용, 명령줄 실행과 같은 새 뉴스로 집계)
+                trends = update_trends(self.config, collector.new_news)
+                if trends:
+                    self.log(f"📈 급상승 토픽 {len(trends)}개를 찾았습니다.", "INFO")
+
+                # 브리핑 스냅숏 (알림과 뉴스 보기 창이 함께 사용)
+                notify_news = filter_news(
+                    collector.collected_news, collector.sources, (self.config or {}).get('filter'))
+                snapshot = snapshot_for(notify_news, snapshot_file_from_config(self.config))
+
+                # 텔레그램 알림
+                if self.config and self.config.get('telegram', {}).get('enabled', False):
+                    self.send_telegram_notification(notify_news, snapshot, trends)
+
+                if journal is not None:
+                    journal.clear()
+
+            if profile and profiler.summary_file:
+                self.log(f"🔬 프로파일 저장: {profiler.summary_file}", "INFO")
 
             self.log("✨ 모든 작업이 완료되었습니다!", "SUCCESS")
-            messagebox.showinfo("완료", f"총 {total}개의 뉴스를 수집했습니다!")
+            self.post(messagebox.showinfo, "완료", f"총 {total}개의 뉴스를 수집했습니다!")
 
         except Exception as e:
             self.log(f"오류 발생: {str(e)}", "ERROR")
-            messagebox.showerror("오류", f"뉴스 수집 중 오류가 발생했습니다:\n{str(e)}")
+            self.post(messagebox.showerror, "오류", f"뉴스 수집 중 오류가 발생했습니다:\n{str(e)}")
 
         finally:
-            self.progress_bar.stop()
-            self.progress_label.config(text="완료", fg="#27ae60")
-            self.start_button.config(state=tk.NORMAL)
+            metrics.flush()
+            self.post(self.finish_scraping)
 
-    def send_telegram_notification(self, news_list):
-        """텔레그램 알림 전송"""
+    def send_telegram_notification(self, news_list, snapshot=None, trends=None):
+        """텔레그램 알림 전송 (snapshot: news_list로 미리 만든 브리핑 스냅숏, trends: 급상승 토픽 리포트)"""
         try:
             self.log("📱 텔레그램 알림 전송 중...", "INFO")
 
@@ -286,21 +462,32 @@ class NewsScraperGUI:
             chat_id = telegram_config.get('chat_id', '')
 
             if bot_token and chat_id and bot_token != 'YOUR_BOT_TOKEN_HERE':
-                notifier = TelegramNotifier(bot_token, chat_id)
+                from telegram_notifier import briefing_from_config, notifier_from_config
+                notifier = notifier_from_config(self.config)
 
                 notification_config = self.config.get('notification', {})
                 max_news = notification_config.get('max_news_per_message', 5)
                 include_summary = notification_config.get('include_summary', True)
 
-                if notifier.send_news_notification(
-                    news_list,
-                    format_type='category',
-                    max_news=max_news,
-                    include_summary=include_summary
-                ):
+                briefing = briefing_from_config(notifier, self.config)
+                if briefing is not None:
+                    sent = briefing.update(news_list)
+                else:
+                    sent = notifier.send_news_notification(
+                        news_list,
+                        format_type='category',
+                        max_news=max_news,
+                        include_summary=include_summary,
+                        snapshot=snapshot
+                    )
+                if sent:
                     self.log("✅ 텔레그램 알림 전송 완료!", "SUCCESS")
                 else:
                     self.log("텔레그램 알림 전송 실패", "WARNING")
+
+                # 트렌드 리포트
+                if trends and self.config.get('trends', {}).get('report', True):
+                    notifier.send_trend_report(trends)
             else:
                 self.log("텔레그램 설정이 올바르지 않습니다.", "WARNING")
 
@@ -324,7 +511,8 @@ class NewsScraperGUI:
                 messagebox.showerror("오류", "봇 토큰이 설정되지 않았습니다.")
                 return
 
-            notifier = TelegramNotifier(bot_token, chat_id)
+            from telegram_notifier import notifier_from_config
+            notifier = notifier_from_config(self.config)
 
             if notifier.test_connection():
                 test_news = [{
@@ -381,63 +569,226 @@ class NewsScraperGUI:
 
     def view_collected_news(self):
         """수집된 뉴스 보기"""
+        from briefing_snapshot import BriefingSnapshot, snapshot_file_from_config
+        from news_store import NewsStore, db_file_from_config
+
         news_file = "collected_news.json"
+        db_file = db_file_from_config(self.config)
 
-        if not os.path.exists(news_file):
+        if not os.path.exists(db_file) and not os.path.exists(news_file):
             messagebox.showwarning("파일 없음", "아직 수집된 뉴스가 없습니다.\n'뉴스 수집 시작' 버튼을 클릭하세요.")
             return
 
         try:
-            with open(news_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # 새 창 생성
-            view_window = tk.Toplevel(self.root)
-            view_window.title("📰 수집된 뉴스")
-            view_window.geometry("800x600")
-
-            # 헤더
-            header = tk.Label(
-                view_window,
-                text=f"📊 총 {data.get('total_count', 0)}개의 뉴스 | 수집 시간: {data.get('collected_at', '')}",
-                font=("Arial", 12, "bold"),
-                bg="#3498db",
-                fg="white",
-                pady=10
+            store = NewsStore(db_file)
+
+            # 저장소가 생기기 전에 만들어진 collected_news.json은 처음 한 번만 가져옵니다.
+            if store.get_meta('collected_at') is None:
+                store.import_json(news_file)
+
+            # 마지막 수집의 카테고리별 개수는 저장된 브리핑 스냅숏에서 바로 읽습니다.
+            snapshot = BriefingSnapshot.load(snapshot_file_from_config(self.config))
+            NewsViewer(self.root, store, snapshot)
+
+        except Exception as e:
+            messagebox.showerror("오류", f"뉴스 저장소를 읽는 중 오류 발생:\n{str(e)}")
+
+
+class NewsViewer:
+    """
+    수집된 뉴스 보기 창
+
+    저장소에서 한 페이지씩 읽어와 목록에 추가하며,
+    스크롤이 끝에 가까워질 때만 다음 페이지를 읽습니다.
+    검색어를 입력하면 저장소의 전문 검색 결과로 목록을 바꿉니다.
+    """
+
+    PAGE_SIZE = 200
+    SEARCH_LIMIT = 500
+
+    def __init__(self, parent, store, snapshot=None):
+        """
+        Args:
+            parent: 부모 Tk 위젯
+            store: 뉴스 저장소 (창이 닫힐 때 함께 닫힘)
+            snapshot: 마지막 수집의 브리핑 스냅숏 (없으면 카테고리별 개수를 표시하지 않음)
+        """
+        self.store = store
+        self.snapshot = snapshot
+        self.cursor = None
+        self.exhausted = False
+
+        # 새 창 생성
+        self.window = tk.Toplevel(parent)
+        self.window.title("📰 수집된 뉴스")
+        self.window.geometry("900x650")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        # 헤더
+        self.header = tk.Label(
+            self.window,
+            text="",
+            font=("Arial", 12, "bold"),
+            bg="#3498db",
+            fg="white",
+            pady=10
+        )
+        self.header.pack(fill=tk.X)
+
+        # 검색창
+        search_frame = tk.Frame(self.window)
+        search_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        search_entry.bind("<Return>", self.search)
+
+        ttk.Button(search_frame, text="🔍 검색", command=self.search).pack(side=tk.LEFT, padx=5)
+        ttk.Button(search_frame, text="전체 보기", command=self.reset).pack(side=tk.LEFT)
+
+        # 뉴스 목록
+        list_frame = tk.Frame(self.window)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+
+        self.tree = ttk.Treeview(
+            list_frame,
+            columns=("published", "source", "title"),
+            show="headings",
+            selectmode="browse"
+        )
+        self.tree.heading("published", text="📅 발행일")
+        self.tree.heading("source", text="출처")
+        self.tree.heading("title", text="제목")
+        self.tree.column("published", width=140, stretch=False)
+        self.tree.column("source", width=140, stretch=False)
+        self.tree.column("title", width=560)
+
+        self.scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.on_scroll)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tree.bind("<Double-1>", self.open_link)
+
+        # 선택한 뉴스 상세
+        self.detail_text = scrolledtext.ScrolledText(
+            self.window,
+            wrap=tk.WORD,
+            font=("Consolas", 10),
+            bg="#f8f9fa",
+            height=7
+        )
+        self.detail_text.pack(fill=tk.X, padx=10, pady=(0, 10))
+        self.detail_text.tag_config("title", foreground="#2c3e50", font=("Arial", 11, "bold"))
+        self.detail_text.tag_config("link", foreground="#3498db")
+        self.detail_text.tag_config("summary", foreground="#7f8c8d")
+        self.detail_text.config(state=tk.DISABLED)
+
+        self.update_header()
+        self.load_more()
+
+    def update_header(self):
+        """헤더에 전체 개수와 마지막 수집 시간을 표시합니다."""
+        total = self.store.count()
+        collected_at = self.store.get_meta('collected_at', '')
+        text = f"📊 총 {total}개의 뉴스 | 수집 시간: {collected_at}"
+        if self.snapshot is not None and self.snapshot.total:
+            from telegram_notifier import CATEGORY_NAMES
+            counts = ', '.join(f"{CATEGORY_NAMES.get(category, category)} {count}개"
+                               for category, count in self.snapshot.category_counts.items())
+            text += f"\n최근 브리핑: {counts}"
+        self.header.config(text=text)
+
+    def load_more(self):
+        """다음 페이지를 저장소에서 읽어 목록에 추가합니다."""
+        if self.exhausted:
+            return
+
+        rows = self.store.fetch_page(self.cursor, self.PAGE_SIZE)
+        if len(rows) < self.PAGE_SIZE:
+            self.exhausted = True
+        if not rows:
+            return
+
+        for row in rows:
+            self.tree.insert(
+                "", tk.END,
+                iid=str(row['id']),
+                values=(row['published'][:16].replace('T', ' '), row['source'], row['title'])
             )
-            header.pack(fill=tk.X)
-
-            # 뉴스 목록
-            news_text = scrolledtext.ScrolledText(
-                view_window,
-                wrap=tk.WORD,
-                font=("Consolas", 10),
-                bg="#f8f9fa"
+        self.cursor = (rows[-1]['published_ts'], rows[-1]['id'])
+
+    def search(self, event=None):
+        """검색어로 저장소를 검색해 목록을 바꿉니다."""
+        query = self.search_var.get().strip()
+        if not query:
+            self.reset()
+            return
+
+        results = self.store.search(query, limit=self.SEARCH_LIMIT)
+
+        self.tree.delete(*self.tree.get_children())
+        self.exhausted = True
+        for row in results:
+            self.tree.insert(
+                "", tk.END,
+                iid=str(row['id']),
+                values=(row['published'][:16].replace('T', ' '), row['source'], row['title'])
             )
-            news_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-            # 뉴스 표시
-            for i, news in enumerate(data.get('news', []), 1):
-                news_text.insert(tk.END, f"\n{i}. ", "number")
-                news_text.insert(tk.END, f"[{news['source']}] ", "source")
-                news_text.insert(tk.END, f"{news['title']}\n", "title")
-                news_text.insert(tk.END, f"   🔗 {news['link']}\n", "link")
-                if news.get('summary'):
-                    news_text.insert(tk.END, f"   📝 {news['summary'][:150]}...\n", "summary")
-                news_text.insert(tk.END, f"   📅 {news['published']}\n\n", "date")
-
-            # 텍스트 태그 설정
-            news_text.tag_config("number", foreground="#e74c3c", font=("Arial", 10, "bold"))
-            news_text.tag_config("source", foreground="#9b59b6", font=("Arial", 10, "bold"))
-            news_text.tag_config("title", foreground="#2c3e50", font=("Arial", 11, "bold"))
-            news_text.tag_config("link", foreground="#3498db")
-            news_text.tag_config("summary", foreground="#7f8c8d")
-            news_text.tag_config("date", foreground="#95a5a6", font=("Arial", 9))
-
-            news_text.config(state=tk.DISABLED)
 
-        except Exception as e:
-            messagebox.showerror("오류", f"뉴스 파일을 읽는 중 오류 발생:\n{str(e)}")
+        suffix = "+" if len(results) >= self.SEARCH_LIMIT else ""
+        self.header.config(text=f"🔍 '{query}' 검색 결과 {len(results)}{suffix}개")
+
+    def reset(self):
+        """검색을 해제하고 최신순 전체 목록으로 돌아갑니다."""
+        self.search_var.set("")
+        self.tree.delete(*self.tree.get_children())
+        self.cursor = None
+        self.exhausted = False
+        self.update_header()
+        self.load_more()
+
+    def on_scroll(self, first, last):
+        """스크롤 위치가 끝에 가까워지면 다음 페이지를 읽어옵니다."""
+        self.scrollbar.set(first, last)
+        if float(last) > 0.9 and not self.exhausted:
+            self.window.after_idle(self.load_more)
+
+    def on_select(self, event=None):
+        """선택한 뉴스의 상세 내용을 표시합니다."""
+        selection = self.tree.selection()
+        if not selection:
+            return
+
+        news = self.store.get(int(selection[0]))
+        if not news:
+            return
+
+        self.detail_text.config(state=tk.NORMAL)
+        self.detail_text.delete(1.0, tk.END)
+        self.detail_text.insert(tk.END, f"[{news['source']}] {news['title']}\n", "title")
+        self.detail_text.insert(tk.END, f"🔗 {news['link']}\n", "link")
+        if news.get('summary'):
+            self.detail_text.insert(tk.END, f"📝 {news['summary']}\n", "summary")
+        self.detail_text.config(state=tk.DISABLED)
+
+    def open_link(self, event=None):
+        """선택한 뉴스를 브라우저로 엽니다."""
+        selection = self.tree.selection()
+        if not selection:
+            return
+
+        news = self.store.get(int(selection[0]))
+        if news:
+            import webbrowser
+            webbrowser.open(news['link'])
+
+    def close(self):
+        """창을 닫고 저장소 연결을 정리합니다."""
+        self.store.close()
+        self.window.destroy()
 
 
 def main():
@@ -445,6 +796,7 @@ def main():
     root = tk.Tk()
     app = NewsScraperGUI(root)
     root.mainloop()
+    app.shutdown()
 
 
 if __name__ == '__main__':
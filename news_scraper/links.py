@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+링크 정규화 모듈
+같은 기사가 추적 파라미터, http/https 차이, 피드 프록시 주소 때문에
+다른 링크로 수집되어 중복 저장/전송되지 않도록 중복 판별용 정규화 링크를 만듭니다.
+
+    1. 리다이렉트 해석: 피드 프록시/단축 URL 호스트일 때만 HEAD 요청으로 최종 주소 확인
+    2. 정규화: 스킴/호스트 소문자화, http → https, 기본 포트·프래그먼트·추적 파라미터 제거
+
+정규화 링크는 중복 판별에만 쓰는 키이므로 news['canonical_link']에 따로 저장하고,
+news['link']에는 원본(또는 리다이렉트를 따라간 최종) 주소를 그대로 둡니다.
+
+리다이렉트 해석 결과는 SQLite 파일에 만료 시간과 함께 저장되어,
+같은 링크는 만료 전까지 다시 요청하지 않습니다.
+"""
+
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+from metrics import metrics
+
+# 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref_src', 'ref_url', 'cmpid', 'ocid', '_hsenc', '_hsmi', 'mkt_tok', 'spm',
+    'rss', 'from_rss', 'feedtype',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+# 리다이렉트를 따라가야 실제 기사 주소를 알 수 있는 호스트 (피드 프록시/단축 URL)
+DEFAULT_REDIRECT_HOSTS = (
+    'feedproxy.google.com', 'feeds.feedburner.com', 'feedburner.google.com',
+    't.co', 'bit.ly', 'buff.ly', 'ow.ly', 'dlvr.it', 'trib.al', 'lnkd.in',
+    'tinyurl.com', 'rebrand.ly', 'zpr.io',
+)
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# url: 정규화 링크, target: 리다이렉트를 따라간 최종 주소 (정규화하지 않음, 실패하면 빈 문자열)
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS redirects (
+    url TEXT PRIMARY KEY,
+    target TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    중복 판별용 정규화 링크를 만듭니다. 네트워크 요청은 하지 않습니다.
+
+    추적 파라미터만 빼고 나머지 쿼리 조각은 다시 인코딩하지 않고 그대로 정렬해 붙이므로
+    ``?12345`` 같은 값 없는 쿼리나 인코딩 방식은 바뀌지 않습니다.
+
+    Args:
+        url: 원본 링크
+
+    Returns:
+        정규화된 링크 (http(s) 링크가 아니면 앞뒤 공백만 제거)
+    """
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower().rstrip('.')
+    if port and port != _DEFAULT_PORTS[scheme]:
+        host = f'{host}:{port}'
+
+    query = sorted(
+        piece for piece in parts.query.split('&')
+        if piece and not _is_tracking(piece.split('=', 1)[0])
+    )
+
+    return urlunsplit(('https', host, parts.path or '/', '&'.join(query), ''))
+
+
+def _is_tracking(key: str) -> bool:
+    """쿼리 키가 추적 파라미터인지 확인합니다."""
+    key = unquote_plus(key).lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+
+class LinkResolver:
+    """링크 정규화 및 리다이렉트 해석기 (만료 시간이 있는 캐시 사용)"""
+
+    def __init__(self, cache_file: str = 'link_cache.db', resolve_redirects: bool = True,
+                 redirect_hosts: Optional[Iterable[str]] = None,
+                 ttl_hours: float = 168, failure_ttl_hours: float = 6,
+                 timeout: float = 5, max_workers: int = 8):
+        """
+        Args:
+            cache_file: 리다이렉트 해석 결과를 저장할 SQLite 파일
+            resolve_redirects: 리다이렉트 호스트의 최종 주소를 확인할지 여부
+            redirect_hosts: 리다이렉트를 따라갈 호스트 목록 (None이면 DEFAULT_REDIRECT_HOSTS)
+            ttl_hours: 해석 결과 보관 시간
+            failure_ttl_hours: 해석 실패 결과 보관 시간 (이 시간이 지나면 다시 시도)
+            timeout: HEAD 요청 타임아웃 (초)
+            max_workers: 동시에 보낼 HEAD 요청 수
+        """
+        self.cache_file = cache_file
+        self.resolve_redirects = resolve_redirects
+        self.redirect_hosts = set(redirect_hosts or DEFAULT_REDIRECT_HOSTS)
+        self.ttl = ttl_hours * 3600
+        self.failure_ttl = failure_ttl_hours * 3600
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+    def needs_resolve(self, url: str) -> bool:
+        """리다이렉트를 따라가야 하는 링크인지 확인합니다."""
+        if not self.resolve_redirects:
+            return False
+        return (urlsplit(url).hostname or '') in self.redirect_hosts
+
+    def _connect(self) -> sqlite3.Connection:
+        """캐시 파일에 연결합니다 (호출마다 새 연결이므로 여러 스레드에서 동시에 써도 안전)."""
+        conn = sqlite3.connect(self.cache_file, timeout=10)
+        conn.executescript(_CACHE_SCHEMA)
+        return conn
+
+    def _head(self, url: str) -> Optional[str]:
+        """리다이렉트를 따라가 최종 주소를 반환합니다 (실패 시 None)."""
+        import requests
+        from transport import get_transport
+
+        transport = get_transport()
+        try:
+            response = transport.head(url, headers={'User-Agent': 'Mozilla/5.0'},
+                                      allow_redirects=True, timeout=self.timeout)
+            if response.status_code in (403, 405, 501):
+                # HEAD를 받지 않는 서버는 본문을 읽지 않는 GET으로 확인합니다.
+                response = transport.get(url, headers={'User-Agent': 'Mozilla/5.0'},
+                                         allow_redirects=True, timeout=self.timeout, stream=True)
+                response.close()
+            if response.status_code >= 400:
+                return None
+            return response.url
+        except requests.RequestException:
+            return None
+
+    def resolve_many(self, urls: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        여러 링크 중 필요한 링크만 리다이렉트를 해석하고 정규화 링크를 만듭니다.
+
+        캐시는 정규화 링크를 키로 하므로 추적 파라미터만 다른 링크는 한 번만 요청하며,
+        캐시에 없는 링크만 동시에 HEAD 요청을 보냅니다.
+
+        Args:
+            urls: 원본 링크 목록
+
+        Returns:
+            원본 링크 → (최종 링크, 정규화 링크)
+        """
+        canonical = {url: canonicalize_url(url) for url in urls}
+        pending = {}
+        for url, key in canonical.items():
+            if self.needs_resolve(key):
+                pending.setdefault(key, url)
+        if not pending:
+            return {url: (url, key) for url, key in canonical.items()}
+
+        now = time.time()
+        targets = {}
+        with closing(self._connect()) as conn:
+            keys = sorted(pending)
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT url, target FROM redirects WHERE expires_at > ? AND url IN ({placeholders})",
+                    [now] + chunk
+                ).fetchall()
+                targets.update(rows)
+
+            misses = [key for key in keys if key not in targets]
+            metrics.incr('news_link_resolve_total', len(keys) - len(misses), outcome='cache_hit')
+
+            if misses:
+                with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(misses)))) as executor:
+                    finals = list(executor.map(self._head, [pending[key] for key in misses]))
+
+                rows = []
+                for key, final in zip(misses, finals):
+                    if final is None:
+                        # 실패는 빈 문자열로 기록하고, 이 경우 원본 링크를 그대로 씁니다.
+                        targets[key] = ''
+                        rows.append((key, '', now + self.failure_ttl))
+                        metrics.incr('news_link_resolve_total', outcome='failed')
+                    else:
+                        targets[key] = final
+                        rows.append((key, final, now + self.ttl))
+                        metrics.incr('news_link_resolve_total', outcome='resolved')
+
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO redirects VALUES (?, ?, ?)", rows)
+                    conn.execute("DELETE FROM redirects WHERE expires_at <= ?", (now,))
+
+        resolved = {}
+        for url, key in canonical.items():
+            final = targets.get(key) or url
+            resolved[url] = (final, canonicalize_url(final) if final != url else key)
+        return resolved
+
+    def canonicalize_news(self, news_list: List[Dict]) -> List[Dict]:
+        """
+        뉴스 목록에 중복 판별용 canonical_link를 채웁니다 (원본 리스트를 수정합니다).
+
+        link는 리다이렉트를 따라간 최종 주소(해석하지 않았거나 실패하면 원본)로 둡니다.
+
+        Args:
+            news_list: 뉴스 리스트
+
+        Returns:
+            같은 뉴스 리스트
+        """
+        mapping = self.resolve_many(news['link'] for news in news_list if news.get('link'))
+        for news in news_list:
+            if news.get('link'):
+                news['link'], news['canonical_link'] = mapping[news['link']]
+        return news_list
+
+
+def news_key(news: Dict) -> str:
+    """중복 판별에 쓰는 링크 (정규화 링크가 없으면 원본 링크)를 반환합니다."""
+    return news.get('canonical_link') or news.get('link') or ''
+
+
+def resolver_from_config(config: Optional[Dict]) -> Optional[LinkResolver]:
+    """설정 파일의 links 항목으로 링크 정규화기를 만듭니다 (비활성이면 None)."""
+    links_config = (config or {}).get('links', {})
+    if not links_config.get('canonicalize', False):
+        return None
+
+    return LinkResolver(
+        cache_file=links_config.get('cache_file', 'link_cache.db'),
+        resolve_redirects=links_config.get('resolve_redirects', False),
+        redirect_hosts=links_config.get('redirect_hosts'),
+        ttl_hours=links_config.get('ttl_hours', 168),
+        failure_ttl_hours=links_config.get('failure_ttl_hours', 6),
+        timeout=links_config.get('timeout', 5)
+    )
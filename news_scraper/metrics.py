@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+수집/전송 단계별 계측 모듈
+소스별 요청 시간, 응답 크기, HTTP 상태, 파싱 시간, 항목 수와
+텔레그램 전송 시간을 기록하여 설정된 싱크(sink)로 내보냅니다.
+
+싱크가 하나도 없으면 비활성 상태이며, 모든 기록 호출은 즉시 반환합니다.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from atomic_file import atomic_write
+
+
+class _NullTimer:
+    """비활성 상태에서 사용하는 아무 일도 하지 않는 타이머"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """with 블록의 실행 시간을 observe로 기록하는 타이머"""
+
+    __slots__ = ('_metrics', '_name', '_labels', '_started')
+
+    def __init__(self, metrics: 'Metrics', name: str, labels: Dict):
+        self._metrics = metrics
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._metrics.observe(self._name, time.perf_counter() - self._started, **self._labels)
+        return False
+
+
+class MemorySink:
+    """기록된 이벤트를 메모리에 보관하는 싱크 (테스트/벤치마크용)"""
+
+    def __init__(self):
+        self.events: List[Tuple[str, str, float, Dict]] = []
+
+    def record(self, kind: str, name: str, value: float, labels: Dict):
+        self.events.append((kind, name, value, labels))
+
+    def values(self, name: str, **labels) -> List[float]:
+        """이름과 라벨이 일치하는 값 목록을 반환합니다."""
+        return [
+            value for _, event_name, value, event_labels in self.events
+            if event_name == name and all(event_labels.get(k) == v for k, v in labels.items())
+        ]
+
+    def total(self, name: str, **labels) -> float:
+        """이름과 라벨이 일치하는 값의 합을 반환합니다."""
+        return sum(self.values(name, **labels))
+
+    def flush(self):
+        pass
+
+
+class LogSink:
+    """이벤트를 JSON 한 줄씩 구조화 로그로 남기는 싱크"""
+
+    def __init__(self, logger_name: str = 'news_scraper.metrics', path: Optional[str] = None):
+        """
+        Args:
+            logger_name: 사용할 로거 이름
+            path: 로그 파일 경로 (None이면 기존 로깅 설정을 따름)
+        """
+        self.logger = logging.getLogger(logger_name)
+        if path:
+            # 다시 구성할 때마다 핸들러가 쌓여 같은 줄이 여러 번 기록되지 않도록 이전 파일 핸들러를 닫습니다.
+            for handler in list(self.logger.handlers):
+                if isinstance(handler, logging.FileHandler):
+                    self.logger.removeHandler(handler)
+                    handler.close()
+            handler = logging.FileHandler(path, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            self.logger.addHandler(handler)
+            self.logger.setLevel(logging.INFO)
+            self.logger.propagate = False
+
+    def record(self, kind: str, name: str, value: float, labels: Dict):
+        self.logger.info(json.dumps({
+            'ts': round(time.time(), 3),
+            'kind': kind,
+            'metric': name,
+            'value': value,
+            'labels': labels
+        }, ensure_ascii=False))
+
+    def flush(self):
+        for handler in self.logger.handlers:
+            handler.flush()
+
+
+class PrometheusFileSink:
+    """
+    Prometheus 텍스트 형식 파일로 내보내는 싱크
+
+    node_exporter의 textfile collector가 읽을 수 있도록 flush 때마다
+    임시 파일에 쓴 뒤 원자적으로 교체합니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 출력 파일 경로 (예: news_scraper.prom)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, tuple], float] = {}
+        self._summaries: Dict[Tuple[str, tuple], List[float]] = {}
+
+    def record(self, kind: str, name: str, value: float, labels: Dict):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            if kind == 'counter':
+                self._counters[key] = self._counters.get(key, 0) + value
+            else:
+                summary = self._summaries.setdefault(key, [0, 0.0])
+                summary[0] += 1
+                summary[1] += value
+
+    @staticmethod
+    def _format_labels(labels: tuple) -> str:
+        if not labels:
+            return ''
+        escaped = []
+        for key, value in labels:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            escaped.append(f'{key}="{value}"')
+        return '{' + ','.join(escaped) + '}'
+
+    def render(self) -> str:
+        """현재까지 누적된 값을 Prometheus 텍스트 형식으로 변환합니다."""
+        lines = []
+        with self._lock:
+            for metric_type, series in (('counter', self._counters), ('summary', self._summaries)):
+                seen = set()
+                for (name, labels), value in sorted(series.items()):
+                    if name not in seen:
+                        lines.append(f"# TYPE {name} {metric_type}")
+                        seen.add(name)
+                    label_text = self._format_labels(labels)
+                    if metric_type == 'counter':
+                        lines.append(f"{name}{label_text} {value}")
+                    else:
+                        lines.append(f"{name}_count{label_text} {value[0]}")
+                        lines.append(f"{name}_sum{label_text} {value[1]}")
+        return '\n'.join(lines) + '\n'
+
+    def flush(self):
+        atomic_write(self.path, self.render())
+
+
+class Metrics:
+    """계측 값을 싱크들로 전달하는 클래스"""
+
+    def __init__(self, sinks: Optional[List] = None):
+        """
+        Args:
+            sinks: 이벤트를 받을 싱크 목록 (비어 있으면 비활성)
+        """
+        self.sinks = list(sinks or [])
+        self.enabled = bool(self.sinks)
+
+    def add_sink(self, sink):
+        """싱크를 추가하고 계측을 활성화합니다."""
+        self.sinks.append(sink)
+        self.enabled = True
+
+    def remove_sink(self, sink):
+        """싱크를 제거하고, 남은 싱크가 없으면 계측을 비활성화합니다."""
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+        self.enabled = bool(self.sinks)
+
+    def clear(self):
+        """모든 싱크를 제거하고 계측을 비활성화합니다."""
+        self.sinks = []
+        self.enabled = False
+
+    def incr(self, name: str, value: float = 1, **labels):
+        """카운터를 증가시킵니다."""
+        if not self.enabled:
+            return
+        for sink in self.sinks:
+            sink.record('counter', name, value, labels)
+
+    def observe(self, name: str, value: float, **labels):
+        """시간/크기 같은 관측값을 기록합니다."""
+        if not self.enabled:
+            return
+        for sink in self.sinks:
+            sink.record('summary', name, value, labels)
+
+    def replay(self, events: List[Tuple[str, str, float, Dict]]):
+        """다른 프로세스의 MemorySink가 모은 이벤트를 다시 기록합니다 (파싱 워커 → 부모)."""
+        if not self.enabled:
+            return
+        for kind, name, value, labels in events:
+            for sink in self.sinks:
+                sink.record(kind, name, value, labels)
+
+    def timer(self, name: str, **labels):
+        """with 블록의 실행 시간(초)을 기록하는 타이머를 반환합니다."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def flush(self):
+        """싱크에 쌓인 값을 내보냅니다."""
+        for sink in self.sinks:
+            try:
+                sink.flush()
+            except Exception as e:
+                print(f"⚠️  계측 값 내보내기 실패: {str(e)}")
+
+
+# 프로세스 전체에서 공유하는 기본 계측 객체 (기본값: 비활성)
+metrics = Metrics()
+
+
+def configure_metrics(config: Optional[Dict]) -> Metrics:
+    """
+    설정 파일의 metrics 항목에 따라 기본 계측 객체의 싱크를 구성합니다.
+
+    Args:
+        config: 전체 설정 딕셔너리
+
+    Returns:
+        구성된 기본 계측 객체
+    """
+    metrics.clear()
+
+    metrics_config = (config or {}).get('metrics', {})
+    if not metrics_config.get('enabled', False):
+        return metrics
+
+    if metrics_config.get('log_file'):
+        metrics.add_sink(LogSink(path=metrics_config['log_file']))
+    if metrics_config.get('prometheus_file'):
+        metrics.add_sink(PrometheusFileSink(metrics_config['prometheus_file']))
+
+    return metrics
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+텔레그램 Bot API 대역 서버
+실제 api.telegram.org 없이 알림 전송을 시험하고 처리량을 측정할 수 있도록,
+sendMessage / editMessageText / deleteMessage / getMe를 흉내 내는 로컬 HTTP 서버입니다.
+
+    - latency / jitter: 모든 요청에 응답 지연을 더합니다.
+    - chat_rate / global_rate: 채팅별/전체 초당 메시지 한도를 넘으면 429와 retry_after를 돌려줍니다.
+    - 메시지 본문은 텔레그램과 같은 규칙으로 검사합니다
+      (4096자 제한, 지원하지 않는 HTML 태그, 닫히지 않은 태그, 잘못된 & 엔티티 → 400).
+
+config.json의 telegram.api_base를 이 서버 주소로 바꾸면 수집기 전체를 그대로 시험할 수 있습니다.
+
+사용법:
+    python mock_telegram.py --port 8081 --latency 0.05 --chat-rate 1 --global-rate 30
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl
+
+# 텔레그램 메시지 최대 길이 (글자 수)
+MAX_MESSAGE_LENGTH = 4096
+
+# parse_mode=HTML에서 텔레그램이 허용하는 태그
+ALLOWED_TAGS = {
+    'b', 'strong', 'i', 'em', 'u', 'ins', 's', 'strike', 'del', 'a', 'code', 'pre',
+    'span', 'tg-spoiler', 'tg-emoji', 'blockquote',
+}
+
+
+class _EntityChecker(HTMLParser):
+    """parse_mode=HTML 본문의 태그 짝과 허용 여부를 검사합니다."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.stack = []
+        self.error = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.error:
+            return
+        if tag not in ALLOWED_TAGS:
+            self.error = f'Unsupported start tag "{tag}"'
+        else:
+            self.stack.append(tag)
+
+    def handle_endtag(self, tag):
+        if self.error:
+            return
+        if not self.stack or self.stack[-1] != tag:
+            self.error = f'Unexpected end tag "{tag}"'
+        else:
+            self.stack.pop()
+
+    def handle_data(self, data):
+        # 올바른 엔티티는 handle_entityref/handle_charref로 가므로, 본문에 남은 &는 이스케이프되지 않은 것입니다.
+        if not self.error and '&' in data:
+            self.error = 'Unsupported entity "&"'
+
+    def handle_entityref(self, name):
+        if not self.error and name not in ('lt', 'gt', 'amp', 'quot'):
+            self.error = f'Unsupported entity "&{name};"'
+
+
+def check_html(text: str) -> Optional[str]:
+    """
+    parse_mode=HTML 본문을 텔레그램 규칙으로 검사합니다.
+
+    Args:
+        text: 메시지 본문
+
+    Returns:
+        텔레그램과 같은 형식의 오류 설명 (문제가 없으면 None)
+    """
+    checker = _EntityChecker()
+    checker.feed(text)
+    # 본문 끝의 'AT&T'처럼 세미콜론 없이 끝난 엔티티는 close()가 &를 버리고 넘기므로 먼저 확인합니다.
+    if checker.error is None and '&' in checker.rawdata:
+        checker.error = 'Unsupported entity "&"'
+    checker.close()
+    if checker.error is None and checker.stack:
+        checker.error = f'Can\'t find end tag corresponding to start tag "{checker.stack[-1]}"'
+    if checker.error:
+        return f"Bad Request: can't parse entities: {checker.error}"
+    return None
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # 여러 채팅이 동시에 접속해도 연결이 거부되지 않도록 대기열을 넉넉히 둡니다.
+    request_queue_size = 128
+
+
+class MockBotAPI:
+    """텔레그램 Bot API를 흉내 내는 로컬 HTTP 서버"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 chat_rate: Optional[float] = None, global_rate: Optional[float] = None,
+                 retry_after: Optional[float] = None):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            latency: 모든 요청에 더할 응답 지연 (초)
+            jitter: 지연에 더할 무작위 편차의 최댓값 (초)
+            chat_rate: 채팅별 초당 메시지 한도 (None이면 무제한, 실제 텔레그램은 약 1)
+            global_rate: 봇 전체 초당 메시지 한도 (None이면 무제한, 실제 텔레그램은 약 30)
+            retry_after: 429 응답에 넣을 retry_after (None이면 한도가 풀릴 때까지 남은 초를 올림)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.chat_rate = chat_rate
+        self.global_rate = global_rate
+        self.retry_after = retry_after
+
+        self._lock = threading.Lock()
+        self._next_message_id = 1
+        self._chat_sent: Dict[str, deque] = defaultdict(deque)
+        self._global_sent: deque = deque()
+        self.messages: Dict[str, Dict[int, str]] = defaultdict(dict)
+        self.stats: Dict[str, int] = defaultdict(int)
+
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                self._handle(b'')
+
+            def do_POST(self):
+                self._handle(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+
+            def _handle(self, body: bytes):
+                path, _, query = self.path.partition('?')
+                method = path.rsplit('/', 1)[-1]
+                if self.headers.get('Content-Type', '').startswith('application/json') and body:
+                    payload = json.loads(body)
+                else:
+                    payload = dict(parse_qsl(body.decode('utf-8') or query))
+
+                delay = mock.latency + (random.uniform(0, mock.jitter) if mock.jitter else 0)
+                if delay:
+                    time.sleep(delay)
+
+                status, result = mock.dispatch(method, payload)
+                data = json.dumps(result, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = _Server((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def api_base(self) -> str:
+        """TelegramNotifier의 api_base로 넘길 주소"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @staticmethod
+    def _error(status: int, description: str, **parameters) -> Tuple[int, Dict]:
+        result = {'ok': False, 'error_code': status, 'description': description}
+        if parameters:
+            result['parameters'] = parameters
+        return status, result
+
+    def _take_slot(self, chat_id: str) -> Optional[float]:
+        """
+        초당 한도 안에서 메시지 하나를 보낼 자리를 잡습니다 (최근 1초 동안 보낸 메시지 수 기준).
+
+        Returns:
+            한도를 넘었으면 한도가 풀릴 때까지 남은 초, 자리를 잡았으면 None
+        """
+        now = time.monotonic()
+        with self._lock:
+            windows = [(self._chat_sent[chat_id], self.chat_rate), (self._global_sent, self.global_rate)]
+            wait = 0.0
+            for sent, rate in windows:
+                while sent and sent[0] <= now - 1:
+                    sent.popleft()
+                if rate and len(sent) >= rate:
+                    wait = max(wait, sent[len(sent) - int(rate)] + 1 - now)
+            if wait > 0:
+                return wait
+            for sent, _ in windows:
+                sent.append(now)
+        return None
+
+    def _check_text(self, payload: Dict) -> Optional[Tuple[int, Dict]]:
+        text = payload.get('text') or ''
+        if not text.strip():
+            return self._error(400, 'Bad Request: message text is empty')
+        if len(text) > MAX_MESSAGE_LENGTH:
+            return self._error(400, 'Bad Request: message is too long')
+        if payload.get('parse_mode', '').upper() == 'HTML':
+            description = check_html(text)
+            if description:
+                return self._error(400, description)
+        return None
+
+    def dispatch(self, method: str, payload: Dict) -> Tuple[int, Dict]:
+        """
+        Bot API 메서드 하나를 처리합니다.
+
+        Returns:
+            (HTTP 상태, 응답 JSON)
+        """
+        status, result = self._dispatch(method, payload)
+        with self._lock:
+            self.stats[f"{method}:{status}"] += 1
+        return status, result
+
+    def _dispatch(self, method: str, payload: Dict) -> Tuple[int, Dict]:
+        if method == 'getMe':
+            return 200, {'ok': True, 'result': {'id': 1, 'is_bot': True, 'first_name': 'Mock Bot',
+                                                'username': 'mock_news_bot'}}
+
+        chat_id = str(payload.get('chat_id', ''))
+        if not chat_id:
+            return self._error(400, 'Bad Request: chat_id is empty')
+
+        if method == 'deleteMessage':
+            with self._lock:
+                found = self.messages[chat_id].pop(int(payload.get('message_id', 0)), None)
+            if found is None:
+                return self._error(400, 'Bad Request: message to delete not found')
+            return 200, {'ok': True, 'result': True}
+
+        if method not in ('sendMessage', 'editMessageText'):
+            return self._error(404, 'Not Found: method not found')
+
+        invalid = self._check_text(payload)
+        if invalid:
+            return invalid
+
+        wait = self._take_slot(chat_id)
+        if wait is not None:
+            retry_after = self.retry_after if self.retry_after is not None else math.ceil(wait)
+            return self._error(429, f'Too Many Requests: retry after {retry_after}', retry_after=retry_after)
+
+        text = payload['text']
+        with self._lock:
+            if method == 'sendMessage':
+                message_id = self._next_message_id
+                self._next_message_id += 1
+                self.messages[chat_id][message_id] = text
+                return 200, {'ok': True, 'result': {'message_id': message_id, 'chat': {'id': chat_id},
+                                                    'date': int(time.time()), 'text': text}}
+
+            message_id = int(payload.get('message_id', 0))
+            if message_id not in self.messages[chat_id]:
+                return self._error(400, 'Bad Request: message to edit not found')
+            if self.messages[chat_id][message_id] == text:
+                return self._error(400, 'Bad Request: message is not modified: specified new message content '
+                                        'and reply markup are exactly the same as a current content and reply '
+                                        'markup of the message')
+            self.messages[chat_id][message_id] = text
+            return 200, {'ok': True, 'result': {'message_id': message_id, 'chat': {'id': chat_id},
+                                                'edit_date': int(time.time()), 'text': text}}
+
+
+def main():
+    """대역 서버 실행 함수"""
+    parser = argparse.ArgumentParser(description='텔레그램 Bot API 대역 서버')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8081, help='포트 (기본값: 8081)')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='응답 지연 무작위 편차 (초)')
+    parser.add_argument('--chat-rate', type=float, help='채팅별 초당 메시지 한도')
+    parser.add_argument('--global-rate', type=float, help='전체 초당 메시지 한도')
+    parser.add_argument('--retry-after', type=float, help='429 응답의 retry_after 고정값 (초)')
+    args = parser.parse_args()
+
+    server = MockBotAPI(args.host, args.port, args.latency, args.jitter,
+                        args.chat_rate, args.global_rate, args.retry_after)
+    print(f"🤖 텔레그램 Bot API 대역 서버 실행 중: {server.api_base}")
+    print(f"💡 config.json의 telegram.api_base를 \"{server.api_base}\"로 설정하세요. (Ctrl+C로 종료)")
+    with server:
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    print("\n📊 요청 통계:")
+    for key, count in sorted(server.stats.items()):
+        print(f"   {key}: {count}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+뉴스 저장소 모듈
+수집된 뉴스를 SQLite 데이터베이스에 누적 저장하고,
+최신순 페이지 단위 조회와 제목/요약 전문 검색을 제공합니다.
+
+collected_news.json은 마지막 실행 결과만 담지만, 저장소는 모든 실행의
+기사를 정규화 링크(canonical_link, 없으면 link) 기준으로 중복 없이 보관합니다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
+
+from links import news_key
+from metrics import metrics
+from scraper import published_epoch
+from seen_filter import SeenFilter, filter_lock, open_seen_filter
+
+DEFAULT_DB_FILE = 'news.db'
+
+NEWS_COLUMNS = ('source', 'title', 'link', 'summary', 'published', 'category')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    link TEXT NOT NULL UNIQUE,
+    canonical_link TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    category TEXT NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    published TEXT NOT NULL,
+    published_ts REAL NOT NULL,
+    collected_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_latest ON articles (published_ts DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles (category, published_ts DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source, published_ts DESC);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outbox (
+    link TEXT PRIMARY KEY,
+    news TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_expires REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_state ON outbox (state, lease_expires);
+"""
+
+# 알림 대기열(outbox)에서 처리가 끝난 항목을 보관하는 기간 (초)
+OUTBOX_RETENTION = 7 * 86400
+
+# 제목/요약 전문 검색 인덱스
+# trigram 토크나이저는 띄어쓰기와 무관하게 3글자 단위로 색인하므로
+# 형태소 분석 없이도 한국어 부분 문자열 검색이 가능합니다.
+# 트리거로 articles 테이블과 함께 갱신되어 새 기사는 즉시 검색됩니다.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, content='articles', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, summary) VALUES (new.id, new.title, new.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary)
+    VALUES ('delete', old.id, old.title, old.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary)
+    VALUES ('delete', old.id, old.title, old.summary);
+    INSERT INTO articles_fts (rowid, title, summary) VALUES (new.id, new.title, new.summary);
+END;
+"""
+
+# trigram 색인으로 찾을 수 있는 최소 검색어 길이
+MIN_FTS_TERM_LENGTH = 3
+
+
+def db_file_from_config(config: Optional[Dict]) -> str:
+    """설정 파일의 storage.db_file 값을 반환합니다."""
+    return (config or {}).get('storage', {}).get('db_file', DEFAULT_DB_FILE)
+
+
+def bloom_from_config(config: Optional[Dict]) -> Optional[Dict]:
+    """설정 파일의 storage.bloom 항목을 반환합니다."""
+    return (config or {}).get('storage', {}).get('bloom')
+
+
+class NewsStore:
+    """SQLite 기반 뉴스 저장소"""
+
+    def __init__(self, db_file: str = DEFAULT_DB_FILE, bloom: Optional[Dict] = None):
+        """
+        Args:
+            db_file: 데이터베이스 파일 경로
+            bloom: 본 링크 확인용 블룸 필터 설정 (config.json의 storage.bloom, None이면 사용 안 함)
+        """
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(_SCHEMA)
+        self.fts_enabled = self._init_fts()
+
+        self.seen_filter: Optional[SeenFilter] = None
+        if bloom and bloom.get('enabled', False):
+            self.seen_filter = self._open_seen_filter(bloom)
+
+    def _init_fts(self) -> bool:
+        """
+        전문 검색 인덱스를 준비합니다.
+
+        SQLite에 FTS5(trigram)가 없으면 LIKE 검색으로 대체합니다.
+        기존 데이터베이스에 인덱스를 처음 만드는 경우 기존 기사로 한 번 채웁니다.
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'"
+        ).fetchone()
+        try:
+            self.conn.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            return False
+
+        if not exists:
+            with self.conn:
+                self.conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+        return True
+
+    def _open_seen_filter(self, bloom: Dict) -> SeenFilter:
+        """
+        블룸 필터를 열고 저장소와 맞춥니다.
+
+        필터가 없거나, 설계 용량을 넘었거나, rebuild_days보다 오래되었으면 다시 만들고,
+        다른 프로세스가 그동안 저장한 기사(id가 필터의 마지막 id보다 큰 기사)는 이어서 반영합니다.
+        """
+        path = bloom.get('file') or self.db_file + '.bloom'
+        rebuild_seconds = bloom.get('rebuild_days', 30) * 86400
+
+        seen_filter = open_seen_filter(path)
+        if seen_filter is not None and (
+                seen_filter.overfull or time.time() - seen_filter.built_at > rebuild_seconds):
+            seen_filter.close()
+            seen_filter = None
+
+        if seen_filter is None:
+            return self.rebuild_seen_filter(path, bloom.get('capacity', 1000000), bloom.get('fp_rate', 0.01))
+
+        rows = self.conn.execute(
+            "SELECT id, canonical_link FROM articles WHERE id > ? ORDER BY id", (seen_filter.last_id,)
+        ).fetchall()
+        if rows:
+            seen_filter.add_many(row[1] for row in rows)
+            seen_filter.set_last_id(rows[-1][0])
+        return seen_filter
+
+    def rebuild_seen_filter(self, path: str, capacity: int, fp_rate: float = 0.01) -> SeenFilter:
+        """
+        저장된 모든 정규화 링크로 블룸 필터를 새로 만듭니다.
+
+        임시 파일에 만든 뒤 교체하므로, 도중에 중단되어도 기존 필터 파일은 그대로 남습니다.
+
+        Args:
+            path: 필터 파일 경로
+            capacity: 설계 용량 (현재 기사 수의 2배보다 작으면 2배로 늘림)
+            fp_rate: 목표 오탐률
+
+        Returns:
+            새 필터
+        """
+        # 다시 만드는 동안 다른 프로세스는 기존 필터에 쓰지 않고 기다렸다가, 교체된 새 필터를 열어 씁니다.
+        with filter_lock(path):
+            total, last_id = self.conn.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM articles").fetchone()
+            capacity = max(capacity, total * 2)
+
+            tmp_path = path + '.tmp'
+            seen_filter = SeenFilter.create(tmp_path, capacity, fp_rate, shared=False)
+            try:
+                cursor = self.conn.execute("SELECT canonical_link FROM articles WHERE id <= ?", (last_id,))
+                while True:
+                    rows = cursor.fetchmany(10000)
+                    if not rows:
+                        break
+                    seen_filter.add_many(row[0] for row in rows)
+                seen_filter.set_last_id(last_id)
+                seen_filter.close()
+                os.replace(tmp_path, path)
+            except Exception:
+                seen_filter.close()
+                os.unlink(tmp_path)
+                raise
+
+        print(f"🧮 블룸 필터 생성: 링크 {total}개, 용량 {capacity}개 ({path})")
+        return SeenFilter(path)
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        if self.seen_filter is not None:
+            self.seen_filter.close()
+            self.seen_filter = None
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add_news(self, news_list: List[Dict], outbox: bool = False) -> int:
+        """
+        뉴스를 저장합니다. 정규화 링크가 이미 저장된 뉴스는 건너뜁니다.
+
+        Args:
+            news_list: 뉴스 리스트
+            outbox: 같은 트랜잭션에서 알림 대기열에도 넣을지 여부 (여러 노드가 함께 수집할 때 사용)
+
+        Returns:
+            새로 저장된 뉴스 개수
+        """
+        return len(self._insert(news_list, outbox))
+
+    def _insert(self, news_list: List[Dict], outbox: bool = False) -> set:
+        """
+        뉴스를 한 트랜잭션에서 저장하고, 이 호출이 실제로 추가한 정규화 링크를 반환합니다.
+
+        행마다 rowcount를 확인하므로, 다른 프로세스가 먼저 저장해 무시된 링크는 포함되지 않습니다
+        (알림 대기열에도 실제로 추가된 기사만 넣음).
+        """
+        collected_at = datetime.now().isoformat()
+        rows = [
+            (
+                (
+                    news['link'],
+                    news_key(news),
+                    news.get('source', ''),
+                    news.get('category', 'unknown'),
+                    news.get('title', ''),
+                    news.get('summary', '') or '',
+                    news.get('published', ''),
+                    published_epoch(news),
+                    collected_at
+                ),
+                news
+            )
+            for news in news_list if news.get('link')
+        ]
+        # 오래된 기사부터 넣어 id 순서가 발행일 순서를 따르도록 합니다 (검색 결과 순서에 사용).
+        rows.sort(key=lambda item: item[0][7])
+
+        inserted = {}
+        with self._lock, self.conn:
+            cursor = self.conn.cursor()
+            for row, news in rows:
+                # rowcount는 트리거(전문 검색 색인)로 바뀐 행을 세지 않으므로 이 기사가 추가되었는지를 나타냅니다.
+                cursor.execute(
+                    "INSERT OR IGNORE INTO articles "
+                    "(link, canonical_link, source, category, title, summary, published, published_ts, collected_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row
+                )
+                if cursor.rowcount == 1:
+                    inserted[row[1]] = news
+
+            if outbox and inserted:
+                # 여러 노드가 같은 기사를 동시에 저장해도 articles에 추가한 노드만 대기열에 넣으므로 기사당 한 번만 들어갑니다.
+                now = time.time()
+                outbox_rows = [
+                    (news['link'], json.dumps(news, ensure_ascii=False), now)
+                    for news in inserted.values()
+                ]
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO outbox (link, news, created_at) VALUES (?, ?, ?)",
+                    outbox_rows
+                )
+
+        # 커밋한 뒤에 필터에 반영하므로, 그 사이 다른 프로세스가 필터를 다시 만들어도 빠지는 링크가 없습니다.
+        if self.seen_filter is not None and inserted:
+            with self._lock:
+                self.seen_filter.add_many(inserted)
+                last_id = self.conn.execute("SELECT MAX(id) FROM articles").fetchone()[0]
+                self.seen_filter.set_last_id(last_id)
+        return set(inserted)
+
+    def insert_new(self, news_list: List[Dict], outbox: bool = False) -> List[Dict]:
+        """
+        저장소에 없는 뉴스만 저장하고, 새로 저장된 뉴스를 반환합니다.
+
+        Args:
+            news_list: 뉴스 리스트
+            outbox: 새 뉴스를 알림 대기열에도 넣을지 여부
+
+        Returns:
+            이 호출이 실제로 저장한 뉴스 리스트 (입력 순서, 다른 프로세스가 먼저 저장한 뉴스는 제외)
+        """
+        known = self.known_links([news_key(news) for news in news_list if news.get('link')])
+        fresh = []
+        seen = set()
+        for news in news_list:
+            key = news_key(news)
+            if news.get('link') and key not in known and key not in seen:
+                seen.add(key)
+                fresh.append(news)
+
+        inserted = self._insert(fresh, outbox=outbox)
+        return [news for news in fresh if news_key(news) in inserted]
+
+    def claim_outbox(self, owner: str, limit: int = 100, lease_seconds: float = 120) -> Tuple[str, List[Dict]]:
+        """
+        알림 대기열에서 전송할 뉴스를 가져가고 일정 시간 동안 점유합니다.
+
+        점유한 노드가 lease_seconds 안에 finish_outbox를 호출하지 못하면(중간에 종료 등)
+        다른 노드가 다시 가져갈 수 있습니다.
+
+        Args:
+            owner: 가져가는 노드 이름
+            limit: 최대 개수
+            lease_seconds: 점유 시간 (초)
+
+        Returns:
+            (점유 토큰, 뉴스 리스트)
+        """
+        token = f"{owner}:{uuid.uuid4().hex}"
+        now = time.time()
+        with self._lock, self.conn:
+            # 한 문장으로 고르고 점유하므로 여러 프로세스가 동시에 호출해도 같은 항목을 가져가지 않습니다.
+            self.conn.execute(
+                "UPDATE outbox SET state = 'claimed', owner = ?, lease_expires = ? "
+                "WHERE link IN (SELECT link FROM outbox "
+                "WHERE state = 'pending' OR (state = 'claimed' AND lease_expires < ?) "
+                "ORDER BY created_at LIMIT ?)",
+                (token, now + lease_seconds, now, limit)
+            )
+            rows = self.conn.execute("SELECT news FROM outbox WHERE owner = ?", (token,)).fetchall()
+        return token, [json.loads(row[0]) for row in rows]
+
+    def finish_outbox(self, token: str, links: List[str], state: str = 'sent') -> int:
+        """
+        점유한 대기열 항목의 처리를 마칩니다.
+
+        Args:
+            token: claim_outbox가 반환한 점유 토큰
+            links: 처리한 링크 목록
+            state: 'sent'(전송), 'skipped'(필터 제외) 또는 'pending'(다시 대기열로)
+
+        Returns:
+            반영된 항목 수 (점유 시간이 지나 다른 노드가 가져간 항목은 제외)
+        """
+        owner = None if state == 'pending' else token
+        updated = 0
+        with self._lock, self.conn:
+            for start in range(0, len(links), 500):
+                chunk = links[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                updated += self.conn.execute(
+                    f"UPDATE outbox SET state = ?, owner = ? WHERE owner = ? AND link IN ({placeholders})",
+                    [state, owner, token] + chunk
+                ).rowcount
+            self.conn.execute(
+                "DELETE FROM outbox WHERE state IN ('sent', 'skipped') AND created_at < ?",
+                (time.time() - OUTBOX_RETENTION,)
+            )
+        return updated
+
+    def count(self, category: Optional[str] = None, source: Optional[str] = None) -> int:
+        """조건에 맞는 기사 수를 반환합니다."""
+        where, params = self._filters(category, source)
+        with self._lock:
+            row = self.conn.execute(f"SELECT COUNT(*) FROM articles{where}", params).fetchone()
+        return row[0]
+
+    def fetch_page(self, cursor: Optional[Tuple[float, int]] = None, limit: int = 100,
+                   category: Optional[str] = None, source: Optional[str] = None) -> List[Dict]:
+        """
+        최신순으로 한 페이지를 읽어옵니다.
+
+        OFFSET 대신 마지막 행의 (published_ts, id)를 커서로 사용하므로
+        뒤쪽 페이지도 일정한 시간에 조회됩니다.
+
+        Args:
+            cursor: 이전 페이지 마지막 행의 (published_ts, id) (None이면 첫 페이지)
+            limit: 페이지 크기
+            category: 카테고리 필터
+            source: 소스 필터
+
+        Returns:
+            뉴스 리스트 (각 항목에 id, published_ts 포함)
+        """
+        where, params = self._filters(category, source)
+        if cursor is not None:
+            where += (' AND ' if where else ' WHERE ') + '(published_ts, id) < (?, ?)'
+            params += list(cursor)
+
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT * FROM articles{where} ORDER BY published_ts DESC, id DESC LIMIT ?",
+                params + [limit]
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def known_links(self, links: List[str]) -> set:
+        """
+        이미 저장된 정규화 링크만 골라 반환합니다.
+
+        Args:
+            links: 확인할 정규화 링크 목록 (news_key로 만든 값)
+
+        Returns:
+            저장소에 있는 링크 집합
+        """
+        known = set()
+        links = list(links)
+        with self._lock:
+            # 블룸 필터가 "없다"고 답한 링크는 확실히 새 링크이므로 조회하지 않습니다.
+            if self.seen_filter is not None:
+                self.seen_filter.refresh()
+                total = len(links)
+                links = [link for link in links if link in self.seen_filter]
+                metrics.incr('news_seen_filter_total', total - len(links), outcome='negative')
+                metrics.incr('news_seen_filter_total', len(links), outcome='maybe')
+
+            # SQLite 바인딩 변수 개수 제한을 넘지 않도록 나눠서 조회합니다.
+            for start in range(0, len(links), 500):
+                chunk = links[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f"SELECT canonical_link FROM articles WHERE canonical_link IN ({placeholders})", chunk
+                ).fetchall()
+                known.update(row[0] for row in rows)
+        return known
+
+    def get(self, article_id: int) -> Optional[Dict]:
+        """id로 기사 하나를 읽어옵니다."""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM articles WHERE id = ?", (article_id,)).fetchone()
+        return dict(row) if row else None
+
+    def last_id(self) -> int:
+        """
+        마지막으로 저장된 기사의 id를 반환합니다.
+
+        기사는 추가만 되므로, 이 값이 같으면 저장소 내용도 같습니다 (응답 캐시 검증에 사용).
+        """
+        with self._lock:
+            row = self.conn.execute("SELECT MAX(id) FROM articles").fetchone()
+        return row[0] or 0
+
+    def search(self, query: str, limit: int = 50,
+               category: Optional[str] = None, source: Optional[str] = None) -> List[Dict]:
+        """
+        제목과 요약에서 검색어를 모두 포함하는 기사를 찾습니다.
+
+        결과는 최근에 저장된 기사부터 limit개를 고른 뒤 발행일 최신순으로 정렬합니다.
+        색인을 최신 항목부터 훑다가 limit개를 채우면 멈추므로, 흔한 검색어도 빠르게 끝납니다.
+
+        Args:
+            query: 공백으로 구분된 검색어
+            limit: 최대 결과 수
+            category: 카테고리 필터
+            source: 소스 필터
+
+        Returns:
+            뉴스 리스트 (발행일 최신순)
+        """
+        terms = [term for term in query.split() if term]
+        if not terms:
+            return []
+
+        where, params = self._filters(category, source, prefix='a.')
+        clauses = [where[len(' WHERE '):]] if where else []
+
+        # 3글자 이상은 trigram 색인으로, 짧은 검색어는 LIKE로 찾습니다.
+        fts_terms = [t for t in terms if self.fts_enabled and len(t) >= MIN_FTS_TERM_LENGTH]
+        like_terms = [t for t in terms if t not in fts_terms]
+
+        for term in like_terms:
+            pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            clauses.append("(a.title LIKE ? ESCAPE '\\' OR a.summary LIKE ? ESCAPE '\\')")
+            params += [pattern, pattern]
+
+        if fts_terms:
+            match = ' AND '.join('"' + t.replace('"', '""') + '"' for t in fts_terms)
+            sql = ("SELECT a.* FROM articles_fts f JOIN articles a ON a.id = f.rowid "
+                   "WHERE articles_fts MATCH ?")
+            params = [match] + params
+            if clauses:
+                sql += ' AND ' + ' AND '.join(clauses)
+            sql += " ORDER BY f.rowid DESC LIMIT ?"
+        else:
+            sql = f"SELECT a.* FROM articles a WHERE {' AND '.join(clauses)} ORDER BY a.id DESC LIMIT ?"
+
+        with self._lock:
+            rows = self.conn.execute(sql, params + [limit]).fetchall()
+
+        results = [dict(row) for row in rows]
+        results.sort(key=lambda news: (news['published_ts'], news['id']), reverse=True)
+        return results
+
+    def get_meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """메타 정보를 읽어옵니다."""
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key: str, value: str):
+        """메타 정보를 저장합니다."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value)
+            )
+
+    def import_json(self, json_file: str = 'collected_news.json') -> int:
+        """
+        collected_news.json의 내용을 저장소로 가져옵니다.
+
+        같은 파일을 여러 번 가져오지 않도록 파일 수정 시각을 기록해 둡니다.
+
+        Args:
+            json_file: 가져올 JSON 파일 경로
+
+        Returns:
+            새로 저장된 뉴스 개수
+        """
+        if not os.path.exists(json_file):
+            return 0
+
+        mtime = str(os.path.getmtime(json_file))
+        if self.get_meta(f'imported:{json_file}') == mtime:
+            return 0
+
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        added = self.add_news(data.get('news', []))
+        self.set_meta(f'imported:{json_file}', mtime)
+        if data.get('collected_at'):
+            self.set_meta('collected_at', data['collected_at'])
+        return added
+
+    @staticmethod
+    def _filters(category: Optional[str], source: Optional[str], prefix: str = '') -> Tuple[str, list]:
+        """WHERE 절과 인자를 만듭니다."""
+        clauses = []
+        params = []
+        if category:
+            clauses.append(f'{prefix}category = ?')
+            params.append(category)
+        if source:
+            clauses.append(f'{prefix}source = ?')
+            params.append(source)
+        where = (' WHERE ' + ' AND '.join(clauses)) if clauses else ''
+        return where, params
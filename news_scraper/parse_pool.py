@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+멀티 프로세스 파싱 풀
+BeautifulSoup 파싱은 CPU 작업이라 GIL에 묶이므로,
+원본 응답 바이트를 프로세스 풀로 보내 병렬로 파싱합니다.
+
+워커의 계측 값은 워커 프로세스의 싱크로 나가지 않고 결과와 함께 부모로 돌아와
+부모의 계측 객체에 다시 기록되며, 파싱 실패는 오류 메시지로 돌려주어
+부모가 실패한 소스로 처리(체크포인트에 기록하지 않음)할 수 있게 합니다.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
+
+# 프로세스 간 전달 크기를 줄이기 위해 뉴스 항목을 튜플로 주고받습니다.
+NEWS_FIELDS = ('source', 'title', 'link', 'summary', 'published', 'category')
+
+
+def _warm_up_worker():
+    """워커 프로세스에서 무거운 파서 모듈을 미리 불러옵니다."""
+    import bs4  # noqa: F401
+    import dateutil.parser  # noqa: F401
+    import lxml.etree  # noqa: F401
+    import scraper  # noqa: F401
+
+
+def _ping(_index: int) -> int:
+    """워커가 떠 있는지 확인하기 위한 빈 작업"""
+    return os.getpid()
+
+
+def _parse_job(job: Tuple[Dict, bytes]) -> Tuple[List[tuple], Optional[str], List[tuple]]:
+    """
+    워커 프로세스에서 하나의 소스 본문을 파싱합니다 (프로파일 중이면 워커에서도 프로파일).
+
+    Args:
+        job: (소스 정보, 응답 본문)
+
+    Returns:
+        (튜플 형태의 뉴스 항목 리스트, 오류 메시지 또는 None, 계측 이벤트 목록)
+    """
+    from profiling import profile_worker_call
+    return profile_worker_call(_parse, job)
+
+
+def _parse(job: Tuple[Dict, bytes]) -> Tuple[List[tuple], Optional[str], List[tuple]]:
+    """
+    하나의 소스 본문을 파싱합니다.
+
+    Args:
+        job: (소스 정보, 응답 본문)
+
+    Returns:
+        (튜플 형태의 뉴스 항목 리스트, 오류 메시지 또는 None, 계측 이벤트 목록)
+    """
+    from metrics import MemorySink, metrics
+    from scraper import PARSERS
+
+    source, content = job
+    parser = PARSERS.get(source.get('type'))
+    if parser is None:
+        return [], f"지원하지 않는 소스 타입입니다: {source.get('type')}", []
+
+    # 워커가 부모에게서 물려받은 싱크 대신 메모리에 모아 부모로 돌려보냅니다.
+    sink = MemorySink()
+    metrics.clear()
+    metrics.add_sink(sink)
+    try:
+        news_list = parser(content, source)
+    except Exception as e:
+        return [], str(e), sink.events
+    finally:
+        metrics.clear()
+
+    return [tuple(news.get(field, '') for field in NEWS_FIELDS) for news in news_list], None, sink.events
+
+
+class ParsePool:
+    """피드 파싱을 위한 프로세스 풀"""
+
+    def __init__(self, workers: Optional[int] = None, chunksize: int = 1, warm: bool = False):
+        """
+        Args:
+            workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+            chunksize: 한 번에 워커로 보낼 소스 개수
+            warm: 생성 즉시 워커를 띄우고 파서를 미리 불러올지 여부
+                  (GUI처럼 한 프로세스에서 여러 번 수집할 때, 첫 수집 전에 워커를 준비해 둠)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = max(1, chunksize)
+        self._executor = None
+
+        if warm:
+            self.start()
+
+    def start(self):
+        """프로세스 풀을 시작하고 모든 워커를 미리 띄웁니다."""
+        if self._executor is not None:
+            return
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_warm_up_worker
+        )
+        # 워커 수만큼 빈 작업을 보내 프로세스 생성과 import 비용을 미리 치릅니다.
+        list(self._executor.map(_ping, range(self.workers)))
+
+    def parse_many(self, jobs: List[Tuple[Dict, bytes]]) -> List[Tuple[List[Dict], Optional[str]]]:
+        """
+        여러 소스의 본문을 병렬로 파싱합니다.
+
+        워커에서 기록된 계측 값은 현재 프로세스의 계측 객체에 다시 기록합니다.
+
+        Args:
+            jobs: (소스 정보, 응답 본문) 리스트
+
+        Returns:
+            입력 순서와 같은 소스별 (뉴스 리스트, 오류 메시지 또는 None)
+        """
+        from metrics import metrics
+
+        if not jobs:
+            return []
+
+        self.start()
+        results = []
+        for records, error, events in self._executor.map(_parse_job, jobs, chunksize=self.chunksize):
+            metrics.replay(events)
+            results.append(([dict(zip(NEWS_FIELDS, record)) for record in records], error))
+        return results
+
+    def close(self):
+        """프로세스 풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def pool_from_config(config: Optional[Dict], warm: bool = False) -> Optional[ParsePool]:
+    """
+    설정 파일의 scraper.parse_workers/parse_chunksize로 파싱 풀을 만듭니다.
+
+    Args:
+        config: 전체 설정 딕셔너리
+        warm: 워커를 바로 띄울지 여부
+
+    Returns:
+        파싱 풀 (parse_workers가 0 이하이면 None)
+    """
+    scraper_config = (config or {}).get('scraper', {})
+    if scraper_config.get('parse_workers', 0) <= 0:
+        return None
+
+    return ParsePool(
+        workers=scraper_config['parse_workers'],
+        chunksize=scraper_config.get('parse_chunksize', 1),
+        warm=warm
+    )
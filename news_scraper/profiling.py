@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+수집 실행 프로파일링 모듈
+한 번의 수집 실행을 cProfile 또는 샘플링 프로파일러로 감싸고,
+소스/단계별 소요 시간과 라이브러리(BeautifulSoup, dateutil, 네트워크 등)별
+시간 분포를 함께 기록합니다.
+
+cProfile 모드는 실행 중에 새로 시작되는 스레드(수집 스레드 풀 등)도 함께 기록하고,
+파싱 프로세스 풀의 워커는 각자 프로파일한 결과를 끝날 때 합칩니다 (pstats.add).
+샘플링 모드는 대기(wait/select) 중인 스레드의 샘플을 제외합니다.
+
+출력 파일 (profiles/ 아래, 최근 N개만 보관):
+    <실행ID>.prof        cProfile 결과 (snakeviz, flameprof 등으로 확인)
+    <실행ID>.collapsed   샘플링 결과 (flamegraph.pl, speedscope 호환 collapsed stack)
+    <실행ID>.txt         소스/단계별 시간과 라이브러리별 시간 요약
+"""
+
+import glob
+import io
+import itertools
+import marshal
+import os
+import shutil
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Optional
+
+from atomic_file import atomic_write
+from metrics import metrics, MemorySink
+
+PROFILE_MODES = ('cprofile', 'sampling')
+
+# 파싱 프로세스 풀 워커가 프로파일 결과를 남길 디렉토리 (프로파일 중에만 설정됨, 자식 프로세스에 상속)
+WORKER_PROFILE_ENV = 'NEWS_SCRAPER_WORKER_PROFILE_DIR'
+
+# 같은 초에 시작한 실행끼리 실행 ID가 겹치지 않도록 붙이는 번호
+_run_counter = itertools.count(1)
+
+# 샘플링에서 제외할 대기 프레임 (파일 경로 끝, 함수 이름)
+IDLE_FRAMES = (
+    ('threading.py', 'wait'),
+    ('threading.py', '_wait_for_tstate_lock'),
+    ('selectors.py', 'select'),
+    ('concurrent/futures/thread.py', '_worker'),
+    ('tkinter/__init__.py', 'mainloop'),
+)
+
+# 파일 경로에 포함된 이름으로 프레임을 라이브러리 그룹에 분류합니다.
+LIBRARY_GROUPS = (
+    ('BeautifulSoup', ('bs4', 'soupsieve', 'lxml', 'html5lib')),
+    ('dateutil', ('dateutil',)),
+    ('네트워크', ('requests', 'urllib3', 'http', 'socket', 'ssl', 'selectors')),
+    ('json', ('json',)),
+)
+
+
+def classify_frame(location: str) -> str:
+    """프레임의 파일 경로(또는 내장 함수 이름)로 라이브러리 그룹을 판별합니다."""
+    path = location.replace('\\', '/')
+    for group, markers in LIBRARY_GROUPS:
+        for marker in markers:
+            if f'/{marker}/' in path or path.endswith(f'/{marker}.py'):
+                return group
+    if '_socket' in path or '_ssl' in path:
+        return '네트워크'
+    return '기타'
+
+
+def _is_idle(code) -> bool:
+    """스레드의 가장 안쪽 프레임이 대기 중인 프레임인지 확인합니다."""
+    filename = code.co_filename.replace('\\', '/')
+    return any(code.co_name == name and filename.endswith(suffix) for suffix, name in IDLE_FRAMES)
+
+
+_worker_profile = None
+
+
+def profile_worker_call(func, *args):
+    """
+    파싱 워커 프로세스에서 작업 하나를 실행합니다.
+    프로파일 중이면 프로세스별 cProfile에 누적하고 결과 파일을 갱신합니다.
+
+    Args:
+        func: 실행할 함수
+        *args: 함수 인자
+
+    Returns:
+        함수의 반환값
+    """
+    global _worker_profile
+    profile_dir = os.environ.get(WORKER_PROFILE_ENV)
+    if not profile_dir:
+        return func(*args)
+
+    import cProfile
+    if _worker_profile is None:
+        _worker_profile = cProfile.Profile()
+    _worker_profile.enable()
+    try:
+        return func(*args)
+    finally:
+        _worker_profile.disable()
+        # 워커 프로세스는 종료 처리 없이 끝나므로 작업마다 누적 결과를 덮어씁니다.
+        path = os.path.join(profile_dir, f"{os.getpid()}.prof")
+        _worker_profile.create_stats()
+        atomic_write(path, marshal.dumps(_worker_profile.stats))
+
+
+class _Sampler:
+    """일정 간격으로 모든 스레드의 스택을 수집하는 샘플링 프로파일러"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiler-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or _is_idle(frame.f_code):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, f'thread-{thread_id}'))
+                self.stacks[';'.join(reversed(stack))] += 1
+
+
+class RunProfiler:
+    """수집 실행 한 번을 감싸는 프로파일러 (with 문으로 사용)"""
+
+    def __init__(self, mode: str = 'cprofile', output_dir: str = 'profiles',
+                 keep: int = 10, interval: float = 0.005, label: str = 'run'):
+        """
+        Args:
+            mode: 'cprofile' 또는 'sampling'
+            output_dir: 프로파일 결과 저장 디렉토리
+            keep: 보관할 최근 프로파일 개수
+            interval: 샘플링 간격 (초, sampling 모드)
+            label: 실행 구분용 이름 (예: 'cli', 'gui')
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"지원하지 않는 프로파일 모드: {mode}")
+
+        self.mode = mode
+        self.output_dir = output_dir
+        self.keep = max(1, keep)
+        self.interval = interval
+        self.run_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_run_counter)}-{label}"
+        self.summary_file: Optional[str] = None
+
+        self._profile = None
+        self._thread_profiles = []
+        self._thread_lock = threading.Lock()
+        self._worker_dir: Optional[str] = None
+        self._sampler = None
+        self._sink = MemorySink()
+        self._started = 0.0
+
+    def __enter__(self):
+        # 소스/단계별 시간은 기존 계측 값을 메모리 싱크로 받아 집계합니다.
+        metrics.add_sink(self._sink)
+        self._started = time.perf_counter()
+
+        if self.mode == 'cprofile':
+            import cProfile
+            self._profile = cProfile.Profile()
+            # Python 3.12부터 cProfile은 모든 스레드를 기록하므로, 이전 버전만 새 스레드마다 따로 켭니다.
+            if sys.version_info < (3, 12):
+                threading.setprofile(self._profile_thread)
+            self._worker_dir = os.path.join(self.output_dir, self.run_id + '.workers')
+            os.makedirs(self._worker_dir, exist_ok=True)
+            os.environ[WORKER_PROFILE_ENV] = os.path.abspath(self._worker_dir)
+            self._profile.enable()
+        else:
+            self._sampler = _Sampler(self.interval)
+            self._sampler.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._profile is not None:
+            self._profile.disable()
+            threading.setprofile(None)
+            os.environ.pop(WORKER_PROFILE_ENV, None)
+        if self._sampler is not None:
+            self._sampler.stop()
+
+        elapsed = time.perf_counter() - self._started
+        metrics.remove_sink(self._sink)
+
+        try:
+            self._write(elapsed)
+            self._prune()
+        except Exception as e:
+            print(f"⚠️  프로파일 저장 실패: {str(e)}")
+        return False
+
+    def _profile_thread(self, frame, event, arg):
+        """새 스레드의 첫 이벤트에서 그 스레드 전용 cProfile을 켭니다 (threading.setprofile 훅)."""
+        import cProfile
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        with self._thread_lock:
+            self._thread_profiles.append(profile)
+        profile.enable()
+
+    def _merged_stats(self):
+        """호출 스레드, 다른 스레드, 파싱 워커 프로세스의 cProfile 결과를 하나로 합칩니다."""
+        import pstats
+        stats = pstats.Stats(self._profile, stream=io.StringIO())
+        with self._thread_lock:
+            thread_profiles = list(self._thread_profiles)
+        for profile in thread_profiles:
+            profile.disable()
+            stats.add(profile)
+        if self._worker_dir:
+            for path in glob.glob(os.path.join(self._worker_dir, '*.prof')):
+                stats.add(path)
+            shutil.rmtree(self._worker_dir, ignore_errors=True)
+        return stats
+
+    def _write(self, elapsed: float):
+        """프로파일 결과와 요약을 파일로 저장합니다."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, self.run_id)
+
+        if self._profile is not None:
+            stats = self._merged_stats()
+            stats.dump_stats(base + '.prof')
+            groups = self._cprofile_groups(stats)
+        else:
+            with open(base + '.collapsed', 'w', encoding='utf-8') as f:
+                for stack, count in self._sampler.stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            groups = self._sampling_groups()
+
+        self.summary_file = base + '.txt'
+        with open(self.summary_file, 'w', encoding='utf-8') as f:
+            f.write(self.render_summary(elapsed, groups))
+
+        print(f"🔬 프로파일 저장: {base}.* (총 {elapsed:.2f}초)")
+
+    def _cprofile_groups(self, stats) -> Dict[str, float]:
+        """cProfile의 함수별 자체 시간(tottime)을 라이브러리 그룹별로 합산합니다."""
+        groups = Counter()
+        for (filename, _, name), (_, _, tottime, _, _) in stats.stats.items():
+            groups[classify_frame(filename if filename != '~' else name)] += tottime
+        return dict(groups)
+
+    def _sampling_groups(self) -> Dict[str, float]:
+        """샘플의 최상단 프레임을 라이브러리 그룹별로 집계해 시간으로 환산합니다."""
+        groups = Counter()
+        for stack, count in self._sampler.stacks.items():
+            leaf = stack.rsplit(';', 1)[-1]
+            filename = leaf[leaf.find('(') + 1:leaf.rfind(':')]
+            groups[classify_frame(filename)] += count * self.interval
+        return dict(groups)
+
+    def render_summary(self, elapsed: float, groups: Dict[str, float]) -> str:
+        """소스/단계별 시간과 라이브러리별 시간을 사람이 읽기 쉬운 표로 만듭니다."""
+        lines = [
+            f"프로파일 실행: {self.run_id} (모드: {self.mode})",
+            f"총 소요 시간: {elapsed:.3f}초",
+            "",
+            "[소스/단계별 시간]",
+        ]
+
+        per_source = {}
+        for kind, name, value, labels in self._sink.events:
+            if kind != 'summary' or not name.endswith('_seconds'):
+                continue
+            stage = name.replace('news_', '').replace('_seconds', '')
+            target = labels.get('source') or labels.get('method') or '-'
+            key = (target, stage)
+            per_source[key] = per_source.get(key, 0.0) + value
+
+        for (target, stage), seconds in sorted(per_source.items(), key=lambda x: x[1], reverse=True):
+            lines.append(f"  {target:<24} {stage:<14} {seconds:>9.3f}초")
+        if not per_source:
+            lines.append("  (기록된 단계 없음)")
+
+        lines += ["", "[라이브러리별 시간]"]
+        total = sum(groups.values()) or 1.0
+        for group, seconds in sorted(groups.items(), key=lambda x: x[1], reverse=True):
+            lines.append(f"  {group:<16} {seconds:>9.3f}초 ({seconds / total * 100:5.1f}%)")
+
+        return '\n'.join(lines) + '\n'
+
+    def _prune(self):
+        """최근 keep개 실행의 프로파일만 남기고 나머지는 삭제합니다."""
+        run_ids = sorted({
+            os.path.splitext(os.path.basename(path))[0]
+            for path in glob.glob(os.path.join(self.output_dir, '*.txt'))
+        })
+        for run_id in run_ids[:-self.keep]:
+            for path in glob.glob(os.path.join(self.output_dir, glob.escape(run_id) + '.*')):
+                os.remove(path)
+
+
+def create_profiler(mode: str, config: Optional[Dict] = None, label: str = 'run') -> RunProfiler:
+    """
+    설정 파일의 profiling 항목을 반영해 프로파일러를 만듭니다.
+
+    Args:
+        mode: 'cprofile' 또는 'sampling'
+        config: 전체 설정 딕셔너리
+        label: 실행 구분용 이름
+
+    Returns:
+        RunProfiler 객체
+    """
+    profiling_config = (config or {}).get('profiling', {})
+    return RunProfiler(
+        mode=mode,
+        output_dir=profiling_config.get('output_dir', 'profiles'),
+        keep=profiling_config.get('keep', 10),
+        interval=profiling_config.get('interval', 0.005),
+        label=label
+    )
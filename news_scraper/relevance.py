@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+AI 관련도 점수 및 필터링 모듈
+수집된 뉴스를 가중치 키워드(선택적으로 TF-IDF)로 점수화하고,
+소스별 기준 점수와 카테고리별 상위 N개 제한으로 알림 대상을 추립니다.
+
+키워드 검색은 모든 키워드를 묶은 정규식 하나로 뉴스당 한 번만 훑고,
+NumPy가 설치되어 있으면 출현 행렬 구성(bincount)과 점수 계산(행렬 곱)을 배열 연산으로 처리하며,
+없으면 같은 계산을 순수 Python으로 수행합니다.
+NumPy는 처음 점수를 계산할 때 불러오므로 필터가 꺼져 있으면 불러오지 않습니다.
+"""
+
+import math
+import re
+from typing import List, Dict, Optional, Tuple
+
+_numpy = None
+
+
+def _load_numpy():
+    """NumPy를 처음 필요할 때 불러옵니다 (설치되어 있지 않으면 None)."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+# 기본 키워드 가중치 (소문자 기준)
+# 영문 키워드는 단어 경계에서만, 한글 키워드는 부분 문자열로 일치합니다.
+DEFAULT_KEYWORDS = {
+    'ai': 2.0,
+    '인공지능': 3.0,
+    '생성형': 2.5,
+    'llm': 3.0,
+    '언어모델': 3.0,
+    'language model': 3.0,
+    'gpt': 2.5,
+    'chatgpt': 3.0,
+    'openai': 2.5,
+    'anthropic': 2.5,
+    'gemini': 2.0,
+    '딥러닝': 2.5,
+    'deep learning': 2.5,
+    '머신러닝': 2.5,
+    'machine learning': 2.5,
+    '에이전트': 1.5,
+    'agent': 1.5,
+    'gpu': 1.5,
+    '엔비디아': 1.5,
+    'nvidia': 1.5,
+    '반도체': 1.0,
+    '로봇': 1.0,
+    'robot': 1.0,
+}
+
+
+class RelevanceScorer:
+    """가중치 키워드 기반 AI 관련도 점수 계산기"""
+
+    def __init__(self, keywords: Optional[Dict[str, float]] = None,
+                 title_weight: float = 2.0, use_tfidf: bool = False):
+        """
+        Args:
+            keywords: 키워드 → 가중치 (None이면 DEFAULT_KEYWORDS)
+            title_weight: 제목에서 발견된 키워드의 배수
+            use_tfidf: 배치 안에서 흔한 키워드의 비중을 IDF로 낮출지 여부
+        """
+        keywords = keywords or DEFAULT_KEYWORDS
+        self.terms = [term.lower() for term in keywords]
+        self.pattern = self._compile(self.terms)
+        self.weights = [float(weight) for weight in keywords.values()]
+        self.title_weight = title_weight
+        self.use_tfidf = use_tfidf
+
+    @staticmethod
+    def _compile(terms: List[str]):
+        """
+        모든 키워드를 하나의 정규식으로 묶습니다.
+
+        텍스트를 키워드 수만큼 반복해서 훑지 않고 한 번만 훑으면 되며,
+        일치한 그룹 이름(t0, t1, ...)으로 어떤 키워드인지 구분합니다.
+        긴 키워드를 먼저 두어 'chatgpt'가 'gpt'보다 우선하도록 합니다.
+        """
+        alternatives = []
+        for index in sorted(range(len(terms)), key=lambda i: -len(terms[i])):
+            pattern = re.escape(terms[index])
+            if terms[index].isascii():
+                # 'ai'가 'said'에 걸리지 않도록 영문은 단어 경계에서만 일치
+                pattern = r'(?<![a-z0-9])' + pattern + r'(?![a-z0-9])'
+            alternatives.append(f'(?P<t{index}>{pattern})')
+        return re.compile('|'.join(alternatives))
+
+    def _occurrences(self, news_list: List[Dict]) -> Tuple[List[int], List[int], List[float]]:
+        """
+        뉴스 목록의 키워드 출현을 (뉴스 번호, 키워드 번호, 가중치) 세 개의 평행 목록으로 모읍니다.
+
+        텍스트 검색은 정규식이 뉴스당 제목/요약 한 번씩만 훑고,
+        행 단위 리스트를 만들지 않아 집계는 score()에서 한 번에 처리합니다.
+        제목 출현은 title_weight배로 반영합니다.
+        """
+        rows, cols, values = [], [], []
+        term_index = {name: int(name[1:]) for name in self.pattern.groupindex}
+        for row, news in enumerate(news_list):
+            for text, weight in ((news.get('title', ''), self.title_weight), (news.get('summary', ''), 1.0)):
+                if not text:
+                    continue
+                for match in self.pattern.finditer(text.lower()):
+                    rows.append(row)
+                    cols.append(term_index[match.lastgroup])
+                    values.append(weight)
+        return rows, cols, values
+
+    def score(self, news_list: List[Dict]) -> List[float]:
+        """
+        뉴스 목록의 관련도 점수를 한 번에 계산합니다.
+
+        점수 = Σ log(1 + 출현 횟수) × 키워드 가중치 (× IDF)
+
+        Args:
+            news_list: 뉴스 리스트
+
+        Returns:
+            뉴스별 점수 (입력 순서)
+        """
+        if not news_list:
+            return []
+
+        rows, cols, values = self._occurrences(news_list)
+        doc_count, term_count = len(news_list), len(self.terms)
+
+        np = _load_numpy()
+        if np is not None:
+            # 뉴스 × 키워드 출현 행렬을 bincount 한 번으로 만들고 점수도 행렬 곱 한 번으로 계산합니다.
+            flat = np.asarray(rows, dtype=np.int64) * term_count + np.asarray(cols, dtype=np.int64)
+            counts = np.bincount(flat, weights=np.asarray(values, dtype=np.float64),
+                                 minlength=doc_count * term_count).reshape(doc_count, term_count)
+            weights = np.asarray(self.weights, dtype=np.float64)
+            if self.use_tfidf:
+                doc_freq = np.count_nonzero(counts, axis=0)
+                weights = weights * (np.log((1 + doc_count) / (1 + doc_freq)) + 1)
+            return (np.log1p(counts) @ weights).tolist()
+
+        # 순수 Python: 출현한 키워드만 담은 뉴스별 사전으로 같은 계산을 합니다.
+        counts = [{} for _ in range(doc_count)]
+        for row, col, value in zip(rows, cols, values):
+            counts[row][col] = counts[row].get(col, 0.0) + value
+
+        weights = self.weights
+        if self.use_tfidf:
+            doc_freq = [0] * term_count
+            for row_counts in counts:
+                for col in row_counts:
+                    doc_freq[col] += 1
+            weights = [
+                weight * (math.log((1 + doc_count) / (1 + doc_freq[j])) + 1)
+                for j, weight in enumerate(weights)
+            ]
+        return [
+            sum(math.log1p(count) * weights[col] for col, count in row_counts.items())
+            for row_counts in counts
+        ]
+
+
+def filter_news(news_list: List[Dict], sources: List[Dict],
+                filter_config: Optional[Dict] = None) -> List[Dict]:
+    """
+    관련도 점수로 알림 대상 뉴스를 추립니다.
+
+    소스별 기준 점수(sources.json의 min_score, 없으면 filter.min_score) 미만은 제외하고,
+    카테고리별로 점수가 높은 top_per_category개만 남깁니다.
+    결과는 입력 순서(최신순)를 유지합니다.
+
+    Args:
+        news_list: 뉴스 리스트 (최신순)
+        sources: 뉴스 소스 설정 목록
+        filter_config: config.json의 filter 항목
+
+    Returns:
+        추려진 뉴스 리스트
+    """
+    filter_config = filter_config or {}
+    if not filter_config.get('enabled', False) or not news_list:
+        return news_list
+
+    scorer = RelevanceScorer(
+        keywords=filter_config.get('keywords'),
+        title_weight=filter_config.get('title_weight', 2.0),
+        use_tfidf=filter_config.get('use_tfidf', False)
+    )
+    scores = scorer.score(news_list)
+
+    default_min = filter_config.get('min_score', 1.0)
+    thresholds = {source['name']: source.get('min_score', default_min) for source in sources}
+    top_n = filter_config.get('top_per_category')
+
+    # 카테고리별로 (점수, 원래 위치)를 모은 뒤 상위 N개만 고릅니다.
+    by_category = {}
+    for index, (news, score) in enumerate(zip(news_list, scores)):
+        if score < thresholds.get(news.get('source'), default_min):
+            continue
+        by_category.setdefault(news.get('category', 'unknown'), []).append((score, index))
+
+    kept = []
+    for candidates in by_category.values():
+        candidates.sort(key=lambda x: (-x[0], x[1]))
+        kept.extend(index for _, index in candidates[:top_n])
+
+    kept.sort()
+    print(f"🎯 관련도 필터: {len(news_list)}개 중 {len(kept)}개 선택")
+    return [news_list[index] for index in kept]
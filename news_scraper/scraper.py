@@ -2,42 +2,568 @@
 """
 AI 뉴스 자동 수집 스크립트
 최신 AI 관련 뉴스를 여러 소스에서 수집하여 JSON 파일로 저장합니다.
+
+requests, BeautifulSoup, lxml, dateutil은 실제로 요청/파싱할 때 불러옵니다.
+이 모듈의 가벼운 함수(load_config, published_epoch 등)만 쓰는 API 서버나 피드 출력,
+인자만 확인하고 끝나는 실행은 무거운 모듈을 불러오는 시간을 쓰지 않습니다.
 """
 
+import argparse
+import contextlib
+import heapq
 import json
 import os
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as date_parser
+from itertools import islice
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
 import re
 
+from atomic_file import atomic_write_json
+from source_registry import DEFAULT_SCRAPING_MAX_NEWS, SourceConfigError, SourcePlan, SourceRegistry, compile_selectors
+from metrics import metrics, configure_metrics
+from profiling import PROFILE_MODES, create_profiler
+from transport import configure_transport, get_transport, prewarm_from_config
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# 응답 본문 최대 크기 (바이트, 소스별 max_bytes로 바꿀 수 있음)
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+
+# 응답 본문을 읽는 조각 크기 (바이트)
+CHUNK_SIZE = 64 * 1024
+
+
+def is_recent(pub_date: datetime, hours: int = 24) -> bool:
+    """
+    발행일이 최근 N시간 이내인지 확인합니다.
+
+    Args:
+        pub_date: 발행일시
+        hours: 기준 시간 (기본값: 24시간)
+
+    Returns:
+        최근 뉴스 여부
+    """
+    now = datetime.now()
+    # pub_date가 timezone-aware일 경우를 대비해 처리
+    if pub_date.tzinfo is not None:
+        from datetime import timezone
+        now = datetime.now(timezone.utc)
+
+    cutoff_time = now - timedelta(hours=hours)
+    return pub_date >= cutoff_time
+
+
+class ResponseTooLarge(IOError):
+    """응답 본문이 소스의 최대 크기(max_bytes)를 넘은 경우"""
+
+
+def iter_content(source: Dict, max_bytes: Optional[int] = None) -> Iterator[bytes]:
+    """
+    소스 URL의 응답 본문을 조각(chunk) 단위로 받아 차례로 돌려주고 요청 시간/크기/상태를 계측합니다.
+
+    gzip/deflate 응답은 받는 즉시 풀어서 돌려주며, 풀린 크기 기준으로 max_bytes를 넘으면
+    그 자리에서 연결을 끊습니다. 한 번에 메모리에 올라가는 본문은 조각 하나(CHUNK_SIZE)뿐입니다.
+
+    Args:
+        source: 뉴스 소스 정보 (max_bytes 항목이 있으면 그 값을 우선 사용)
+        max_bytes: 본문 최대 크기 (None이면 DEFAULT_MAX_BYTES)
+
+    Yields:
+        응답 본문 조각
+
+    Raises:
+        ResponseTooLarge: 본문이 최대 크기를 넘은 경우
+        requests.RequestException: 요청 실패 또는 HTTP 오류 상태
+    """
+    import requests
+
+    name = source['name']
+    limit = source.get('max_bytes') or max_bytes or DEFAULT_MAX_BYTES
+    started = time.perf_counter()
+    try:
+        response = get_transport().get(source['url'], headers=source.get('headers', DEFAULT_HEADERS),
+                                       timeout=10, stream=True)
+    except requests.RequestException:
+        metrics.incr('news_fetch_errors_total', source=name)
+        raise
+
+    metrics.incr('news_fetch_status_total', source=name, status=str(response.status_code))
+    if not response.ok:
+        response.close()
+        response.raise_for_status()
+
+    # 크기를 미리 알려주는 응답은 본문을 받기 전에 거절합니다 (압축된 크기 기준).
+    declared = response.headers.get('Content-Length', '')
+    if declared.isdigit() and int(declared) > limit:
+        response.close()
+        metrics.incr('news_fetch_aborted_total', source=name, reason='content_length')
+        raise ResponseTooLarge(f"응답 크기 {int(declared):,}바이트가 최대 {limit:,}바이트를 넘습니다.")
+
+    received = 0
+    try:
+        for chunk in response.iter_content(CHUNK_SIZE):
+            received += len(chunk)
+            if received > limit:
+                break
+            yield chunk
+    except requests.RequestException:
+        metrics.incr('news_fetch_errors_total', source=name)
+        raise
+    finally:
+        response.close()
+        metrics.incr('news_fetch_bytes_total', received, source=name)
+
+    if received > limit:
+        metrics.incr('news_fetch_aborted_total', source=name, reason='body')
+        raise ResponseTooLarge(f"응답 본문이 최대 {limit:,}바이트를 넘어 중단했습니다.")
+    metrics.observe('news_fetch_seconds', time.perf_counter() - started, source=name)
+
+
+def fetch_content(source: Dict, max_bytes: Optional[int] = None) -> bytes:
+    """
+    소스 URL에서 응답 본문 전체를 가져옵니다 (최대 max_bytes까지).
+
+    Args:
+        source: 뉴스 소스 정보
+        max_bytes: 본문 최대 크기 (None이면 소스 설정 또는 DEFAULT_MAX_BYTES)
+
+    Returns:
+        응답 본문 바이트
+
+    Raises:
+        ResponseTooLarge: 본문이 최대 크기를 넘은 경우
+        requests.RequestException: 요청 실패 또는 HTTP 오류 상태
+    """
+    return b''.join(iter_content(source, max_bytes))
+
+
+def parse_date(text: str, date_format: Optional[str] = None) -> datetime:
+    """
+    날짜 문자열을 해석합니다.
+
+    소스에 date_format(strptime 형식)이 지정되어 있으면 먼저 그 형식으로 해석하고,
+    맞지 않으면 dateutil의 범용 해석으로 넘어갑니다.
+
+    Raises:
+        ValueError, OverflowError: 해석할 수 없는 경우
+    """
+    if date_format:
+        try:
+            return datetime.strptime(text, date_format)
+        except ValueError:
+            pass
+
+    from dateutil import parser as date_parser
+    return date_parser.parse(text)
+
+
+def _local_name(element) -> str:
+    """네임스페이스를 뺀 XML 태그 이름을 반환합니다."""
+    tag = element.tag
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def _build_rss_item(source: Dict, title: str, link: str, date_text: Optional[str],
+                    description: Optional[str]) -> Optional[Dict]:
+    """
+    RSS/Atom 항목에서 꺼낸 값으로 뉴스 항목을 만듭니다 (오래된 뉴스면 None).
+
+    Args:
+        source: 뉴스 소스 정보
+        title: 제목
+        link: 링크
+        date_text: 발행일 문자열 (없으면 None)
+        description: 요약 원문 (HTML 포함 가능, 없으면 None)
+    """
+    from bs4 import BeautifulSoup
+
+    # 발행일 파싱
+    pub_date = None
+    if date_text:
+        try:
+            pub_date = parse_date(date_text, source.get('date_format'))
+        except:
+            pass
+
+    # 최근 hours_range시간(기본 24시간) 이내 뉴스만 수집
+    if pub_date and not is_recent(pub_date, source.get('hours_range', 24)):
+        metrics.incr('news_items_dropped_total', source=source['name'], reason='old')
+        return None
+
+    # 요약 추출
+    summary = ''
+    if description is not None:
+        # HTML 태그 제거
+        desc_soup = BeautifulSoup(description, 'html.parser')
+        summary = desc_soup.get_text(strip=True)[:source.get('summary_length', 200)]
+
+    return {
+        'source': source['name'],
+        'title': title,
+        'link': link,
+        'summary': summary,
+        'published': pub_date.isoformat() if pub_date else datetime.now().isoformat(),
+        'category': source.get('category', 'unknown')
+    }
+
+
+def parse_rss_content(content: bytes, source: Dict) -> List[Dict]:
+    """
+    RSS/Atom 응답 본문에서 뉴스 항목을 추출합니다.
+
+    프로세스 풀에서도 호출할 수 있도록 모듈 함수로 둡니다.
+
+    Args:
+        content: RSS XML 본문
+        source: 뉴스 소스 정보
+
+    Returns:
+        추출된 뉴스 리스트
+    """
+    from bs4 import BeautifulSoup
+
+    news_list = []
+    max_news = source.get('max_news_per_source')
+
+    # RSS XML 파싱 (Atom 피드는 entry 태그 사용)
+    soup = BeautifulSoup(content, 'xml')
+    items = soup.find_all('item') or soup.find_all('entry')
+    metrics.incr('news_items_parsed_total', len(items), source=source['name'])
+
+    for item in items:
+        try:
+            # 제목 추출
+            title_tag = item.find('title')
+            if not title_tag:
+                metrics.incr('news_items_dropped_total', source=source['name'], reason='no_title')
+                continue
+
+            # 링크 추출
+            link_tag = item.find('link')
+            if not link_tag:
+                metrics.incr('news_items_dropped_total', source=source['name'], reason='no_link')
+                continue
+
+            pub_date_tag = (item.find('pubDate') or item.find('published')
+                            or item.find('updated') or item.find('dc:date'))
+            desc_tag = item.find('description') or item.find('summary') or item.find('content:encoded')
+
+            news_item = _build_rss_item(
+                source,
+                title_tag.get_text(strip=True),
+                link_tag.get_text(strip=True) or link_tag.get('href', ''),
+                pub_date_tag.get_text(strip=True) if pub_date_tag else None,
+                desc_tag.get_text() if desc_tag else None
+            )
+            if news_item:
+                news_list.append(news_item)
+                if max_news and len(news_list) >= max_news:
+                    break
+
+        except Exception as e:
+            print(f"  ⚠️ 항목 처리 중 오류: {str(e)}")
+            metrics.incr('news_items_dropped_total', source=source['name'], reason='error')
+            continue
+
+    return news_list
+
+
+def _rss_element_to_news(item, source: Dict) -> Optional[Dict]:
+    """스트리밍 파서가 다 읽은 item/entry 요소 하나를 뉴스 항목으로 바꿉니다."""
+    children = {}
+    for child in item:
+        children.setdefault(_local_name(child), child)
+
+    title_elem = children.get('title')
+    if title_elem is None:
+        metrics.incr('news_items_dropped_total', source=source['name'], reason='no_title')
+        return None
+
+    link_elem = children.get('link')
+    if link_elem is None:
+        metrics.incr('news_items_dropped_total', source=source['name'], reason='no_link')
+        return None
+
+    date_elem = next((children[name] for name in ('pubDate', 'published', 'updated', 'date')
+                      if name in children), None)
+    desc_elem = next((children[name] for name in ('description', 'summary', 'encoded')
+                      if name in children), None)
+
+    return _build_rss_item(
+        source,
+        ''.join(title_elem.itertext()).strip(),
+        ''.join(link_elem.itertext()).strip() or link_elem.get('href', ''),
+        ''.join(date_elem.itertext()).strip() if date_elem is not None else None,
+        ''.join(desc_elem.itertext()) if desc_elem is not None else None
+    )
+
+
+def parse_rss_stream(chunks: Iterable[bytes], source: Dict) -> List[Dict]:
+    """
+    응답 본문 조각을 받는 대로 증분 파서에 넣어 RSS/Atom 뉴스 항목을 추출합니다.
+
+    item/entry 요소가 닫히는 즉시 뉴스로 바꾸고 트리에서 지우므로,
+    본문 전체나 문서 트리 전체를 메모리에 올리지 않습니다. 결과는 parse_rss_content와 같습니다.
+    max_news_per_source개를 채우면 나머지 본문은 받지 않고 연결을 닫습니다.
+
+    Args:
+        chunks: 응답 본문 조각 (iter_content의 결과)
+        source: 뉴스 소스 정보
+
+    Returns:
+        추출된 뉴스 리스트
+    """
+    from lxml import etree
+
+    news_list = []
+    max_news = source.get('max_news_per_source')
+    parsed = 0
+    parse_seconds = 0.0
+    parser = etree.XMLPullParser(events=('end',), recover=True, resolve_entities=False, no_network=True)
+
+    def drain():
+        nonlocal parsed
+        for _, element in parser.read_events():
+            if _local_name(element) not in ('item', 'entry'):
+                continue
+            parsed += 1
+            try:
+                news_item = _rss_element_to_news(element, source)
+                if news_item:
+                    news_list.append(news_item)
+            except Exception as e:
+                print(f"  ⚠️ 항목 처리 중 오류: {str(e)}")
+                metrics.incr('news_items_dropped_total', source=source['name'], reason='error')
+
+            # 처리한 항목과 앞서 남은 형제 요소를 지워 트리가 커지지 않게 합니다.
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    for chunk in chunks:
+        started = time.perf_counter()
+        parser.feed(chunk)
+        drain()
+        parse_seconds += time.perf_counter() - started
+        if max_news and len(news_list) >= max_news:
+            break
+    else:
+        started = time.perf_counter()
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            pass
+        drain()
+        parse_seconds += time.perf_counter() - started
+
+    # 필요한 만큼 읽었으면 남은 본문을 받지 않도록 요청을 닫습니다.
+    close = getattr(chunks, 'close', None)
+    if close is not None:
+        close()
+
+    metrics.incr('news_items_parsed_total', parsed, source=source['name'])
+    metrics.observe('news_parse_seconds', parse_seconds, source=source['name'])
+    return news_list[:max_news] if max_news else news_list
+
+
+def parse_scraping_content(content: bytes, source: Dict, selectors: Optional[Dict] = None) -> List[Dict]:
+    """
+    웹 페이지 본문에서 선택자로 뉴스 항목을 추출합니다.
+
+    Args:
+        content: HTML 본문 (UTF-8)
+        source: 뉴스 소스 정보
+        selectors: 미리 컴파일한 선택자 (None이면 source의 selectors를 컴파일)
+
+    Returns:
+        추출된 뉴스 리스트
+    """
+    from bs4 import BeautifulSoup
+
+    news_list = []
+    started = time.perf_counter()
+
+    soup = BeautifulSoup(content.decode('utf-8', errors='replace'), 'html.parser')
+    if selectors is None:
+        selectors = compile_selectors(source.get('selectors'))
+
+    # 기사 목록 추출 (최대 max_news_per_source개)
+    articles = selectors['article'].select(soup, limit=source.get('max_news_per_source', DEFAULT_SCRAPING_MAX_NEWS))
+    metrics.incr('news_items_parsed_total', len(articles), source=source['name'])
+
+    for article in articles:
+        try:
+            # 제목 추출
+            title_elem = selectors['title'].select_one(article)
+            if not title_elem:
+                metrics.incr('news_items_dropped_total', source=source['name'], reason='no_title')
+                continue
+            title = title_elem.get_text(strip=True)
+
+            # 링크 추출
+            link_elem = selectors['link'].select_one(article)
+            if not link_elem:
+                metrics.incr('news_items_dropped_total', source=source['name'], reason='no_link')
+                continue
+            link = link_elem.get('href', '')
+
+            # 상대 경로를 절대 경로로 변환
+            if link.startswith('/'):
+                from urllib.parse import urljoin
+                link = urljoin(source['url'], link)
+
+            # 날짜 추출 (선택적)
+            date_elem = selectors['date'].select_one(article)
+            pub_date = datetime.now()
+            if date_elem:
+                try:
+                    pub_date = parse_date(date_elem.get_text(strip=True), source.get('date_format'))
+                except:
+                    pass
+
+            news_item = {
+                'source': source['name'],
+                'title': title,
+                'link': link,
+                'summary': '',
+                'published': pub_date.isoformat(),
+                'category': source.get('category', 'unknown')
+            }
+
+            news_list.append(news_item)
+
+        except Exception as e:
+            print(f"  ⚠️ 항목 처리 중 오류: {str(e)}")
+            metrics.incr('news_items_dropped_total', source=source['name'], reason='error')
+            continue
+
+    metrics.observe('news_parse_seconds', time.perf_counter() - started, source=source['name'])
+    return news_list
+
+
+# 소스 타입별 파서 (응답 본문 바이트 → 뉴스 리스트, 프로세스 풀에서 사용)
+PARSERS = {
+    'rss': parse_rss_content,
+    'scraping': parse_scraping_content,
+}
+
+# 소스 타입별 수집 방법: (본문을 받는 함수, 받은 본문의 파서, 진행 표시 문구)
+# SourcePlan이 만들어질 때 골라 두므로, 수집할 때는 타입을 다시 확인하지 않습니다.
+# RSS는 본문을 받는 대로 증분 파싱하고, 웹 스크래핑은 본문 전체를 받은 뒤 파싱합니다.
+SOURCE_HANDLERS = {
+    'rss': (iter_content, parse_rss_stream, ('📡', 'RSS 수집')),
+    'scraping': (fetch_content, parse_scraping_content, ('🌐', '웹 스크래핑')),
+}
+
+
+def published_epoch(news: Dict) -> float:
+    """
+    뉴스 항목의 발행일을 UTC epoch 초로 변환합니다.
+
+    서로 다른 타임존 오프셋이 섞인 ISO 문자열도 같은 기준으로 비교할 수 있게 합니다.
+    타임존 정보가 없는 값은 로컬 시간으로 간주합니다.
+
+    Args:
+        news: 뉴스 항목
+
+    Returns:
+        epoch 초 (파싱 불가 시 0.0)
+    """
+    value = news.get('published', '')
+    if not value:
+        return 0.0
+
+    try:
+        pub_date = datetime.fromisoformat(value)
+    except ValueError:
+        from dateutil import parser as date_parser
+        try:
+            pub_date = date_parser.parse(value)
+        except (ValueError, OverflowError):
+            return 0.0
+
+    return pub_date.timestamp()
+
+
+def merge_news_streams(streams: Iterable[List[Dict]], limit: Optional[int] = None) -> List[Dict]:
+    """
+    소스별 뉴스 목록을 발행일 기준 최신순으로 병합합니다.
+
+    각 목록은 보통 이미 최신순이므로 개별 정렬은 O(n)에 끝나고,
+    k개 목록의 병합은 힙을 이용해 O(n log k)로 처리합니다.
+
+    Args:
+        streams: 소스별 뉴스 리스트들
+        limit: 상위 N개만 반환 (None이면 전체)
+
+    Returns:
+        최신순으로 병합된 뉴스 리스트
+    """
+    keyed_streams = []
+    for stream in streams:
+        keyed = [(published_epoch(news), news) for news in stream]
+        keyed.sort(key=itemgetter(0), reverse=True)
+        keyed_streams.append(keyed)
+
+    merged = heapq.merge(*keyed_streams, key=itemgetter(0), reverse=True)
+    if limit is not None:
+        merged = islice(merged, limit)
+
+    return [news for _, news in merged]
+
 
 class NewsCollector:
     """뉴스 수집 및 처리를 담당하는 클래스"""
 
-    def __init__(self, sources_file: str = 'sources.json'):
+    def __init__(self, sources_file: str = 'sources.json', parse_pool=None, link_resolver=None,
+                 source_defaults: Optional[Dict] = None):
         """
         Args:
             sources_file: 뉴스 소스 설정 파일 경로
+            parse_pool: 파싱을 맡길 ParsePool (None이면 현재 프로세스에서 파싱)
+            link_resolver: 링크를 정규화할 LinkResolver (None이면 원본 링크 그대로 사용)
+            source_defaults: 모든 소스의 기본 수집 한도 (config.json의 scraper 항목)
         """
         self.sources_file = sources_file
-        self.sources = self._load_sources()
+        self.registry = SourceRegistry(sources_file, source_defaults)
         self.collected_news = []
+        self.new_news = []
+        self.parse_pool = parse_pool
+        self.link_resolver = link_resolver
+        # 이번 실행에서 수집에 실패한 소스 이름 → 오류 메시지
+        self.errors: Dict[str, str] = {}
+
+    @property
+    def sources(self) -> List[Dict]:
+        """현재 소스 정보 목록 (sources.json이 바뀌면 refresh_sources() 뒤에 새 목록으로 바뀜)"""
+        return self.registry.sources
+
+    def refresh_sources(self) -> bool:
+        """sources.json이 바뀌었으면 다시 읽습니다 (바뀌지 않았으면 파일 정보만 확인)."""
+        return self.registry.refresh()
+
+    def plan_for(self, source: Dict) -> SourcePlan:
+        """
+        소스의 실행 계획을 찾습니다.
 
-    def _load_sources(self) -> List[Dict]:
-        """뉴스 소스 설정 파일을 읽어옵니다."""
-        try:
-            with open(self.sources_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('sources', [])
-        except FileNotFoundError:
-            print(f"❌ {self.sources_file} 파일을 찾을 수 없습니다.")
-            return []
-        except json.JSONDecodeError:
-            print(f"❌ {self.sources_file} 파일 형식이 잘못되었습니다.")
-            return []
+        레지스트리에 같은 이름의 소스가 있으면 최신 계획을 사용하고,
+        없으면(직접 만든 소스 정보 등) 그 자리에서 계획을 만듭니다.
+
+        Raises:
+            SourceConfigError: 소스 정보가 잘못된 경우
+        """
+        plan = self.registry.get(source.get('name'))
+        if plan is None:
+            plan = SourcePlan(source, self.registry.defaults)
+        return plan
 
     def is_recent(self, pub_date: datetime, hours: int = 24) -> bool:
         """
@@ -50,206 +576,218 @@ class NewsCollector:
         Returns:
             최근 뉴스 여부
         """
-        now = datetime.now()
-        # pub_date가 timezone-aware일 경우를 대비해 처리
-        if pub_date.tzinfo is not None:
-            from datetime import timezone
-            now = datetime.now(timezone.utc)
-
-        cutoff_time = now - timedelta(hours=hours)
-        return pub_date >= cutoff_time
+        return is_recent(pub_date, hours)
 
-    def collect_from_rss(self, source: Dict) -> List[Dict]:
+    def fetch_source(self, source: Dict) -> Optional[bytes]:
         """
-        RSS 피드에서 뉴스를 수집합니다.
+        소스의 원본 응답 본문을 가져옵니다.
 
         Args:
             source: 뉴스 소스 정보
 
         Returns:
-            수집된 뉴스 리스트
+            응답 본문 바이트 (실패 시 None)
         """
-        news_list = []
-
         try:
-            print(f"📡 RSS 수집 중: {source['name']}...")
+            return fetch_content(source)
+        except Exception as e:
+            print(f"  ❌ {source['name']} 요청 실패: {str(e)}")
+            self.errors[source['name']] = str(e)
+            return None
 
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+    def canonicalize_links(self, news_list: List[Dict]) -> List[Dict]:
+        """
+        link_resolver가 설정된 경우 뉴스에 중복 판별용 canonical_link를 채웁니다.
 
-            response = requests.get(source['url'], headers=headers, timeout=10)
-            response.raise_for_status()
+        link는 원본(또는 리다이렉트를 따라간 최종) 주소로 유지되며,
+        정규화에 실패하면 canonical_link 없이 원본 링크로 중복을 판별합니다.
 
-            # RSS XML 파싱
-            soup = BeautifulSoup(response.content, 'xml')
-            items = soup.find_all('item')
+        Args:
+            news_list: 뉴스 리스트
 
-            for item in items:
-                try:
-                    # 제목 추출
-                    title_tag = item.find('title')
-                    if not title_tag:
-                        continue
-                    title = title_tag.get_text(strip=True)
-
-                    # 링크 추출
-                    link_tag = item.find('link')
-                    if not link_tag:
-                        continue
-                    link = link_tag.get_text(strip=True)
-
-                    # 발행일 파싱
-                    pub_date = None
-                    pub_date_tag = item.find('pubDate') or item.find('published') or item.find('dc:date')
-                    if pub_date_tag:
-                        try:
-                            pub_date = date_parser.parse(pub_date_tag.get_text(strip=True))
-                        except:
-                            pass
-
-                    # 최근 24시간 이내 뉴스만 수집
-                    if pub_date and not self.is_recent(pub_date):
-                        continue
-
-                    # 요약 추출
-                    summary = ''
-                    desc_tag = item.find('description') or item.find('summary') or item.find('content:encoded')
-                    if desc_tag:
-                        # HTML 태그 제거
-                        desc_soup = BeautifulSoup(desc_tag.get_text(), 'html.parser')
-                        summary = desc_soup.get_text(strip=True)[:200]  # 200자까지만
-
-                    news_item = {
-                        'source': source['name'],
-                        'title': title,
-                        'link': link,
-                        'summary': summary,
-                        'published': pub_date.isoformat() if pub_date else datetime.now().isoformat(),
-                        'category': source.get('category', 'unknown')
-                    }
+        Returns:
+            canonical_link가 채워진 뉴스 리스트
+        """
+        if self.link_resolver is None or not news_list:
+            return news_list
 
-                    news_list.append(news_item)
+        try:
+            return self.link_resolver.canonicalize_news(news_list)
+        except Exception as e:
+            print(f"  ⚠️  링크 정규화 실패: {str(e)}")
+            return news_list
+
+    def collect_plan(self, plan: SourcePlan) -> List[Dict]:
+        """
+        실행 계획에 담긴 수집 방법(plan.fetch, plan.parse)으로 한 소스에서 뉴스를 수집합니다.
+
+        Args:
+            plan: 소스 실행 계획
+
+        Returns:
+            수집된 뉴스 리스트 (실패 시 빈 리스트, 오류는 errors에 기록)
+        """
+        icon, label = plan.label
+        news_list = []
+
+        try:
+            print(f"{icon} {label} 중: {plan.name}...")
 
-                except Exception as e:
-                    print(f"  ⚠️ 항목 처리 중 오류: {str(e)}")
-                    continue
+            news_list = plan.parse(plan.fetch(plan.source))
+            news_list = self.canonicalize_links(news_list)
+            metrics.incr('news_items_kept_total', len(news_list), source=plan.name)
 
             print(f"  ✅ {len(news_list)}개의 뉴스 수집 완료")
 
         except Exception as e:
-            print(f"  ❌ RSS 수집 실패: {str(e)}")
+            print(f"  ❌ {label} 실패: {str(e)}")
+            self.errors[plan.name] = str(e)
 
         return news_list
 
+    def collect_from_rss(self, source: Dict) -> List[Dict]:
+        """RSS 피드에서 뉴스를 수집합니다 (collect_source와 같음)."""
+        return self.collect_source(source)
+
     def collect_from_scraping(self, source: Dict) -> List[Dict]:
+        """웹 스크래핑으로 뉴스를 수집합니다 (collect_source와 같음)."""
+        return self.collect_source(source)
+
+    def collect_source(self, source: Dict) -> List[Dict]:
         """
-        웹 스크래핑으로 뉴스를 수집합니다.
+        소스의 실행 계획을 찾아 한 소스에서 뉴스를 수집합니다.
 
         Args:
             source: 뉴스 소스 정보
 
         Returns:
-            수집된 뉴스 리스트
+            수집된 뉴스 리스트 (소스 설정이 잘못되었으면 빈 리스트)
         """
-        news_list = []
-
         try:
-            print(f"🌐 웹 스크래핑 중: {source['name']}...")
-
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-
-            response = requests.get(source['url'], headers=headers, timeout=10)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            selectors = source.get('selectors', {})
-
-            # 기사 목록 추출
-            articles = soup.select(selectors.get('article', 'article'))
+            plan = self.plan_for(source)
+        except SourceConfigError as e:
+            print(f"  ❌ {source.get('name')} 소스 설정 오류: {str(e)}")
+            self.errors[source.get('name')] = str(e)
+            return []
 
-            for article in articles[:10]:  # 최대 10개까지만
-                try:
-                    # 제목 추출
-                    title_elem = article.select_one(selectors.get('title', 'h2'))
-                    if not title_elem:
-                        continue
-                    title = title_elem.get_text(strip=True)
-
-                    # 링크 추출
-                    link_elem = article.select_one(selectors.get('link', 'a'))
-                    if not link_elem:
-                        continue
-                    link = link_elem.get('href', '')
-
-                    # 상대 경로를 절대 경로로 변환
-                    if link.startswith('/'):
-                        from urllib.parse import urljoin
-                        link = urljoin(source['url'], link)
-
-                    # 날짜 추출 (선택적)
-                    date_elem = article.select_one(selectors.get('date', '.date'))
-                    pub_date = datetime.now()
-                    if date_elem:
-                        try:
-                            pub_date = date_parser.parse(date_elem.get_text(strip=True))
-                        except:
-                            pass
-
-                    news_item = {
-                        'source': source['name'],
-                        'title': title,
-                        'link': link,
-                        'summary': '',
-                        'published': pub_date.isoformat(),
-                        'category': source.get('category', 'unknown')
-                    }
+        return self.collect_plan(plan)
 
-                    news_list.append(news_item)
+    def iter_collect(self, max_workers: int = 8) -> Iterator[Tuple[Dict, List[Dict]]]:
+        """
+        모든 소스를 동시에 수집하면서, 끝난 소스부터 결과를 내보냅니다.
 
-                except Exception as e:
-                    print(f"  ⚠️ 항목 처리 중 오류: {str(e)}")
-                    continue
+        Args:
+            max_workers: 동시에 수집할 소스 수
 
-            print(f"  ✅ {len(news_list)}개의 뉴스 수집 완료")
+        Yields:
+            (소스 정보, 수집된 뉴스 리스트)
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
-        except Exception as e:
-            print(f"  ❌ 웹 스크래핑 실패: {str(e)}")
+        self.refresh_sources()
+        sources = self.sources
+        if not sources:
+            return
 
-        return news_list
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sources)))) as executor:
+            futures = {executor.submit(self.collect_source, source): source for source in sources}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
 
-    def collect_all(self) -> List[Dict]:
+    def collect_all(self, max_news: Optional[int] = None, journal=None,
+                    on_source: Optional[Callable[[Dict, List[Dict]], None]] = None) -> List[Dict]:
         """
         모든 소스에서 뉴스를 수집합니다.
 
+        parse_pool이 설정된 경우 응답 본문은 스레드로 동시에 받고,
+        파싱은 프로세스 풀에서 병렬로 처리합니다.
+
+        Args:
+            max_news: 최신순 상위 N개만 유지 (None이면 전체)
+            journal: 소스별 결과를 기록할 CheckpointJournal
+                     (이미 완료된 소스는 다시 수집하지 않고 기록된 결과를 사용)
+            on_source: 소스 하나의 수집이 끝날 때마다 (소스 정보, 뉴스 리스트)로 호출할 함수 (GUI 진행 표시용)
+
         Returns:
             수집된 전체 뉴스 리스트
         """
         print(f"\n🚀 뉴스 수집을 시작합니다...\n")
 
-        for source in self.sources:
-            if source.get('type') == 'rss':
-                news = self.collect_from_rss(source)
-                self.collected_news.extend(news)
-            elif source.get('type') == 'scraping':
-                news = self.collect_from_scraping(source)
-                self.collected_news.extend(news)
-            print()
-
-        # 발행일 기준으로 정렬 (최신순)
-        self.collected_news.sort(
-            key=lambda x: x.get('published', ''),
-            reverse=True
-        )
+        # sources.json이 바뀌었으면 새 목록으로 시작하고, 이번 수집 동안에는 같은 목록을 사용합니다.
+        self.refresh_sources()
+        all_sources = self.sources
+
+        streams = [self.collected_news]
+        sources = all_sources
+        if journal is not None:
+            streams.extend(journal.completed_results(all_sources))
+            sources = journal.pending(all_sources)
+
+        if self.parse_pool is not None:
+            streams.extend(self._collect_with_pool(sources, journal, on_source))
+        else:
+            for source in sources:
+                news = self.collect_source(source)
+                streams.append(news)
+                self.checkpoint(journal, source, news)
+                if on_source is not None:
+                    on_source(source, news)
+                print()
+
+        # 발행일 기준으로 병합 (최신순)
+        self.collected_news = merge_news_streams(streams, limit=max_news)
 
         return self.collected_news
 
+    def checkpoint(self, journal, source: Dict, news_list: List[Dict]):
+        """수집에 성공한 소스의 결과를 체크포인트 저널에 기록합니다 (실패한 소스는 다음에 다시 수집)."""
+        if journal is None or source['name'] in self.errors:
+            return
+        try:
+            journal.record(source, news_list)
+        except Exception as e:
+            print(f"  ⚠️  체크포인트 기록 실패: {str(e)}")
+
+    def _collect_with_pool(self, sources: Optional[List[Dict]] = None, journal=None,
+                           on_source: Optional[Callable[[Dict, List[Dict]], None]] = None) -> List[List[Dict]]:
+        """응답 본문을 동시에 받은 뒤 프로세스 풀에서 파싱합니다."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        sources = [s for s in (self.sources if sources is None else sources) if s.get('type') in PARSERS]
+        if not sources:
+            return []
+
+        print(f"📡 {len(sources)}개 소스 요청 중...")
+        with ThreadPoolExecutor(max_workers=min(8, len(sources))) as executor:
+            bodies = list(executor.map(self.fetch_source, sources))
+
+        jobs = [(source, body) for source, body in zip(sources, bodies) if body is not None]
+        print(f"⚙️  {len(jobs)}개 소스 파싱 중 (프로세스 {self.parse_pool.workers}개)...")
+        with metrics.timer('news_parse_pool_seconds', workers=str(self.parse_pool.workers)):
+            results = self.parse_pool.parse_many(jobs)
+
+        streams = []
+        for (source, _), (news, error) in zip(jobs, results):
+            if error is not None:
+                # 파싱에 실패한 소스는 체크포인트에 기록하지 않아 이어서 실행할 때 다시 수집합니다.
+                print(f"  ❌ {source['name']} 파싱 실패: {error}")
+                self.errors[source['name']] = error
+                continue
+            news = self.canonicalize_links(news)
+            metrics.incr('news_items_kept_total', len(news), source=source['name'])
+            self.checkpoint(journal, source, news)
+            streams.append(news)
+            print(f"  ✅ {source['name']}: {len(news)}개의 뉴스 수집 완료")
+            if on_source is not None:
+                on_source(source, news)
+        print()
+
+        return streams
+
     def save_to_json(self, output_file: str = 'collected_news.json'):
         """
         수집된 뉴스를 JSON 파일로 저장합니다.
+        임시 파일에 쓴 뒤 교체하므로, 다른 프로그램이 쓰는 도중의 파일을 읽지 않습니다.
 
         Args:
             output_file: 출력 파일 경로
@@ -261,8 +799,7 @@ class NewsCollector:
                 'news': self.collected_news
             }
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            atomic_write_json(output_file, data, indent=2)
 
             print(f"💾 {output_file}에 저장 완료!")
             print(f"📊 총 {len(self.collected_news)}개의 뉴스를 수집했습니다.\n")
@@ -270,6 +807,49 @@ class NewsCollector:
         except Exception as e:
             print(f"❌ 파일 저장 실패: {str(e)}")
 
+    def save_to_store(self, db_file: str = 'news.db', bloom: Optional[Dict] = None) -> int:
+        """
+        수집된 뉴스를 누적 저장소(SQLite)에 저장합니다.
+        새로 저장된 뉴스는 new_news에 담깁니다.
+
+        Args:
+            db_file: 데이터베이스 파일 경로
+            bloom: 블룸 필터 설정 (config.json의 storage.bloom)
+
+        Returns:
+            새로 저장된 뉴스 개수
+        """
+        from news_store import NewsStore
+
+        try:
+            with NewsStore(db_file, bloom) as store:
+                self.new_news = store.insert_new(self.collected_news)
+                added = len(self.new_news)
+                store.set_meta('collected_at', datetime.now().isoformat())
+
+            print(f"🗄️  {db_file}에 새 뉴스 {added}개 저장 완료!\n")
+            return added
+
+        except Exception as e:
+            print(f"❌ 저장소 저장 실패: {str(e)}")
+            return 0
+
+    def save_to_feeds(self, writer) -> Dict[str, str]:
+        """
+        수집된 뉴스를 RSS/Atom/JSON Feed 파일로 내보냅니다.
+
+        Args:
+            writer: 사용할 FeedWriter
+
+        Returns:
+            파일 이름 → ETag (실패 시 빈 딕셔너리)
+        """
+        try:
+            return writer.write(self.collected_news)
+        except Exception as e:
+            print(f"❌ 피드 저장 실패: {str(e)}")
+            return {}
+
     def print_summary(self):
         """수집 결과 요약을 출력합니다."""
         if not self.collected_news:
@@ -323,20 +903,93 @@ def load_config(config_file: str = 'config.json') -> Optional[Dict]:
         return None
 
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """커맨드라인 인자를 해석합니다."""
+    parser = argparse.ArgumentParser(description='AI 뉴스 자동 수집기')
+    parser.add_argument(
+        '--stream', action='store_true',
+        help='끝난 소스부터 새 뉴스를 바로 전송하는 스트리밍 모드로 실행합니다'
+    )
+    parser.add_argument(
+        '--worker', action='store_true',
+        help='공유 작업 대기열에서 소스를 나눠 가져오는 다중 노드 모드로 실행합니다'
+    )
+    parser.add_argument(
+        '--resume', action='store_true',
+        help='중단된 수집의 체크포인트를 이어받아 끝나지 않은 소스만 다시 수집합니다'
+    )
+    parser.add_argument('--worker-id', help='다중 노드 모드의 노드 이름 (기본값: 호스트 이름-PID)')
+    parser.add_argument('--run-id', help='다중 노드 모드의 실행 id (기본값: 현재 실행 구간)')
+    parser.add_argument(
+        '--profile', nargs='?', const='cprofile', choices=PROFILE_MODES,
+        help='수집 실행을 프로파일링합니다 (기본값: cprofile, sampling 선택 가능)'
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """메인 실행 함수"""
+    args = parse_args(argv)
+
     # 현재 스크립트의 디렉토리로 이동
     script_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(script_dir)
 
     # 설정 로드
     config = load_config()
+    configure_metrics(config)
+    configure_transport(config)
+
+    # 프로파일링 (--profile 지정 시)
+    profiler = contextlib.nullcontext()
+    if args.profile:
+        profiler = create_profiler(args.profile, config, label='cli')
+
+    with profiler:
+        if args.worker:
+            run_worker_node(config, args.worker_id, args.run_id)
+        elif args.stream:
+            run_stream(config)
+        else:
+            run(config, resume=args.resume)
 
-    # 뉴스 수집기 초기화
-    collector = NewsCollector()
+    # 계측 값 내보내기
+    metrics.flush()
 
-    # 뉴스 수집
-    collector.collect_all()
+
+def run(config: Optional[Dict], resume: bool = False):
+    """
+    뉴스 수집부터 저장, 텔레그램 알림까지 한 번의 실행을 수행합니다.
+
+    Args:
+        config: 설정 딕셔너리 (없으면 None)
+        resume: 중단된 실행의 체크포인트를 이어받을지 여부
+    """
+    # 파싱 프로세스 풀 (scraper.parse_workers > 0일 때만 사용)
+    scraper_config = (config or {}).get('scraper', {})
+    parse_pool = None
+    if scraper_config.get('parse_workers', 0) > 0:
+        from parse_pool import pool_from_config
+        parse_pool = pool_from_config(config)
+
+    # 수집하는 동안 텔레그램 API 연결을 미리 열어 둡니다 (알림 전송 시 핸드셰이크 생략)
+    prewarm_from_config(config)
+
+    # 뉴스 수집기 초기화 (links.canonicalize일 때 링크 정규화)
+    from links import resolver_from_config
+    collector = NewsCollector(parse_pool=parse_pool, link_resolver=resolver_from_config(config),
+                              source_defaults=scraper_config)
+
+    # 뉴스 수집 (checkpoint.enabled면 소스마다 체크포인트 기록)
+    from checkpoint import journal_from_config
+    journal = journal_from_config(config, resume)
+    if resume and journal is None:
+        print("⚠️  checkpoint.enabled가 꺼져 있어 --resume을 무시합니다.")
+    try:
+        collector.collect_all(journal=journal)
+    finally:
+        if parse_pool is not None:
+            parse_pool.close()
 
     # 결과 요약 출력
     collector.print_summary()
@@ -344,10 +997,32 @@ def main():
     # JSON 파일로 저장
     collector.save_to_json()
 
+    # 피드 파일로 내보내기 (feeds.enabled일 때만)
+    from feeds import feed_writer_from_config
+    feed_writer = feed_writer_from_config(config)
+    if feed_writer is not None:
+        collector.save_to_feeds(feed_writer)
+
+    # 누적 저장소에 저장
+    from news_store import db_file_from_config, bloom_from_config
+    collector.save_to_store(db_file_from_config(config), bloom_from_config(config))
+
+    # 트렌드 갱신 (trends.enabled일 때만 적용)
+    from trends import update_trends
+    trends = update_trends(config, collector.new_news)
+
+    # 관련도 필터 (filter.enabled일 때만 적용)
+    from relevance import filter_news
+    notify_news = filter_news(collector.collected_news, collector.sources, (config or {}).get('filter'))
+
+    # 브리핑 스냅숏 (분류/렌더링을 한 번만 하고 알림·통계·GUI가 함께 사용)
+    from briefing_snapshot import snapshot_file_from_config, snapshot_for
+    snapshot = snapshot_for(notify_news, snapshot_file_from_config(config))
+
     # 텔레그램 알림 전송
     if config and config.get('telegram', {}).get('enabled', False):
         try:
-            from telegram_notifier import TelegramNotifier
+            from telegram_notifier import briefing_from_config, notifier_from_config
 
             telegram_config = config['telegram']
             bot_token = telegram_config.get('bot_token', '')
@@ -356,22 +1031,32 @@ def main():
             if bot_token and chat_id and bot_token != 'YOUR_BOT_TOKEN_HERE':
                 print("📱 텔레그램 알림 전송 중...\n")
 
-                notifier = TelegramNotifier(bot_token, chat_id)
+                notifier = notifier_from_config(config)
 
                 notification_config = config.get('notification', {})
                 max_news = notification_config.get('max_news_per_message', 5)
                 include_summary = notification_config.get('include_summary', True)
 
-                # 뉴스 알림 전송
-                if notifier.send_news_notification(
-                    collector.collected_news,
-                    format_type='category',
-                    max_news=max_news,
-                    include_summary=include_summary
-                ):
+                # 뉴스 알림 전송 (실시간 브리핑이면 오늘의 브리핑 메시지를 고침)
+                briefing = briefing_from_config(notifier, config)
+                if briefing is not None:
+                    sent = briefing.update(notify_news)
+                else:
+                    sent = notifier.send_news_notification(
+                        notify_news,
+                        format_type='category',
+                        max_news=max_news,
+                        include_summary=include_summary,
+                        snapshot=snapshot
+                    )
+                if sent:
                     print("✅ 텔레그램 알림 전송 완료!\n")
                 else:
                     print("❌ 텔레그램 알림 전송 실패\n")
+
+                # 트렌드 리포트
+                if trends and config.get('trends', {}).get('report', True):
+                    notifier.send_trend_report(trends)
             else:
                 print("⚠️  텔레그램 봇 정보가 설정되지 않았습니다.\n")
 
@@ -380,6 +1065,99 @@ def main():
         except Exception as e:
             print(f"❌ 텔레그램 알림 중 오류: {str(e)}\n")
 
+    # 실행이 끝까지 완료되었으므로 체크포인트를 지웁니다.
+    if journal is not None:
+        journal.clear()
+
+
+def build_notify(config: Optional[Dict]):
+    """
+    뉴스 묶음을 텔레그램으로 보내는 함수를 만듭니다.
+
+    Args:
+        config: 설정 딕셔너리 (없으면 None)
+
+    Returns:
+        (TelegramNotifier, 전송 함수) - 텔레그램이 설정되지 않았으면 (None, None)
+    """
+    telegram_config = (config or {}).get('telegram', {})
+    bot_token = telegram_config.get('bot_token', '')
+    chat_id = telegram_config.get('chat_id', '')
+
+    if not (telegram_config.get('enabled', False) and bot_token and chat_id and bot_token != 'YOUR_BOT_TOKEN_HERE'):
+        print("⚠️  텔레그램 알림이 설정되지 않아 수집만 진행합니다.\n")
+        return None, None
+
+    from telegram_notifier import briefing_from_config, notifier_from_config
+
+    notifier = notifier_from_config(config)
+    notification_config = config.get('notification', {})
+
+    briefing = briefing_from_config(notifier, config)
+    if briefing is not None:
+        return notifier, briefing.update
+
+    def notify(batch: List[Dict]) -> bool:
+        return notifier.send_news_notification(
+            batch,
+            format_type='category',
+            max_news=notification_config.get('max_news_per_message', 5),
+            include_summary=notification_config.get('include_summary', True)
+        )
+
+    return notifier, notify
+
+
+def run_stream(config: Optional[Dict]):
+    """
+    스트리밍 모드로 실행합니다.
+    끝난 소스부터 새 뉴스를 텔레그램으로 보내고, 마지막에 전체 결과를 저장합니다.
+
+    Args:
+        config: 설정 딕셔너리 (없으면 None)
+    """
+    from streaming import run_streaming
+
+    notifier, notify = build_notify(config)
+    prewarm_from_config(config)
+
+    from links import resolver_from_config
+    collector = NewsCollector(link_resolver=resolver_from_config(config),
+                              source_defaults=(config or {}).get('scraper'))
+    run_streaming(config, notify, collector)
+    collector.save_to_json()
+
+    from feeds import feed_writer_from_config
+    feed_writer = feed_writer_from_config(config)
+    if feed_writer is not None:
+        collector.save_to_feeds(feed_writer)
+
+    # 트렌드 갱신 및 리포트
+    from trends import update_trends
+    trends = update_trends(config, collector.new_news)
+    if trends and notify is not None and config.get('trends', {}).get('report', True):
+        notifier.send_trend_report(trends)
+
+
+def run_worker_node(config: Optional[Dict], worker_id: Optional[str] = None, run_id: Optional[str] = None):
+    """
+    다중 노드 모드로 실행합니다.
+    공유 작업 대기열에서 소스를 나눠 가져와 수집하고, 공통 저장소의 알림 대기열로 전송합니다.
+
+    Args:
+        config: 설정 딕셔너리 (없으면 None)
+        worker_id: 노드 이름
+        run_id: 실행 id
+    """
+    from cluster import run_worker
+    from links import resolver_from_config
+
+    _, notify = build_notify(config)
+    prewarm_from_config(config)
+    collector = NewsCollector(link_resolver=resolver_from_config(config),
+                              source_defaults=(config or {}).get('scraper'))
+    run_worker(config, notify, collector, worker_id=worker_id, run_id=run_id)
+
 
 if __name__ == '__main__':
     main()
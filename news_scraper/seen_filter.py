@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+본 링크 확인용 블룸 필터 모듈
+뉴스 저장소 앞에 두는 파일 기반(mmap) 블룸 필터입니다.
+
+블룸 필터가 "없다"고 답한 링크는 확실히 처음 보는 링크이므로 저장소 조회를 건너뛰고,
+"있을 수도 있다"고 답한 링크만 저장소에서 다시 확인합니다.
+비트 배열은 파일에 직접 매핑되어 실행 사이에도 유지되며,
+수천만 개의 링크도 정해진 크기(1% 오탐률 기준 링크당 약 1.2바이트) 안에서 처리합니다.
+
+여러 프로세스(다중 노드 수집)가 같은 필터 파일을 쓸 수 있도록, 비트를 쓰거나 필터를 다시 만들 때는
+옆의 잠금 파일(<필터>.lock)에 fcntl.flock을 걸고, 다른 프로세스가 다시 만들어 파일이 바뀌었으면 새로 엽니다.
+fcntl이 없는 환경(Windows)에서는 잠그지 않으므로 한 프로세스에서만 사용하세요.
+"""
+
+import contextlib
+import hashlib
+import math
+import mmap
+import os
+import struct
+import time
+from typing import Iterable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# 파일 헤더: 매직, 비트 수, 해시 수, 추가된 항목 수, 반영된 마지막 기사 id, 생성 시각, 설계 용량
+_MAGIC = b'NEWSBLM1'
+_HEADER = struct.Struct('<8sQIQQdQ')
+_HEADER_SIZE = 64
+
+
+@contextlib.contextmanager
+def filter_lock(path: str):
+    """
+    필터 파일의 쓰기/재생성 잠금 (다른 프로세스와 배타적).
+
+    필터 파일은 재생성 때 교체되므로, 교체되지 않는 옆의 잠금 파일을 잠급니다.
+
+    Args:
+        path: 필터 파일 경로
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(path + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def optimal_parameters(capacity: int, fp_rate: float):
+    """
+    예상 항목 수와 목표 오탐률에 맞는 비트 수와 해시 함수 수를 계산합니다.
+
+    Args:
+        capacity: 예상 항목 수
+        fp_rate: 목표 오탐률 (예: 0.01)
+
+    Returns:
+        (비트 수, 해시 함수 수)
+    """
+    capacity = max(1, capacity)
+    fp_rate = min(max(fp_rate, 1e-9), 0.5)
+    bits = int(math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+    bits = (bits + 7) // 8 * 8
+    hashes = max(1, int(round(bits / capacity * math.log(2))))
+    return bits, hashes
+
+
+class SeenFilter:
+    """mmap 파일에 저장되는 블룸 필터"""
+
+    def __init__(self, path: str, shared: bool = True):
+        """
+        기존 필터 파일을 엽니다. 새로 만들 때는 SeenFilter.create()를 사용합니다.
+
+        Args:
+            path: 필터 파일 경로
+            shared: 다른 프로세스와 함께 쓰는 파일인지 여부 (재생성용 임시 파일은 False)
+
+        Raises:
+            ValueError: 파일 형식이 올바르지 않은 경우
+        """
+        self.path = path
+        self.shared = shared
+        self._open()
+
+    def _open(self):
+        self._file = open(self.path, 'r+b')
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"빈 필터 파일입니다: {self.path}")
+
+        magic, self.bits, self.hashes, self.count, self.last_id, self.built_at, self.capacity = \
+            _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or len(self._mmap) != _HEADER_SIZE + self.bits // 8:
+            self.close()
+            raise ValueError(f"필터 파일 형식이 잘못되었습니다: {self.path}")
+
+    def _lock(self):
+        return filter_lock(self.path) if self.shared else contextlib.nullcontext()
+
+    def refresh(self):
+        """다른 프로세스가 필터를 다시 만들어 파일이 교체되었으면 새 파일을 다시 엽니다."""
+        try:
+            inode = os.stat(self.path).st_ino
+        except FileNotFoundError:
+            return
+        if inode != self._inode:
+            self.close()
+            self._open()
+
+    @classmethod
+    def create(cls, path: str, capacity: int, fp_rate: float = 0.01, shared: bool = True) -> 'SeenFilter':
+        """
+        빈 필터 파일을 만들고 엽니다 (기존 파일은 덮어씁니다).
+
+        Args:
+            path: 필터 파일 경로
+            capacity: 예상 항목 수
+            fp_rate: 목표 오탐률
+            shared: 다른 프로세스와 함께 쓰는 파일인지 여부
+
+        Returns:
+            새 필터
+        """
+        bits, hashes = optimal_parameters(capacity, fp_rate)
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, bits, hashes, 0, 0, time.time(), capacity)
+                    .ljust(_HEADER_SIZE, b'\0'))
+            # 희소 파일로 비트 배열 공간을 확보합니다.
+            f.truncate(_HEADER_SIZE + bits // 8)
+        return cls(path, shared)
+
+    @staticmethod
+    def _hash(item: str):
+        """항목의 두 기본 해시값을 계산합니다 (이중 해싱: h1 + i × h2)."""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+    def _set_bits(self, item: str):
+        h1, h2 = self._hash(item)
+        mm, bits = self._mmap, self.bits
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % bits
+            mm[_HEADER_SIZE + (position >> 3)] |= 1 << (position & 7)
+
+    def add(self, item: str):
+        """항목을 추가합니다."""
+        self.add_many((item,))
+
+    def add_many(self, items: Iterable[str]):
+        """여러 항목을 추가합니다 (다른 프로세스의 쓰기와 겹치지 않도록 잠근 채로 기록)."""
+        with self._lock():
+            self.refresh()
+            added = 0
+            for item in items:
+                self._set_bits(item)
+                added += 1
+            self._sync_header(added=added)
+
+    def __contains__(self, item: str) -> bool:
+        """항목이 있을 수 있으면 True, 확실히 없으면 False를 반환합니다."""
+        h1, h2 = self._hash(item)
+        mm, bits = self._mmap, self.bits
+        # 처음 보는 링크는 대개 첫 한두 비트에서 판정이 끝납니다.
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % bits
+            if not mm[_HEADER_SIZE + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def set_last_id(self, last_id: int):
+        """필터에 반영된 마지막 기사 id를 기록합니다 (다른 프로세스가 기록한 값보다 작으면 유지)."""
+        with self._lock():
+            self.refresh()
+            self._sync_header(last_id=last_id)
+
+    @property
+    def overfull(self) -> bool:
+        """설계 용량을 넘어 오탐률이 목표보다 높아졌는지 여부"""
+        return self.count > self.capacity
+
+    def _sync_header(self, added: int = 0, last_id: int = 0):
+        """
+        헤더의 항목 수와 마지막 id를 갱신합니다 (잠근 상태에서 호출).
+        다른 프로세스가 기록한 값에 더하므로, 프로세스마다 가진 값으로 서로 덮어쓰지 않습니다.
+        """
+        _, _, _, count, stored_last_id, _, _ = _HEADER.unpack_from(self._mmap, 0)
+        self.count = count + added
+        self.last_id = max(stored_last_id, last_id)
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, self.bits, self.hashes, self.count,
+                          self.last_id, self.built_at, self.capacity)
+
+    def flush(self):
+        """변경 내용을 파일에 기록합니다."""
+        self._mmap.flush()
+
+    def close(self):
+        """필터 파일을 닫습니다."""
+        if self._mmap is not None and not self._mmap.closed:
+            self._mmap.flush()
+            self._mmap.close()
+        self._file.close()
+
+
+def open_seen_filter(path: str) -> Optional[SeenFilter]:
+    """
+    필터 파일을 엽니다. 없거나 손상되었으면 None을 반환합니다.
+
+    Args:
+        path: 필터 파일 경로
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        return SeenFilter(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"⚠️  블룸 필터를 다시 만듭니다: {str(e)}")
+        return None
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+뉴스 소스 레지스트리 모듈
+sources.json의 각 항목을 미리 검증하고, 수집에 필요한 값(본문을 받는 함수와 파서, 선택자, 날짜 형식,
+수집 한도)을 정리한 실행 계획(SourcePlan)으로 만들어 둡니다. 수집할 때는 계획의 fetch/parse를 그대로
+호출하므로 소스 타입이나 딕셔너리를 다시 해석하지 않습니다.
+
+    - 잘못된 항목은 이유와 함께 경고하고 건너뜁니다 (나머지 소스는 정상 수집).
+    - refresh()는 파일의 수정 시각/크기만 확인하고, 바뀐 경우에만 다시 읽습니다.
+    - 다시 읽을 때 내용이 그대로인 항목은 기존 계획을 재사용하고, 바뀐 항목만 새로 만듭니다.
+    - 계획 목록은 한 번에 통째로 교체되므로, 진행 중인 수집은 시작할 때의 계획으로 끝까지 진행합니다.
+    - 파일을 감시하지는 않습니다. 수집기가 수집을 시작할 때(collect_all, iter_collect)와
+      다중 노드 작업을 가져올 때 refresh()를 불러 확인하므로, 오래 도는 프로세스도 다음 수집부터 새 설정을 씁니다.
+
+scraper 설정(config.json)의 hours_range, max_news_per_source, summary_length는 모든 소스의 기본값이고,
+소스 항목에 같은 이름의 값이 있으면 그 값을 우선 사용합니다.
+
+사용법 (sources.json 검사):
+    python source_registry.py [sources.json]
+"""
+
+import json
+import os
+import sys
+import threading
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# 소스 항목에 지정할 수 있는 수집 한도 (이름 → 허용 타입)
+LIMIT_FIELDS = {
+    'hours_range': (int, float),
+    'max_news_per_source': (int,),
+    'summary_length': (int,),
+    'max_bytes': (int,),
+}
+
+# 웹 스크래핑 선택자 기본값
+DEFAULT_SELECTORS = {
+    'article': 'article',
+    'title': 'h2',
+    'link': 'a',
+    'date': '.date',
+}
+
+# 최대 기사 수를 지정하지 않은 웹 스크래핑 소스의 최대 기사 수
+DEFAULT_SCRAPING_MAX_NEWS = 10
+
+# 아직 한 번도 읽지 않은 상태를 나타내는 파일 서명
+_NOT_LOADED = object()
+
+
+class SourceConfigError(ValueError):
+    """소스 항목이 잘못된 경우"""
+
+
+def compile_selectors(selectors: Optional[Dict[str, str]] = None) -> Dict:
+    """
+    웹 스크래핑 선택자를 기본값과 합쳐 미리 컴파일합니다.
+
+    Args:
+        selectors: 소스 항목의 selectors (이름 → CSS 선택자)
+
+    Returns:
+        이름 → 컴파일된 선택자
+
+    Raises:
+        SourceConfigError: 해석할 수 없는 선택자가 있는 경우
+    """
+    import soupsieve
+
+    compiled = {}
+    for field, selector in {**DEFAULT_SELECTORS, **(selectors or {})}.items():
+        try:
+            compiled[field] = soupsieve.compile(selector)
+        except soupsieve.SelectorSyntaxError as e:
+            raise SourceConfigError(f"selectors.{field} 선택자를 해석할 수 없습니다: {selector!r} ({str(e).splitlines()[0]})")
+    return compiled
+
+
+def validate_source(entry: Dict) -> List[str]:
+    """
+    소스 항목 하나를 검사합니다.
+
+    Args:
+        entry: sources.json의 소스 항목
+
+    Returns:
+        문제 목록 (없으면 빈 리스트)
+    """
+    from scraper import PARSERS
+
+    if not isinstance(entry, dict):
+        return ['항목이 객체가 아닙니다']
+
+    problems = []
+    name = entry.get('name')
+    if not isinstance(name, str) or not name.strip():
+        problems.append('name이 없습니다')
+
+    source_type = entry.get('type')
+    if source_type not in PARSERS:
+        problems.append(f"지원하지 않는 type입니다: {source_type!r} (가능: {', '.join(PARSERS)})")
+
+    url = entry.get('url')
+    if not isinstance(url, str) or urlsplit(url).scheme not in ('http', 'https') or not urlsplit(url).netloc:
+        problems.append(f"url이 올바른 http(s) 주소가 아닙니다: {url!r}")
+
+    for field, types in LIMIT_FIELDS.items():
+        value = entry.get(field)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, types) or value <= 0):
+            problems.append(f"{field}는 0보다 큰 숫자여야 합니다: {value!r}")
+
+    selectors = entry.get('selectors', {})
+    if not isinstance(selectors, dict) or not all(isinstance(v, str) and v.strip() for v in selectors.values()):
+        problems.append('selectors는 이름 → CSS 선택자 문자열이어야 합니다')
+
+    min_score = entry.get('min_score')
+    if min_score is not None and (isinstance(min_score, bool) or not isinstance(min_score, (int, float))):
+        problems.append(f"min_score는 숫자여야 합니다: {min_score!r}")
+
+    for field in ('date_format', 'category'):
+        if entry.get(field) is not None and not isinstance(entry[field], str):
+            problems.append(f"{field}는 문자열이어야 합니다")
+
+    headers = entry.get('headers', {})
+    if not isinstance(headers, dict) or not all(isinstance(v, str) for v in headers.values()):
+        problems.append('headers는 이름 → 값 문자열이어야 합니다')
+
+    return problems
+
+
+class SourcePlan:
+    """
+    검증을 마친 소스 하나의 실행 계획 (만든 뒤에는 바꾸지 않음)
+
+    fetch(source)는 응답 본문(RSS는 본문 조각 이터레이터)을 받고, parse(본문)는 이 소스의 설정과
+    컴파일된 선택자로 뉴스 리스트를 만듭니다. 프로세스 풀은 함수를 넘기지 않고 본문 바이트와
+    소스 정보만 보내므로, 워커에서는 scraper.PARSERS로 같은 파서를 찾습니다.
+    """
+
+    def __init__(self, entry: Dict, defaults: Optional[Dict] = None):
+        """
+        Args:
+            entry: sources.json의 소스 항목 (validate_source를 통과한 것)
+            defaults: 모든 소스의 기본 수집 한도 (config.json의 scraper 항목)
+
+        Raises:
+            SourceConfigError: 항목이 잘못되었거나 선택자를 해석할 수 없는 경우
+        """
+        from scraper import DEFAULT_HEADERS, SOURCE_HANDLERS
+
+        problems = validate_source(entry)
+        if problems:
+            raise SourceConfigError(', '.join(problems))
+
+        self.fingerprint = json.dumps(entry, ensure_ascii=False, sort_keys=True)
+        self.name = entry['name']
+        self.type = entry['type']
+
+        # 파서와 다른 프로세스/노드에 넘기는 소스 정보에는 기본값을 모두 채워 둡니다.
+        source = dict(entry)
+        defaults = defaults or {}
+        for field in ('hours_range', 'max_news_per_source', 'summary_length'):
+            if source.get(field) is None and defaults.get(field) is not None:
+                source[field] = defaults[field]
+        if entry.get('headers'):
+            source['headers'] = {**DEFAULT_HEADERS, **entry['headers']}
+
+        self.compiled_selectors = None
+        if self.type == 'scraping':
+            source['selectors'] = {**DEFAULT_SELECTORS, **entry.get('selectors', {})}
+            source.setdefault('max_news_per_source', DEFAULT_SCRAPING_MAX_NEWS)
+            self.compiled_selectors = compile_selectors(source['selectors'])
+
+        self.source = source
+
+        fetch, parser, label = SOURCE_HANDLERS[self.type]
+        self.fetch: Callable = fetch
+        self.label: Tuple[str, str] = label
+        if self.compiled_selectors is not None:
+            self.parse: Callable = partial(parser, source=source, selectors=self.compiled_selectors)
+        else:
+            self.parse = partial(parser, source=source)
+
+
+class SourceRegistry:
+    """sources.json을 실행 계획 목록으로 관리하고, 파일이 바뀌면 다시 읽는 레지스트리"""
+
+    def __init__(self, sources_file: str = 'sources.json', defaults: Optional[Dict] = None):
+        """
+        Args:
+            sources_file: 뉴스 소스 설정 파일 경로
+            defaults: 모든 소스의 기본 수집 한도 (config.json의 scraper 항목)
+        """
+        self.sources_file = sources_file
+        self.defaults = dict(defaults or {})
+        self._lock = threading.Lock()
+        self._signature = _NOT_LOADED
+        # (이름 → 계획, 소스 정보 목록)을 한 번에 교체합니다.
+        self._state: Tuple[Dict[str, SourcePlan], List[Dict]] = ({}, [])
+        self.refresh()
+
+    @property
+    def sources(self) -> List[Dict]:
+        """현재 소스 정보 목록 (기본값이 채워진 딕셔너리, 파일 순서)"""
+        return self._state[1]
+
+    def get(self, name: str) -> Optional[SourcePlan]:
+        """이름으로 실행 계획을 찾습니다."""
+        return self._state[0].get(name)
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.sources_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self) -> bool:
+        """
+        파일이 바뀌었으면 다시 읽어 계획 목록을 교체합니다.
+
+        파일을 읽을 수 없거나 JSON 형식이 잘못된 경우에는 기존 계획을 그대로 유지합니다.
+
+        Returns:
+            계획 목록을 교체했는지 여부
+        """
+        signature = self._file_signature()
+        if signature == self._signature:
+            return False
+
+        with self._lock:
+            if signature == self._signature:
+                return False
+            reloading = self._signature is not _NOT_LOADED
+            self._signature = signature
+
+            if signature is None:
+                print(f"❌ {self.sources_file} 파일을 찾을 수 없습니다.")
+                return False
+            try:
+                with open(self.sources_file, 'r', encoding='utf-8') as f:
+                    entries = json.load(f).get('sources', [])
+            except (json.JSONDecodeError, AttributeError):
+                print(f"❌ {self.sources_file} 파일 형식이 잘못되었습니다.")
+                return False
+
+            plans, sources, reused = self._compile(entries)
+            self._state = (plans, sources)
+
+        if reloading:
+            print(f"🔄 {self.sources_file} 변경 감지: 소스 {len(sources)}개 "
+                  f"(새로 만든 계획 {len(sources) - reused}개)")
+        return True
+
+    def _compile(self, entries: List) -> Tuple[Dict[str, SourcePlan], List[Dict], int]:
+        """항목들을 계획으로 만듭니다. 내용이 그대로인 항목은 기존 계획을 재사용합니다."""
+        previous = {plan.fingerprint: plan for plan in self._state[0].values()}
+        plans: Dict[str, SourcePlan] = {}
+        sources: List[Dict] = []
+        reused = 0
+
+        for index, entry in enumerate(entries, 1):
+            fingerprint = json.dumps(entry, ensure_ascii=False, sort_keys=True)
+            plan = previous.get(fingerprint)
+            if plan is None:
+                try:
+                    plan = SourcePlan(entry, self.defaults)
+                except SourceConfigError as e:
+                    label = entry.get('name') if isinstance(entry, dict) else None
+                    print(f"⚠️  {index}번째 소스({label or '이름 없음'})를 건너뜁니다: {str(e)}")
+                    continue
+
+            if plan.name in plans:
+                print(f"⚠️  {index}번째 소스를 건너뜁니다: 이름이 중복됩니다 ({plan.name})")
+                continue
+            if plan.fingerprint in previous:
+                reused += 1
+            plans[plan.name] = plan
+            sources.append(plan.source)
+
+        return plans, sources, reused
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """sources.json을 검사하고 문제가 있으면 종료 코드 1을 반환합니다."""
+    argv = sys.argv[1:] if argv is None else argv
+    sources_file = argv[0] if argv else 'sources.json'
+
+    with open(sources_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f).get('sources', [])
+
+    failed = 0
+    names = set()
+    for index, entry in enumerate(entries, 1):
+        problems = validate_source(entry)
+        name = entry.get('name') if isinstance(entry, dict) else None
+        if name in names:
+            problems.append('이름이 중복됩니다')
+        names.add(name)
+        if not problems:
+            try:
+                SourcePlan(entry)
+            except SourceConfigError as e:
+                problems.append(str(e))
+
+        if problems:
+            failed += 1
+            print(f"❌ {index}. {name or '이름 없음'}: {', '.join(problems)}")
+        else:
+            print(f"✅ {index}. {name}")
+
+    print(f"\n소스 {len(entries)}개 중 {failed}개에 문제가 있습니다." if failed else f"\n소스 {len(entries)}개 모두 정상입니다.")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
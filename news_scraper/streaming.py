@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+스트리밍 수집/알림 모듈
+모든 소스를 기다리지 않고, 끝난 소스부터 결과를 파이프라인으로 흘려보내
+새 뉴스가 충분히 모이는 즉시 텔레그램으로 전송합니다.
+
+    수집(동시) → 중복 제거(저장 + 알림 대기열) → 묶음 → 대기열 전송(관련도 필터 → 알림)
+
+각 단계는 (소스 정보, 뉴스 리스트)를 주고받는 제너레이터입니다.
+새 뉴스는 저장과 같은 트랜잭션에서 알림 대기열(outbox)에 들어가고, 전송에 성공한 뒤에만 보냄으로 표시되므로
+전송에 실패한 뉴스는 다음 묶음이나 다음 실행에서 다시 보냅니다.
+관련도 필터는 대기열에서 꺼낸 뉴스에 한 번만 적용되므로(cluster.drain_outbox),
+이전에 전송에 실패해 대기열에 남아 있던 뉴스도 같은 기준으로 걸러집니다.
+"""
+
+import os
+import socket
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cluster import drain_outbox
+from scraper import NewsCollector, merge_news_streams
+from news_store import NewsStore, bloom_from_config, db_file_from_config
+
+Batch = Tuple[Dict, List[Dict]]
+
+
+def dedup_stage(batches: Iterable[Batch], store: NewsStore, outbox: bool = False) -> Iterator[Batch]:
+    """
+    이미 저장소에 있는 링크를 제외하고, 새 뉴스는 저장소에 기록합니다.
+
+    Args:
+        batches: (소스 정보, 뉴스 리스트) 스트림
+        store: 뉴스 저장소
+        outbox: 새 뉴스를 알림 대기열에도 넣을지 여부
+
+    Yields:
+        (소스 정보, 새 뉴스 리스트)
+    """
+    for source, news_list in batches:
+        fresh = store.insert_new(news_list, outbox=outbox)
+
+        print(f"  🆕 {source['name']}: 새 뉴스 {len(fresh)}개 / 수집 {len(news_list)}개")
+        yield source, fresh
+
+
+def batch_stage(batches: Iterable[Batch], min_items: int = 1) -> Iterator[List[Dict]]:
+    """
+    새 뉴스가 min_items개 이상 모일 때마다 묶어서 내보내고, 끝에 남은 뉴스도 내보냅니다.
+
+    Args:
+        batches: (소스 정보, 뉴스 리스트) 스트림
+        min_items: 한 번에 전송할 최소 뉴스 수
+
+    Yields:
+        최신순으로 정렬된 뉴스 묶음
+    """
+    pending = []
+    for _, news_list in batches:
+        if news_list:
+            pending.append(news_list)
+        if sum(len(stream) for stream in pending) >= min_items:
+            yield merge_news_streams(pending)
+            pending = []
+
+    if pending:
+        yield merge_news_streams(pending)
+
+
+def run_streaming(config: Optional[Dict], notify: Optional[Callable[[List[Dict]], bool]] = None,
+                  collector: Optional[NewsCollector] = None) -> List[Dict]:
+    """
+    스트리밍 모드로 한 번 실행합니다.
+
+    Args:
+        config: 설정 딕셔너리
+        notify: 뉴스 묶음을 전송하는 함수 (None이면 전송하지 않음)
+        collector: 사용할 수집기 (None이면 새로 생성)
+
+    Returns:
+        이번 실행에서 수집된 전체 뉴스 (최신순)
+    """
+    config = config or {}
+    streaming_config = config.get('streaming', {})
+    collector = collector or NewsCollector(source_defaults=config.get('scraper'))
+
+    print(f"\n🚀 스트리밍 수집을 시작합니다...\n")
+
+    collected = []
+    collector.new_news = []
+
+    def record(batches: Iterable[Batch]) -> Iterator[Batch]:
+        """수집된 원본 결과를 JSON 저장용으로 모아둡니다."""
+        for source, news_list in batches:
+            collected.append(news_list)
+            yield source, news_list
+
+    def record_new(batches: Iterable[Batch]) -> Iterator[Batch]:
+        """저장소에 새로 추가된 뉴스를 트렌드 집계용으로 모아둡니다."""
+        for source, news_list in batches:
+            collector.new_news.extend(news_list)
+            yield source, news_list
+
+    owner = f"stream-{socket.gethostname()}-{os.getpid()}"
+    with NewsStore(db_file_from_config(config), bloom_from_config(config)) as store:
+        pipeline = record(collector.iter_collect(streaming_config.get('max_workers', 8)))
+        pipeline = record_new(dedup_stage(pipeline, store, outbox=notify is not None))
+
+        sent = 0
+        for _ in batch_stage(pipeline, streaming_config.get('min_batch', 1)):
+            if notify is None:
+                continue
+            # 새 뉴스가 min_batch개 이상 모였으면 대기열을 비웁니다
+            # (관련도 필터는 여기서 적용되며, 이전에 전송에 실패한 뉴스도 함께 보냄).
+            sent += drain_outbox(store, owner, notify, collector.sources, config)
+
+        if notify is not None:
+            # 남은 대기열을 정리합니다 (필터에서 빠진 뉴스는 제외로 표시, 나머지는 전송).
+            sent += drain_outbox(store, owner, notify, collector.sources, config)
+
+    collector.collected_news = merge_news_streams(collected)
+    print(f"\n📊 총 {len(collector.collected_news)}개 수집, {sent}개 전송\n")
+    return collector.collected_news
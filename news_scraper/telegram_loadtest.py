@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+텔레그램 알림 전송 부하 테스트
+로컬 Bot API 대역 서버(mock_telegram.py)를 띄우고, 여러 채팅에 긴 브리핑을 동시에 보내면서
+초당 메시지 수, 429 재시도 동작, 알림 한 건의 전송 완료 시간을 측정합니다.
+
+    send      채팅마다 요약이 포함된 긴 뉴스 목록(여러 메시지로 나뉨)을 rounds번 새로 보냅니다.
+    briefing  채팅마다 실시간 브리핑(LiveBriefing)을 만들고, 라운드마다 새 뉴스를 더해 메시지를 고칩니다
+              (카테고리가 많아 브리핑 하나가 여러 메시지로 나뉨).
+
+사용법:
+    python telegram_loadtest.py
+    python telegram_loadtest.py --chats 50 --items 300 --latency 0.05 --chat-rate 1 --global-rate 30
+    python telegram_loadtest.py --scenario briefing --rounds 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from benchmark import RESULT_DIR, _git_commit
+
+SCENARIOS = ('send', 'briefing')
+
+
+def synthetic_news(count: int, offset: int = 0, categories: int = 40) -> List[Dict]:
+    """
+    브리핑용 합성 뉴스를 만듭니다 (HTML 이스케이프가 필요한 문자를 섞어 검증 오류도 함께 잡습니다).
+
+    Args:
+        count: 뉴스 수
+        offset: 링크 번호 시작값 (라운드마다 새 뉴스를 만들 때 사용)
+        categories: 카테고리 수 (많을수록 카테고리별 브리핑이 길어짐)
+    """
+    now = datetime.now()
+    news_list = []
+    for i in range(offset, offset + count):
+        news_list.append({
+            'source': f"Source {i % 12} & Co",
+            'title': f"AI <모델> 발표 #{i}: 성능 & 효율 개선 \"벤치마크\" 결과",
+            'link': f"https://example.com/news/{i}?ref=feed&id={i}",
+            'summary': 'LLM 추론 비용을 줄이는 새로운 방법이 공개되었습니다. ' * 3,
+            'published': (now - timedelta(minutes=i % 600)).isoformat(),
+            'category': f"topic-{i % categories}",
+        })
+    return news_list
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """값 목록의 q 분위수 (0~1)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def run_scenario(scenario: str, chats: int = 20, rounds: int = 3, items: int = 200, new_per_round: int = 20,
+                 workers: int = 8, latency: float = 0.0, chat_rate: float = None, global_rate: float = None,
+                 retry_after: float = None, max_retries: int = 5) -> Dict:
+    """
+    부하 시나리오 하나를 실행합니다.
+
+    Args:
+        scenario: 'send' 또는 'briefing'
+        chats: 동시에 알림을 받는 채팅 수
+        rounds: 채팅별 알림 횟수
+        items: 첫 라운드 브리핑의 뉴스 수
+        new_per_round: briefing 시나리오에서 라운드마다 더하는 뉴스 수
+        workers: 동시에 전송하는 스레드 수
+        latency: 대역 서버 응답 지연 (초)
+        chat_rate: 채팅별 초당 메시지 한도
+        global_rate: 전체 초당 메시지 한도
+        retry_after: 429 응답의 retry_after 고정값 (초)
+        max_retries: 알림 객체의 429 재시도 횟수
+
+    Returns:
+        측정 결과
+    """
+    from metrics import MemorySink, metrics
+    from mock_telegram import MockBotAPI
+    from telegram_notifier import LiveBriefing, TelegramNotifier
+
+    sink = MemorySink()
+    metrics.add_sink(sink)
+    state_dir = tempfile.TemporaryDirectory()
+    base_news = synthetic_news(items)
+    latencies: List[float] = []
+    failures = [0]
+    lock = threading.Lock()
+
+    def deliver(server: MockBotAPI, chat: int):
+        notifier = TelegramNotifier('loadtest', str(1000 + chat), api_base=server.api_base,
+                                    max_retries=max_retries, max_retry_wait=60)
+        briefing = LiveBriefing(notifier, os.path.join(state_dir.name, f"{chat}.json"), max_items=items * 2)
+        for round_index in range(rounds):
+            if scenario == 'briefing':
+                news_list = base_news if round_index == 0 else \
+                    synthetic_news(new_per_round, offset=items + round_index * new_per_round)
+                send = lambda: briefing.update(news_list)
+            else:
+                send = lambda: notifier.send_news_notification(base_news, max_news=items)
+
+            started = time.perf_counter()
+            ok = send()
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                failures[0] += 0 if ok else 1
+
+    try:
+        with MockBotAPI(latency=latency, chat_rate=chat_rate, global_rate=global_rate,
+                        retry_after=retry_after) as server:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for future in [pool.submit(deliver, server, chat) for chat in range(chats)]:
+                    future.result()
+            wall = time.perf_counter() - started
+            stats = dict(server.stats)
+    finally:
+        metrics.remove_sink(sink)
+        state_dir.cleanup()
+
+    accepted = stats.get('sendMessage:200', 0) + stats.get('editMessageText:200', 0)
+    api_seconds = sink.values('telegram_send_seconds')
+    return {
+        'scenario': scenario,
+        'notifications': len(latencies),
+        'failed': failures[0],
+        'seconds': round(wall, 3),
+        'api_calls': sum(stats.values()),
+        'messages_accepted': accepted,
+        'messages_per_sec': round(accepted / wall, 1) if wall > 0 else None,
+        'rate_limited': sum(count for key, count in stats.items() if key.endswith(':429')),
+        'rejected': sum(count for key, count in stats.items() if key.endswith(':400')),
+        'retries': int(sink.total('telegram_retries_total')),
+        'retry_wait_seconds': round(sink.total('telegram_retry_wait_seconds'), 3),
+        'latency_ms': {
+            'p50': round(_percentile(latencies, 0.5) * 1000, 1),
+            'p95': round(_percentile(latencies, 0.95) * 1000, 1),
+            'max': round(max(latencies, default=0) * 1000, 1),
+        },
+        'api_call_ms': {
+            'p50': round(_percentile(api_seconds, 0.5) * 1000, 2),
+            'p95': round(_percentile(api_seconds, 0.95) * 1000, 2),
+            'mean': round(statistics.fmean(api_seconds) * 1000, 2) if api_seconds else 0.0,
+        },
+        'status': stats,
+    }
+
+
+def print_report(result: Dict):
+    """측정 결과를 표로 출력합니다."""
+    meta = result['meta']
+    print("=" * 78)
+    print(f"📨 텔레그램 전송 부하 테스트 (커밋 {meta['commit']}, 채팅 {meta['chats']}개, "
+          f"라운드 {meta['rounds']}회, 뉴스 {meta['items']}개)")
+    print("=" * 78)
+    print(f"{'시나리오':<10}{'알림':>6}{'실패':>6}{'메시지/초':>11}{'429':>7}{'재시도':>8}{'거부':>6}"
+          f"{'p50(ms)':>10}{'p95(ms)':>10}{'최대(ms)':>10}")
+    for scenario in result['scenarios']:
+        latency = scenario['latency_ms']
+        print(f"{scenario['scenario']:<10}{scenario['notifications']:>6}{scenario['failed']:>6}"
+              f"{scenario['messages_per_sec'] or 0:>11,.1f}{scenario['rate_limited']:>7}"
+              f"{scenario['retries']:>8}{scenario['rejected']:>6}"
+              f"{latency['p50']:>10,.1f}{latency['p95']:>10,.1f}{latency['max']:>10,.1f}")
+    print("=" * 78)
+
+
+def main():
+    """부하 테스트 실행 함수"""
+    parser = argparse.ArgumentParser(description='텔레그램 알림 전송 부하 테스트')
+    parser.add_argument('--scenario', choices=SCENARIOS + ('all',), default='all', help='시나리오 (기본값: all)')
+    parser.add_argument('--chats', type=int, default=20, help='채팅 수 (기본값: 20)')
+    parser.add_argument('--rounds', type=int, default=3, help='채팅별 알림 횟수 (기본값: 3)')
+    parser.add_argument('--items', type=int, default=200, help='브리핑 뉴스 수 (기본값: 200)')
+    parser.add_argument('--new-per-round', type=int, default=20, help='briefing 라운드마다 더할 뉴스 수 (기본값: 20)')
+    parser.add_argument('--workers', type=int, default=8, help='동시 전송 스레드 수 (기본값: 8)')
+    parser.add_argument('--latency', type=float, default=0.02, help='대역 서버 응답 지연 (초, 기본값: 0.02)')
+    parser.add_argument('--chat-rate', type=float, help='채팅별 초당 메시지 한도 (실제 텔레그램은 약 1)')
+    parser.add_argument('--global-rate', type=float, help='전체 초당 메시지 한도 (실제 텔레그램은 약 30)')
+    parser.add_argument('--retry-after', type=float,
+                        help='429 응답의 retry_after 고정값 (초, 기본값: 한도가 풀릴 때까지 남은 초)')
+    parser.add_argument('--max-retries', type=int, default=5, help='429 재시도 횟수 (기본값: 5)')
+    parser.add_argument('--output', help=f'결과 JSON 경로 (기본값: {RESULT_DIR}/telegram-<커밋>.json)')
+    args = parser.parse_args()
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(script_dir)
+
+    scenarios = SCENARIOS if args.scenario == 'all' else (args.scenario,)
+    result = {
+        'meta': {
+            'commit': _git_commit(),
+            'created_at': datetime.now().isoformat(),
+            'chats': args.chats,
+            'rounds': args.rounds,
+            'items': args.items,
+            'workers': args.workers,
+            'latency': args.latency,
+            'chat_rate': args.chat_rate,
+            'global_rate': args.global_rate,
+        },
+        'scenarios': []
+    }
+
+    for scenario in scenarios:
+        print(f"\n⏱️  {scenario} 시나리오 실행 중...")
+        result['scenarios'].append(run_scenario(
+            scenario, chats=args.chats, rounds=args.rounds, items=args.items, new_per_round=args.new_per_round,
+            workers=args.workers, latency=args.latency, chat_rate=args.chat_rate, global_rate=args.global_rate,
+            retry_after=args.retry_after, max_retries=args.max_retries
+        ))
+    print()
+    print_report(result)
+
+    output_file = args.output or os.path.join(RESULT_DIR, f"telegram-{result['meta']['commit']}.json")
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"💾 {output_file}에 저장 완료!\n")
+
+    # 실패한 알림이 있으면 종료 코드 1 (회귀 검사용)
+    sys.exit(1 if any(scenario['failed'] for scenario in result['scenarios']) else 0)
+
+
+if __name__ == '__main__':
+    main()
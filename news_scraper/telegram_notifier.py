@@ -2,26 +2,95 @@
 """
 텔레그램 알림 모듈
 수집된 뉴스를 텔레그램으로 전송합니다.
+
+실시간 브리핑(LiveBriefing)을 켜면 매번 새 메시지를 보내는 대신,
+그날의 브리핑 메시지를 editMessageText로 고쳐 가며 새 뉴스를 반영합니다.
 """
 
+import hashlib
 import json
-import requests
+import time
 from typing import List, Dict, Optional
-from datetime import datetime
+from datetime import date, datetime
+
+from atomic_file import atomic_write_json
+from metrics import metrics
+from transport import get_transport
+
+
+DEFAULT_API_BASE = 'https://api.telegram.org'
+
+# 카테고리별 메시지에서 카테고리마다 보여 줄 뉴스 수
+CATEGORY_PREVIEW = 3
+
+# 카테고리 표시 이름
+CATEGORY_NAMES = {
+    'korean': '🇰🇷 한국 뉴스',
+    'english': '🌍 글로벌 뉴스',
+    'unknown': '📰 기타 뉴스'
+}
 
 
 class TelegramNotifier:
     """텔레그램 봇을 통한 알림 전송 클래스"""
 
-    def __init__(self, bot_token: str, chat_id: str):
+    def __init__(self, bot_token: str, chat_id: str, api_base: Optional[str] = None,
+                 max_retries: int = 3, max_retry_wait: float = 30):
         """
         Args:
             bot_token: 텔레그램 봇 토큰
             chat_id: 메시지를 받을 채팅 ID
+            api_base: Bot API 주소 (None이면 api.telegram.org, 로컬 대역 서버로 바꿔 테스트할 때 사용)
+            max_retries: 429 (요청 한도 초과) 응답을 받았을 때 다시 시도하는 최대 횟수
+            max_retry_wait: 이보다 긴 retry_after를 요구하면 기다리지 않고 실패 처리 (초)
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self.api_url = f"https://api.telegram.org/bot{bot_token}"
+        self.api_url = f"{(api_base or DEFAULT_API_BASE).rstrip('/')}/bot{bot_token}"
+        self.max_retries = max_retries
+        self.max_retry_wait = max_retry_wait
+
+    def _call(self, method: str, payload: Dict) -> Dict:
+        """
+        Bot API 메서드를 호출하고 응답 JSON을 반환합니다.
+
+        Args:
+            method: API 메서드 이름 (sendMessage, editMessageText 등)
+            payload: 요청 본문
+
+        429 (요청 한도 초과) 응답이면 텔레그램이 알려준 retry_after만큼 기다린 뒤
+        최대 max_retries번 다시 시도합니다.
+
+        Returns:
+            API 응답 ({'ok': ..., 'result' 또는 'description': ...})
+
+        Raises:
+            requests.exceptions.RequestException: 요청 실패 또는 JSON이 아닌 오류 응답
+        """
+        import requests
+
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            response = get_transport().post(f"{self.api_url}/{method}", json=payload, timeout=10)
+            metrics.observe('telegram_send_seconds', time.perf_counter() - started, method=method)
+            metrics.incr('telegram_send_status_total', method=method, status=str(response.status_code))
+
+            try:
+                result = response.json()
+            except ValueError:
+                response.raise_for_status()
+                raise requests.exceptions.RequestException('텔레그램 응답을 해석할 수 없습니다.')
+
+            retry_after = (result.get('parameters') or {}).get('retry_after')
+            if (result.get('error_code') != 429 or retry_after is None
+                    or attempt == self.max_retries or retry_after > self.max_retry_wait):
+                return result
+
+            metrics.incr('telegram_retries_total', method=method)
+            metrics.observe('telegram_retry_wait_seconds', retry_after, method=method)
+            time.sleep(retry_after)
+
+        return result
 
     def send_message(self, text: str, parse_mode: str = 'HTML') -> bool:
         """
@@ -34,30 +103,92 @@ class TelegramNotifier:
         Returns:
             전송 성공 여부
         """
+        return self.post_message(text, parse_mode) is not None
+
+    def post_message(self, text: str, parse_mode: str = 'HTML') -> Optional[int]:
+        """
+        텔레그램으로 메시지를 전송하고 메시지 id를 반환합니다.
+
+        Args:
+            text: 전송할 메시지
+            parse_mode: 메시지 파싱 모드 (HTML, Markdown 등)
+
+        Returns:
+            보낸 메시지 id (실패 시 None)
+        """
+        import requests
+
         try:
-            url = f"{self.api_url}/sendMessage"
-            payload = {
+            result = self._call('sendMessage', {
                 'chat_id': self.chat_id,
                 'text': text,
                 'parse_mode': parse_mode,
                 'disable_web_page_preview': False
-            }
-
-            response = requests.post(url, json=payload, timeout=10)
-            response.raise_for_status()
-
-            result = response.json()
+            })
             if result.get('ok'):
-                return True
+                metrics.incr('telegram_messages_total', outcome='sent')
+                return result.get('result', {}).get('message_id')
             else:
+                metrics.incr('telegram_messages_total', outcome='rejected')
                 print(f"❌ 텔레그램 전송 실패: {result.get('description', 'Unknown error')}")
-                return False
+                return None
 
         except requests.exceptions.RequestException as e:
+            metrics.incr('telegram_messages_total', outcome='error')
             print(f"❌ 텔레그램 API 요청 실패: {str(e)}")
-            return False
+            return None
         except Exception as e:
             print(f"❌ 메시지 전송 중 오류: {str(e)}")
+            return None
+
+    def edit_message(self, message_id: int, text: str, parse_mode: str = 'HTML') -> str:
+        """
+        이미 보낸 메시지의 내용을 바꿉니다.
+
+        Args:
+            message_id: 바꿀 메시지 id
+            text: 새 내용
+            parse_mode: 메시지 파싱 모드
+
+        Returns:
+            'edited' (수정함), 'unchanged' (내용이 같음), 'missing' (메시지가 지워짐), 'failed'
+        """
+        import requests
+
+        try:
+            result = self._call('editMessageText', {
+                'chat_id': self.chat_id,
+                'message_id': message_id,
+                'text': text,
+                'parse_mode': parse_mode,
+                'disable_web_page_preview': False
+            })
+        except requests.exceptions.RequestException as e:
+            metrics.incr('telegram_messages_total', outcome='error')
+            print(f"❌ 텔레그램 API 요청 실패: {str(e)}")
+            return 'failed'
+
+        if result.get('ok'):
+            metrics.incr('telegram_messages_total', outcome='edited')
+            return 'edited'
+
+        description = result.get('description', '')
+        if 'message is not modified' in description:
+            return 'unchanged'
+        if 'message to edit not found' in description or 'MESSAGE_ID_INVALID' in description:
+            return 'missing'
+
+        metrics.incr('telegram_messages_total', outcome='rejected')
+        print(f"❌ 텔레그램 메시지 수정 실패: {description or 'Unknown error'}")
+        return 'failed'
+
+    def delete_message(self, message_id: int) -> bool:
+        """이미 보낸 메시지를 지웁니다 (실패해도 예외를 내지 않음)."""
+        import requests
+
+        try:
+            return bool(self._call('deleteMessage', {'chat_id': self.chat_id, 'message_id': message_id}).get('ok'))
+        except requests.exceptions.RequestException:
             return False
 
     def format_news_message(self, news_list: List[Dict], max_news: int = 5, include_summary: bool = True) -> str:
@@ -108,61 +239,72 @@ class TelegramNotifier:
 
         return message
 
-    def format_category_message(self, news_list: List[Dict]) -> str:
+    def format_category_message(self, news_list: List[Dict], now: Optional[datetime] = None,
+                                snapshot=None) -> str:
         """
         카테고리별로 뉴스를 분류하여 메시지를 생성합니다.
 
         Args:
             news_list: 뉴스 리스트
+            now: 머리말에 표시할 시각 (None이면 현재 시각)
+            snapshot: 이 뉴스 리스트로 미리 만든 BriefingSnapshot (있으면 분류와 렌더링을 다시 하지 않음)
 
         Returns:
             카테고리별로 포맷된 메시지
         """
-        if not news_list:
-            return "📰 오늘 수집된 AI 뉴스가 없습니다."
+        if snapshot is None:
+            from briefing_snapshot import BriefingSnapshot
+            snapshot = BriefingSnapshot.build(news_list)
 
-        # 카테고리별로 분류
-        categorized = {}
-        for news in news_list:
-            category = news.get('category', 'unknown')
-            if category not in categorized:
-                categorized[category] = []
-            categorized[category].append(news)
+        if not snapshot.total:
+            return "📰 오늘 수집된 AI 뉴스가 없습니다."
 
         # 메시지 헤더
         message = f"🤖 <b>AI 뉴스 브리핑</b>\n"
-        message += f"📅 {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}\n"
-        message += f"📊 총 {len(news_list)}개의 뉴스\n"
+        message += f"📅 {(now or datetime.now()).strftime('%Y년 %m월 %d일 %H:%M')}\n"
+        message += f"📊 총 {snapshot.total}개의 뉴스\n"
         message += "━━━━━━━━━━━━━━━━━\n\n"
 
-        # 카테고리별로 출력
-        category_names = {
-            'korean': '🇰🇷 한국 뉴스',
-            'english': '🌍 글로벌 뉴스',
-            'unknown': '📰 기타 뉴스'
-        }
+        # 카테고리별로 출력 (미리 렌더링한 조각을 이어 붙임)
+        for category in snapshot.categories:
+            message += snapshot.fragments[category]
 
-        for category, news_items in categorized.items():
-            category_name = category_names.get(category, category)
-            message += f"<b>{category_name}</b> ({len(news_items)}개)\n\n"
+        return message
 
-            for i, news in enumerate(news_items[:3], 1):  # 카테고리당 최대 3개
-                title = self._escape_html(news.get('title', '제목 없음'))
-                link = news.get('link', '')
-                source = self._escape_html(news.get('source', '출처 미상'))
+    @classmethod
+    def format_category_section(cls, category: str, count: int, news_items: List[Dict]) -> str:
+        """
+        카테고리별 메시지에서 카테고리 하나의 부분을 만듭니다.
+
+        Args:
+            category: 카테고리
+            count: 카테고리의 전체 뉴스 수
+            news_items: 표시할 뉴스 (카테고리의 최신 CATEGORY_PREVIEW개)
+
+        Returns:
+            포맷된 카테고리 부분
+        """
+        category_name = CATEGORY_NAMES.get(category, category)
+        message = f"<b>{category_name}</b> ({count}개)\n\n"
+
+        for i, news in enumerate(news_items[:CATEGORY_PREVIEW], 1):
+            title = cls._escape_html(news.get('title', '제목 없음'))
+            link = news.get('link', '')
+            source = cls._escape_html(news.get('source', '출처 미상'))
 
-                message += f"{i}. {title}\n"
-                message += f"   📌 {source} | <a href='{link}'>링크</a>\n\n"
+            message += f"{i}. {title}\n"
+            message += f"   📌 {source} | <a href='{link}'>링크</a>\n\n"
 
-            if len(news_items) > 3:
-                message += f"   ... 외 {len(news_items) - 3}개\n\n"
+        if count > CATEGORY_PREVIEW:
+            message += f"   ... 외 {count - CATEGORY_PREVIEW}개\n\n"
 
         return message
 
     def send_news_notification(self, news_list: List[Dict],
                                format_type: str = 'simple',
                                max_news: int = 5,
-                               include_summary: bool = True) -> bool:
+                               include_summary: bool = True,
+                               snapshot=None) -> bool:
         """
         뉴스 알림을 전송합니다.
 
@@ -171,13 +313,14 @@ class TelegramNotifier:
             format_type: 메시지 형식 ('simple' 또는 'category')
             max_news: 최대 뉴스 개수
             include_summary: 요약 포함 여부
+            snapshot: 이 뉴스 리스트로 미리 만든 BriefingSnapshot (category 형식에서 사용)
 
         Returns:
             전송 성공 여부
         """
         try:
             if format_type == 'category':
-                message = self.format_category_message(news_list)
+                message = self.format_category_message(news_list, snapshot=snapshot)
             else:
                 message = self.format_news_message(news_list, max_news, include_summary)
 
@@ -196,39 +339,49 @@ class TelegramNotifier:
             print(f"❌ 뉴스 알림 전송 중 오류: {str(e)}")
             return False
 
-    def send_summary_stats(self, news_list: List[Dict]) -> bool:
+    def send_summary_stats(self, news_list: List[Dict], snapshot=None) -> bool:
         """
         수집 통계 요약을 전송합니다.
 
         Args:
             news_list: 뉴스 리스트
+            snapshot: 이 뉴스 리스트로 미리 만든 BriefingSnapshot (있으면 다시 세지 않음)
 
         Returns:
             전송 성공 여부
         """
-        if not news_list:
+        if snapshot is None:
+            from briefing_snapshot import BriefingSnapshot
+            snapshot = BriefingSnapshot.build(news_list)
+
+        if not snapshot.total:
             message = "📊 <b>오늘의 AI 뉴스 통계</b>\n\n"
             message += "수집된 뉴스가 없습니다. 😔"
             return self.send_message(message)
 
-        # 소스별 통계
-        source_stats = {}
-        for news in news_list:
-            source = news.get('source', '알 수 없음')
-            source_stats[source] = source_stats.get(source, 0) + 1
-
-        # 카테고리별 통계
-        category_stats = {}
-        for news in news_list:
-            category = news.get('category', 'unknown')
-            category_stats[category] = category_stats.get(category, 0) + 1
-
-        # 메시지 생성
-        message = f"📊 <b>오늘의 AI 뉴스 통계</b>\n"
-        message += f"📅 {datetime.now().strftime('%Y년 %m월 %d일')}\n"
+        return self.send_message(
+            self.format_summary_stats(snapshot.total, snapshot.source_counts, snapshot.category_counts))
+
+    def format_summary_stats(self, total: int, source_stats: Dict[str, int], category_stats: Dict[str, int],
+                             heading: str = '오늘의 AI 뉴스 통계', period: Optional[str] = None) -> str:
+        """
+        수집 통계 메시지를 만듭니다 (아카이브의 기간별 통계에도 사용).
+
+        Args:
+            total: 총 뉴스 수
+            source_stats: 소스 → 뉴스 수
+            category_stats: 카테고리 → 뉴스 수
+            heading: 제목
+            period: 날짜 줄에 표시할 기간 (None이면 오늘 날짜)
+
+        Returns:
+            포맷된 메시지
+        """
+        message = f"📊 <b>{self._escape_html(heading)}</b>\n"
+        message += f"📅 {period or datetime.now().strftime('%Y년 %m월 %d일')}\n"
         message += "━━━━━━━━━━━━━━━━━\n\n"
 
-        message += f"📰 <b>총 수집 뉴스:</b> {len(news_list)}개\n\n"
+        message += f"📰 <b>총 수집 뉴스:</b> {total}개\n\n"
 
         message += "<b>📌 소스별 통계:</b>\n"
         for source, count in sorted(source_stats.items(), key=lambda x: x[1], reverse=True):
@@ -244,6 +397,31 @@ class TelegramNotifier:
             cat_name = category_names.get(category, category)
             message += f"  • {cat_name}: {count}개\n"
 
+        return message
+
+    def send_trend_report(self, trends: List[Dict]) -> bool:
+        """
+        급상승 토픽 리포트를 전송합니다.
+
+        Args:
+            trends: TrendTracker.top_trends() 결과
+
+        Returns:
+            전송 성공 여부
+        """
+        message = f"📈 <b>AI 뉴스 급상승 토픽</b>\n"
+        message += f"📅 {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}\n"
+        message += "━━━━━━━━━━━━━━━━━\n\n"
+
+        if not trends:
+            message += "급상승 중인 토픽이 없습니다."
+            return self.send_message(message)
+
+        for i, trend in enumerate(trends, 1):
+            term = self._escape_html(trend['term'])
+            message += f"{i}. <b>{term}</b> — 평소 대비 {trend['spike']:.1f}배\n"
+            message += f"   최근 {trend['recent']:.0f}건 | 기준 {trend['baseline']:.0f}건\n"
+
         return self.send_message(message)
 
     def test_connection(self) -> bool:
@@ -254,11 +432,7 @@ class TelegramNotifier:
             연결 성공 여부
         """
         try:
-            url = f"{self.api_url}/getMe"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            result = response.json()
+            result = self._call('getMe', {})
             if result.get('ok'):
                 bot_info = result.get('result', {})
                 print(f"✅ 텔레그램 봇 연결 성공!")
@@ -331,6 +505,156 @@ class TelegramNotifier:
         return parts
 
 
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:32]
+
+
+class LiveBriefing:
+    """
+    하루 동안 같은 메시지를 고쳐 가며 갱신하는 실시간 브리핑
+
+    그날 받은 뉴스를 모아 카테고리별 브리핑을 만들고, 보낸 메시지 id와 메시지별 해시를
+    상태 파일에 기록합니다. 다음 갱신 때 내용 해시가 같으면 API를 호출하지 않고,
+    바뀐 메시지만 editMessageText로 고칩니다. 날짜가 바뀌면 새 브리핑을 시작합니다.
+
+    상태 파일은 한 프로세스만 쓴다고 가정합니다 (다중 노드에서는 알림 대기열을 비우는 노드 하나에서만 사용).
+    """
+
+    def __init__(self, notifier: TelegramNotifier, state_file: str = 'briefing_state.json', max_items: int = 200):
+        """
+        Args:
+            notifier: 메시지를 보낼 TelegramNotifier
+            state_file: 브리핑 상태 파일 경로
+            max_items: 브리핑에 모아 둘 최대 뉴스 수 (최신순)
+        """
+        self.notifier = notifier
+        self.state_file = state_file
+        self.max_items = max_items
+
+    def _load(self, today: str) -> Dict:
+        """오늘의 브리핑 상태를 읽습니다 (없거나 날짜가 다르면 새 상태)."""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('date') == today and state.get('chat_id') == str(self.notifier.chat_id):
+                return state
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        return {'date': today, 'chat_id': str(self.notifier.chat_id), 'content_hash': None,
+                'message_ids': [], 'part_hashes': [], 'news': []}
+
+    def _merge(self, known: List[Dict], news_list: List[Dict]) -> List[Dict]:
+        """오늘 모은 뉴스에 새 뉴스를 정규화 링크 기준으로 더하고 최신순 max_items개만 남깁니다."""
+        from links import news_key
+        from scraper import merge_news_streams
+
+        known_links = {news_key(news) for news in known}
+        fresh = [news for news in news_list if news_key(news) not in known_links]
+        if not fresh:
+            return known
+        return merge_news_streams([known, fresh], limit=self.max_items)
+
+    def update(self, news_list: List[Dict]) -> bool:
+        """
+        새 뉴스를 브리핑에 반영합니다.
+
+        Args:
+            news_list: 새로 알릴 뉴스 리스트
+
+        Returns:
+            성공 여부 (내용이 바뀌지 않아 아무것도 보내지 않은 경우도 성공)
+        """
+        today = date.today()
+        state = self._load(today.isoformat())
+        state['news'] = self._merge(state['news'], news_list)
+
+        # 분류와 렌더링은 한 번만 하고, 머리말의 시각을 고정해 내용만으로 해시를 계산합니다.
+        from briefing_snapshot import BriefingSnapshot
+        snapshot = BriefingSnapshot.build(state['news'])
+        fixed_time = datetime.combine(today, datetime.min.time())
+        content_hash = _text_hash(
+            self.notifier.format_category_message(state['news'], now=fixed_time, snapshot=snapshot))
+        if content_hash == state['content_hash']:
+            metrics.incr('telegram_briefing_total', outcome='unchanged')
+            atomic_write_json(self.state_file, state)
+            return True
+
+        parts = self.notifier._split_message(
+            self.notifier.format_category_message(state['news'], snapshot=snapshot), 4000)
+        message_ids, part_hashes = state['message_ids'], state['part_hashes']
+        ok = True
+
+        try:
+            for index, part in enumerate(parts):
+                part_hash = _text_hash(part)
+                if index < len(message_ids):
+                    if part_hashes[index] == part_hash:
+                        continue
+                    outcome = self.notifier.edit_message(message_ids[index], part)
+                    if outcome in ('edited', 'unchanged'):
+                        part_hashes[index] = part_hash
+                        continue
+                    if outcome == 'failed':
+                        ok = False
+                        break
+                    # 채팅에서 지워진 메시지는 새로 보내고 id를 바꿉니다.
+                    message_id = self.notifier.post_message(part)
+                    if message_id is None:
+                        ok = False
+                        break
+                    message_ids[index], part_hashes[index] = message_id, part_hash
+                else:
+                    message_id = self.notifier.post_message(part)
+                    if message_id is None:
+                        ok = False
+                        break
+                    message_ids.append(message_id)
+                    part_hashes.append(part_hash)
+
+            if ok:
+                # 브리핑이 짧아져 남는 메시지는 지웁니다.
+                for message_id in message_ids[len(parts):]:
+                    self.notifier.delete_message(message_id)
+                del message_ids[len(parts):], part_hashes[len(parts):]
+                state['content_hash'] = content_hash
+        finally:
+            # 실패해도 이미 보낸 메시지 id는 기록해 두어야 다음 갱신 때 중복으로 보내지 않습니다.
+            atomic_write_json(self.state_file, state)
+
+        metrics.incr('telegram_briefing_total', outcome='updated' if ok else 'failed')
+        return ok
+
+
+def briefing_from_config(notifier: TelegramNotifier, config: Optional[Dict]) -> Optional[LiveBriefing]:
+    """설정 파일의 notification.live_briefing 항목으로 실시간 브리핑을 만듭니다 (비활성이면 None)."""
+    briefing_config = (config or {}).get('notification', {}).get('live_briefing', {})
+    if not briefing_config.get('enabled', False):
+        return None
+
+    return LiveBriefing(
+        notifier,
+        state_file=briefing_config.get('state_file', 'briefing_state.json'),
+        max_items=briefing_config.get('max_items', 200)
+    )
+
+
+def notifier_from_config(config: Dict) -> TelegramNotifier:
+    """
+    설정 파일의 telegram 항목으로 알림 객체를 만듭니다 (봇 토큰/채팅 ID 검사는 호출하는 쪽에서 함).
+
+    Args:
+        config: 전체 설정 딕셔너리
+    """
+    telegram_config = config.get('telegram', {})
+    return TelegramNotifier(
+        telegram_config.get('bot_token', ''),
+        telegram_config.get('chat_id', ''),
+        api_base=telegram_config.get('api_base'),
+        max_retries=telegram_config.get('max_retries', 3),
+        max_retry_wait=telegram_config.get('max_retry_wait', 30)
+    )
+
+
 def load_config(config_file: str = 'config.json') -> Optional[Dict]:
     """
     설정 파일을 로드합니다.
@@ -386,7 +710,7 @@ def main():
         return
 
     # 텔레그램 알림 객체 생성
-    notifier = TelegramNotifier(bot_token, chat_id)
+    notifier = notifier_from_config(config)
 
     # 연결 테스트
     print("\n🔍 텔레그램 봇 연결 테스트 중...\n")
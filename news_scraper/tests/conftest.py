@@ -0,0 +1,6 @@
+"""pytest 공통 설정: news_scraper 모듈을 패키지 설치 없이 불러오도록 경로를 추가합니다."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,94 @@
+"""api_server ETag/304 처리 테스트"""
+
+import http.client
+import threading
+
+import pytest
+
+from api_server import NewsAPI, create_server, gzip_etag, parse_if_none_match
+from news_store import NewsStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    with NewsStore(str(tmp_path / 'news.db')) as store:
+        store.add_news([
+            {'title': f'AI 뉴스 {n} ' + '본문 ' * 50, 'link': f'https://example.com/{n}', 'source': 'S',
+             'category': 'AI', 'summary': '요약', 'published': f'2026-10-01T{n:02d}:00:00+09:00'}
+            for n in range(10)
+        ])
+        yield store
+
+
+def test_parse_if_none_match():
+    assert parse_if_none_match(None) == []
+    assert parse_if_none_match(' * ') == ['*']
+    assert parse_if_none_match('"a", W/"b-gzip",W/"c"') == ['"a"', '"b-gzip"', '"c"']
+
+
+def test_matching_etag_returns_304_until_store_changes(store):
+    api = NewsAPI(store)
+    first = api.respond('/api/news?limit=5', accept_gzip=False)
+    assert first['status'] == 200
+
+    assert api.respond('/api/news?limit=5', False, first['etag'])['status'] == 304
+    assert api.respond('/api/news?limit=5', False, f'"other", W/{first["etag"]}')['status'] == 304
+    # 다른 요청의 ETag는 맞지 않습니다.
+    assert api.respond('/api/news?limit=6', False, first['etag'])['status'] == 200
+
+    store.add_news([{'title': '새 기사', 'link': 'https://example.com/new', 'source': 'S', 'category': 'AI',
+                     'published': '2026-10-02T00:00:00+09:00'}])
+    assert api.respond('/api/news?limit=5', False, first['etag'])['status'] == 200
+
+
+def test_gzip_etag_is_distinct_and_revalidates(store):
+    api = NewsAPI(store)
+    entry = api.respond('/api/news', accept_gzip=True)
+    assert entry['gzip_body'] is not None
+
+    not_modified = api.respond('/api/news', True, gzip_etag(entry['etag']))
+    assert not_modified['status'] == 304
+    assert not_modified['etag'] == gzip_etag(entry['etag']) != entry['etag']
+
+
+def test_star_and_invalid_routes_are_not_short_circuited(store):
+    api = NewsAPI(store)
+    etag = api.respond('/api/news', False)['etag']
+
+    assert api.respond('/api/news', False, '*')['status'] == 304
+    assert api.respond('/api/news/999', False, '*')['status'] == 404
+    assert api.respond('/api/unknown', False, '*')['status'] == 404
+    # 경로와 파라미터를 먼저 검사하므로, ETag 값을 맞춰도 잘못된 요청은 304가 되지 않습니다.
+    bad = api.respond('/api/news?limit=x', False)
+    assert bad['status'] == 400
+    assert api.respond('/api/news?limit=x', False, bad['etag'])['status'] == 400
+    assert api.respond('/api/unknown', False, etag)['status'] == 404
+
+
+def test_http_headers(store):
+    server = create_server(store, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def get(headers):
+        connection = http.client.HTTPConnection(*server.server_address[:2])
+        connection.request('GET', '/api/news', headers=headers)
+        response = connection.getresponse()
+        response.read()
+        connection.close()
+        return response
+
+    try:
+        plain = get({})
+        compressed = get({'Accept-Encoding': 'gzip'})
+        assert compressed.getheader('Content-Encoding') == 'gzip'
+        assert compressed.getheader('ETag') == gzip_etag(plain.getheader('ETag'))
+        assert plain.getheader('Vary') == compressed.getheader('Vary') == 'Accept-Encoding'
+
+        revalidated = get({'If-None-Match': compressed.getheader('ETag'), 'Accept-Encoding': 'gzip'})
+        assert revalidated.status == 304
+        assert revalidated.getheader('ETag') == compressed.getheader('ETag')
+        assert revalidated.getheader('Vary') == 'Accept-Encoding'
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,60 @@
+"""news_store.NewsStore 저장/중복 제거/검색 테스트"""
+
+import pytest
+
+from news_store import NewsStore
+
+
+def _news(n, **extra):
+    news = {
+        'title': f'기사 {n}',
+        'link': f'https://example.com/{n}',
+        'source': 'S',
+        'category': 'AI',
+        'summary': '',
+        'published': f'2026-10-01T{n:02d}:00:00+09:00',
+    }
+    news.update(extra)
+    return news
+
+
+@pytest.fixture
+def store(tmp_path):
+    with NewsStore(str(tmp_path / 'news.db')) as store:
+        yield store
+
+
+def test_insert_new_skips_known_and_repeated_links(store):
+    assert store.add_news([_news(1), _news(2)]) == 2
+
+    fresh = store.insert_new([_news(2), _news(3), _news(3), {'title': '링크 없음'}])
+
+    assert [news['link'] for news in fresh] == ['https://example.com/3']
+    assert store.count() == 3
+
+
+def test_dedup_uses_canonical_link(store):
+    store.add_news([_news(1, canonical_link='https://example.com/1')])
+
+    tracked = _news(9, link='https://example.com/1?utm_source=rss', canonical_link='https://example.com/1')
+
+    assert store.insert_new([tracked]) == []
+    assert store.add_news([tracked]) == 0
+    assert store.count() == 1
+
+
+def test_search_matches_all_terms_newest_first(store):
+    store.add_news([
+        _news(1, title='오픈AI 언어모델 공개', summary='새 모델'),
+        _news(2, title='반도체 투자', summary='언어모델 학습용 칩'),
+        _news(3, title='날씨', summary='맑음'),
+    ])
+
+    if not store.fts_enabled:
+        pytest.skip('SQLite FTS5 trigram 토크나이저가 없습니다.')
+
+    assert [news['title'] for news in store.search('언어모델')] == ['반도체 투자', '오픈AI 언어모델 공개']
+    assert [news['title'] for news in store.search('언어모델 오픈AI')] == ['오픈AI 언어모델 공개']
+    # 3글자 미만 검색어는 LIKE로 찾습니다.
+    assert [news['title'] for news in store.search('맑음')] == ['날씨']
+    assert store.search('언어모델', category='없는 카테고리') == []
@@ -0,0 +1,83 @@
+"""scraper.merge_news_streams와 체크포인트 이어받기 테스트"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import requests
+
+import scraper
+from checkpoint import CheckpointJournal
+from scraper import NewsCollector, merge_news_streams
+
+
+def test_merge_orders_by_instant_across_timezones():
+    # 문자열로는 서울 시각이 더 늦어 보이지만, UTC로는 뉴욕 기사가 가장 최근입니다.
+    seoul = [
+        {'title': 'seoul-late', 'published': '2026-10-01T09:30:00+09:00'},  # 00:30Z
+        {'title': 'seoul-early', 'published': '2026-10-01T08:00:00+09:00'},  # 전날 23:00Z
+    ]
+    new_york = [
+        {'title': 'ny', 'published': '2026-09-30T21:00:00-04:00'},  # 01:00Z
+    ]
+    utc = [
+        {'title': 'utc', 'published': '2026-10-01T00:00:00Z'},
+        {'title': 'undated', 'published': ''},
+    ]
+
+    merged = merge_news_streams([seoul, new_york, utc])
+
+    assert [news['title'] for news in merged] == ['ny', 'seoul-late', 'utc', 'seoul-early', 'undated']
+
+
+def test_merge_sorts_unordered_streams_and_applies_limit():
+    stream = [
+        {'title': 'old', 'published': '2026-10-01T00:00:00+00:00'},
+        {'title': 'new', 'published': '2026-10-01T12:00:00+02:00'},
+    ]
+
+    assert [news['title'] for news in merge_news_streams([stream], limit=1)] == ['new']
+
+
+def _rss(name: str) -> bytes:
+    published = format_datetime(datetime.now(timezone.utc) - timedelta(hours=1))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>t</title>'
+        f'<item><title>{name} 기사</title><link>https://{name}.example.com/1</link>'
+        f'<description>요약</description><pubDate>{published}</pubDate></item>'
+        '</channel></rss>'
+    ).encode('utf-8')
+
+
+def test_resume_refetches_only_sources_that_failed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open('sources.json', 'w', encoding='utf-8') as f:
+        json.dump({'sources': [
+            {'name': 'good', 'url': 'https://good.example.com/rss', 'type': 'rss', 'category': 'AI'},
+            {'name': 'bad', 'url': 'https://bad.example.com/rss', 'type': 'rss', 'category': 'AI'},
+        ]}, f)
+
+    calls = []
+    failing = {'bad'}
+
+    def fetch(source, max_bytes=None):
+        calls.append(source['name'])
+        if source['name'] in failing:
+            raise requests.ConnectionError('connection refused')
+        return iter([_rss(source['name'])])
+
+    monkeypatch.setitem(scraper.SOURCE_HANDLERS, 'rss', (fetch,) + scraper.SOURCE_HANDLERS['rss'][1:])
+
+    first = NewsCollector()
+    first.collect_all(journal=CheckpointJournal(str(tmp_path / 'checkpoints')))
+    assert sorted(calls) == ['bad', 'good']
+    assert list(first.errors) == ['bad']
+
+    calls.clear()
+    failing.clear()
+    second = NewsCollector()
+    second.collect_all(journal=CheckpointJournal(str(tmp_path / 'checkpoints'), resume=True))
+
+    assert calls == ['bad']
+    assert second.errors == {}
+    assert sorted(news['source'] for news in second.collected_news) == ['bad', 'good']
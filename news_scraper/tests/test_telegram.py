@@ -0,0 +1,73 @@
+"""mock_telegram 본문 검사와 TelegramNotifier의 429 재시도 테스트"""
+
+import pytest
+
+from mock_telegram import MockBotAPI, check_html
+from telegram_notifier import TelegramNotifier
+
+
+@pytest.mark.parametrize('text', [
+    '<b>굵게</b> <a href="https://example.com/?a=1&amp;b=2">링크</a>',
+    '&lt;태그 아님&gt; &amp; &quot;',
+    '<blockquote><i>인용</i></blockquote>',
+])
+def test_check_html_accepts_valid_markup(text):
+    assert check_html(text) is None
+
+
+@pytest.mark.parametrize('text, error', [
+    ('<div>블록</div>', 'Unsupported start tag "div"'),
+    ('<b>안 닫힘', 'Can\'t find end tag corresponding to start tag "b"'),
+    ('<b><i>엇갈림</b></i>', 'Unexpected end tag "b"'),
+    ('AT&T', 'Unsupported entity "&"'),
+    ('&nbsp;', 'Unsupported entity "&nbsp;"'),
+])
+def test_check_html_rejects_like_telegram(text, error):
+    assert check_html(text) == f"Bad Request: can't parse entities: {error}"
+
+
+def test_rejected_html_is_not_sent():
+    with MockBotAPI() as mock:
+        notifier = TelegramNotifier('token', '42', api_base=mock.api_base)
+        assert notifier.post_message('<div>블록</div>') is None
+        assert mock.stats['sendMessage:400'] == 1
+        assert mock.messages['42'] == {}
+
+
+def test_429_waits_retry_after_and_resends():
+    with MockBotAPI(chat_rate=1) as mock:
+        notifier = TelegramNotifier('token', '42', api_base=mock.api_base)
+        first = notifier.post_message('첫 번째')
+        second = notifier.post_message('두 번째')
+
+        assert first is not None and second is not None
+        assert mock.stats['sendMessage:429'] == 1
+        assert mock.stats['sendMessage:200'] == 2
+        assert sorted(mock.messages['42'].values()) == ['두 번째', '첫 번째']
+
+
+def test_429_gives_up_when_retry_after_is_too_long(monkeypatch):
+    waits = []
+    monkeypatch.setattr('telegram_notifier.time.sleep', waits.append)
+
+    with MockBotAPI(chat_rate=1, retry_after=60) as mock:
+        notifier = TelegramNotifier('token', '42', api_base=mock.api_base, max_retry_wait=30)
+        assert notifier.post_message('첫 번째') is not None
+        assert notifier.post_message('두 번째') is None
+
+    assert waits == []
+    assert mock.stats['sendMessage:429'] == 1
+
+
+def test_429_stops_after_max_retries(monkeypatch):
+    waits = []
+    monkeypatch.setattr('telegram_notifier.time.sleep', waits.append)
+
+    with MockBotAPI(chat_rate=1, retry_after=1) as mock:
+        notifier = TelegramNotifier('token', '42', api_base=mock.api_base, max_retries=2)
+        assert notifier.post_message('첫 번째') is not None
+        # sleep을 건너뛰므로 한도가 풀리기 전에 재시도가 모두 소진됩니다.
+        assert notifier.post_message('두 번째') is None
+
+    assert waits == [1, 1]
+    assert mock.stats['sendMessage:429'] == 3
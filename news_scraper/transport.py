@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+HTTP 전송 계층 모듈
+수집기와 텔레그램 알림이 같은 소수의 호스트(뉴스 사이트, api.telegram.org)에 반복해서 요청하므로,
+요청마다 DNS 조회와 TCP/TLS 연결을 새로 하지 않도록 프로세스 전체가 하나의 전송 계층을 공유합니다.
+
+    - 연결 재사용: 호스트별 keep-alive 연결 풀(requests.Session)을 공유합니다.
+      이미 열린 연결로 보내는 요청은 DNS 조회, TCP 연결, TLS 핸드셰이크를 모두 건너뜁니다.
+    - DNS 캐시: 새 연결을 열 때의 주소 조회 결과를 dns_ttl초 동안 프로세스 안에 보관합니다.
+      캐시된 주소로 연결에 실패하면 그 항목을 버리고 다음 연결에서 다시 조회합니다.
+    - 미리 연결(prewarm): 실행 시작 시 사용할 호스트의 DNS 조회와 연결을 백그라운드에서 미리 해 둡니다.
+    - 계측: 새 연결의 DNS/연결(TCP+TLS) 시간과, 재사용/캐시로 아낀 시간의 추정치를 기록합니다
+      (아낀 시간 = 호스트별 최근 연결 시간의 이동 평균).
+
+TLS 세션 재개(session ticket)는 urllib3가 세션 객체를 넘기는 방법을 제공하지 않아 사용하지 않으며,
+대신 연결 자체를 재사용해 핸드셰이크를 없앱니다.
+"""
+
+import ipaddress
+import socket
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from metrics import metrics
+
+# 호스트별 연결 시간 이동 평균의 가중치 (새 측정값 비율)
+_EWMA_WEIGHT = 0.3
+
+# 연결을 여는 스레드가 DNS 캐시와 조회 시간을 주고받는 저장소
+_local = threading.local()
+_original_create_connection = None
+_hook_lock = threading.Lock()
+
+
+def _install_resolver_hook():
+    """
+    urllib3의 연결 함수에 DNS 캐시를 끼워 넣습니다 (한 번만).
+
+    전송 계층의 연결(_new_conn 안)에서만 캐시를 사용하고, 다른 urllib3 사용처는 그대로 동작합니다.
+    """
+    global _original_create_connection
+    with _hook_lock:
+        if _original_create_connection is not None:
+            return
+        from urllib3.util import connection
+
+        original = connection.create_connection
+
+        def create_connection(address, *args, **kwargs):
+            cache = getattr(_local, 'dns_cache', None)
+            if cache is None:
+                return original(address, *args, **kwargs)
+
+            host, port = address
+            error = None
+            for ip in cache.resolve(host, port):
+                try:
+                    return original((ip, port), *args, **kwargs)
+                except OSError as e:
+                    error = e
+            # 캐시된 주소가 모두 실패하면 다음 연결에서 다시 조회합니다.
+            cache.invalidate(host)
+            raise error or OSError(f"{host}에 연결할 주소가 없습니다.")
+
+        connection.create_connection = create_connection
+        _original_create_connection = original
+
+
+class DNSCache:
+    """getaddrinfo 결과를 TTL 동안 보관하는 프로세스 내 DNS 캐시"""
+
+    def __init__(self, ttl: float = 300):
+        """
+        Args:
+            ttl: 조회 결과 보관 시간 (초, 0이면 캐시하지 않음)
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[tuple, tuple] = {}
+        self._lookup_seconds: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        """
+        호스트의 IP 주소 목록을 반환합니다 (캐시에 있으면 조회하지 않음).
+
+        Raises:
+            socket.gaierror: 주소를 찾을 수 없는 경우
+        """
+        host = host.strip('[]')
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            cached = entry is not None and entry[0] > now
+            if cached:
+                self.hits += 1
+                saved = self._lookup_seconds.get(host, 0.0)
+        if cached:
+            metrics.incr('http_dns_cache_total', result='hit')
+            metrics.incr('http_dns_saved_seconds', saved, host=host)
+            return entry[1]
+
+        from urllib3.util.connection import allowed_gai_family
+
+        started = time.perf_counter()
+        infos = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+        elapsed = time.perf_counter() - started
+        _local.dns_seconds = elapsed
+
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self.misses += 1
+            previous = self._lookup_seconds.get(host)
+            self._lookup_seconds[host] = elapsed if previous is None else \
+                previous + _EWMA_WEIGHT * (elapsed - previous)
+            if self.ttl > 0:
+                self._entries[key] = (now + self.ttl, addresses)
+        metrics.incr('http_dns_cache_total', result='miss')
+        metrics.observe('http_dns_lookup_seconds', elapsed, host=host)
+        return addresses
+
+    def invalidate(self, host: str):
+        """호스트의 캐시 항목을 버립니다."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == host]:
+                del self._entries[key]
+
+    def lookup_seconds(self, host: str) -> float:
+        """호스트의 최근 DNS 조회 시간 이동 평균 (초)"""
+        return self._lookup_seconds.get(host, 0.0)
+
+
+class Transport:
+    """keep-alive 연결 풀과 DNS 캐시를 공유하는 HTTP 전송 계층"""
+
+    def __init__(self, dns_ttl: float = 300, pool_connections: int = 32, pool_maxsize: int = 10,
+                 connect_timeout: float = 5):
+        """
+        Args:
+            dns_ttl: DNS 조회 결과 보관 시간 (초)
+            pool_connections: 연결 풀을 유지할 최대 호스트 수
+            pool_maxsize: 호스트별 최대 유휴 연결 수 (동시 요청 스레드 수 이상)
+            connect_timeout: 미리 연결할 때의 연결 제한 시간 (초)
+        """
+        self.dns_cache = DNSCache(dns_ttl)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+
+        self._lock = threading.Lock()
+        self._session = None
+        self._connect_seconds: Dict[str, float] = {}
+        self.connections = 0
+        self.reused = 0
+        self.handshake_saved_seconds = 0.0
+
+    @property
+    def session(self):
+        """공유 requests.Session (처음 사용할 때 만듦)"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.connection import HTTPConnection, HTTPSConnection
+        from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+        _install_resolver_hook()
+        transport = self
+
+        class TrackedConnectionMixin:
+            """새 연결의 DNS/연결 시간과 연결 재사용을 기록하는 연결"""
+
+            def _new_conn(self):
+                _local.dns_cache = transport.dns_cache
+                _local.dns_seconds = 0.0
+                try:
+                    return super()._new_conn()
+                finally:
+                    _local.dns_cache = None
+
+            def connect(self):
+                started = time.perf_counter()
+                super().connect()
+                transport._record_connect(self.host, time.perf_counter() - started - _local.dns_seconds)
+
+            def request(self, *args, **kwargs):
+                # 직전 요청과 같은 소켓이 살아 있으면 이미 열린 연결을 재사용하는 것입니다.
+                if self.sock is not None and getattr(self, '_request_sock', None) is self.sock:
+                    transport._record_reuse(self.host)
+                result = super().request(*args, **kwargs)
+                self._request_sock = self.sock
+                return result
+
+        class TrackedHTTPConnection(TrackedConnectionMixin, HTTPConnection):
+            pass
+
+        class TrackedHTTPSConnection(TrackedConnectionMixin, HTTPSConnection):
+            pass
+
+        class TrackedHTTPConnectionPool(HTTPConnectionPool):
+            ConnectionCls = TrackedHTTPConnection
+
+        class TrackedHTTPSConnectionPool(HTTPSConnectionPool):
+            ConnectionCls = TrackedHTTPSConnection
+
+        class TrackedAdapter(HTTPAdapter):
+            def init_poolmanager(self, *args, **kwargs):
+                super().init_poolmanager(*args, **kwargs)
+                self.poolmanager.pool_classes_by_scheme = {
+                    'http': TrackedHTTPConnectionPool,
+                    'https': TrackedHTTPSConnectionPool,
+                }
+
+        session = requests.Session()
+        adapter = TrackedAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _record_connect(self, host: str, seconds: float):
+        with self._lock:
+            self.connections += 1
+            previous = self._connect_seconds.get(host)
+            self._connect_seconds[host] = seconds if previous is None else \
+                previous + _EWMA_WEIGHT * (seconds - previous)
+        metrics.incr('http_connections_total', host=host, outcome='new')
+        metrics.observe('http_connect_seconds', seconds, host=host)
+
+    def _record_reuse(self, host: str):
+        saved = self._connect_seconds.get(host, 0.0) + self.dns_cache.lookup_seconds(host)
+        with self._lock:
+            self.reused += 1
+            self.handshake_saved_seconds += saved
+        metrics.incr('http_connections_total', host=host, outcome='reused')
+        metrics.incr('http_handshake_saved_seconds', saved, host=host)
+
+    def request(self, method: str, url: str, **kwargs):
+        """공유 세션으로 요청합니다 (requests.request와 같은 인자)."""
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def head(self, url: str, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+    def _warm(self, url: str) -> bool:
+        """호스트 하나의 연결을 미리 열어 풀에 넣어 둡니다."""
+        host = urlsplit(url).hostname or ''
+        try:
+            pool = self.session.get_adapter(url).poolmanager.connection_from_url(url)
+            conn = pool._get_conn()
+            try:
+                if conn.sock is None:
+                    conn.timeout = self.connect_timeout
+                    conn.connect()
+                    # 미리 연 연결로 보내는 첫 요청도 재사용으로 셉니다.
+                    conn._request_sock = conn.sock
+            finally:
+                pool._put_conn(conn)
+            metrics.incr('http_prewarm_total', host=host, outcome='ok')
+            return True
+        except Exception:
+            metrics.incr('http_prewarm_total', host=host, outcome='error')
+            return False
+
+    def prewarm(self, urls: Iterable[str], wait: bool = False, max_workers: int = 8) -> Optional[threading.Thread]:
+        """
+        주소들의 호스트에 DNS 조회와 연결을 미리 해 둡니다 (호스트마다 연결 하나).
+
+        Args:
+            urls: 곧 요청할 주소들
+            wait: 끝날 때까지 기다릴지 여부 (False면 백그라운드 스레드로 실행)
+            max_workers: 동시에 연결할 호스트 수
+
+        Returns:
+            백그라운드 스레드 (wait=True면 None)
+        """
+        origins = {}
+        for url in urls:
+            parts = urlsplit(url)
+            if parts.scheme in ('http', 'https') and parts.hostname:
+                origins.setdefault((parts.scheme, parts.hostname, parts.port), f"{parts.scheme}://{parts.netloc}/")
+        if not origins:
+            return None
+
+        def run():
+            from concurrent.futures import ThreadPoolExecutor
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(origins))) as executor:
+                warmed = sum(executor.map(self._warm, origins.values()))
+            print(f"🔥 연결 미리 열기: 호스트 {warmed}/{len(origins)}개 ({time.perf_counter() - started:.2f}초)")
+
+        if wait:
+            run()
+            return None
+        thread = threading.Thread(target=run, name='transport-prewarm', daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self) -> Dict:
+        """연결/DNS 캐시 통계"""
+        return {
+            'connections': self.connections,
+            'reused': self.reused,
+            'handshake_saved_seconds': round(self.handshake_saved_seconds, 4),
+            'dns_hits': self.dns_cache.hits,
+            'dns_misses': self.dns_cache.misses,
+        }
+
+    def close(self):
+        """열린 연결을 모두 닫습니다."""
+        if self._session is not None:
+            self._session.close()
+
+
+# 프로세스 전체에서 공유하는 전송 계층 (configure_transport로 설정을 바꿈)
+_transport: Optional[Transport] = None
+
+
+def get_transport() -> Transport:
+    """공유 전송 계층을 반환합니다 (없으면 기본 설정으로 만듦)."""
+    global _transport
+    if _transport is None:
+        with _hook_lock:
+            if _transport is None:
+                _transport = Transport()
+    return _transport
+
+
+def configure_transport(config: Optional[Dict]) -> Transport:
+    """
+    설정 파일의 transport 항목으로 공유 전송 계층을 다시 만듭니다.
+
+    Args:
+        config: 전체 설정 딕셔너리
+
+    Returns:
+        새 전송 계층
+    """
+    global _transport
+    transport_config = (config or {}).get('transport', {})
+    previous = _transport
+    _transport = Transport(
+        dns_ttl=transport_config.get('dns_ttl', 300),
+        pool_connections=transport_config.get('pool_connections', 32),
+        pool_maxsize=transport_config.get('pool_maxsize', 10),
+        connect_timeout=transport_config.get('connect_timeout', 5)
+    )
+    if previous is not None:
+        previous.close()
+    return _transport
+
+
+def prewarm_from_config(config: Optional[Dict], sources: Iterable[Dict] = ()) -> Optional[threading.Thread]:
+    """
+    소스들과 텔레그램 API 호스트의 연결을 백그라운드에서 미리 엽니다 (transport.prewarm이 false면 하지 않음).
+
+    Args:
+        config: 전체 설정 딕셔너리
+        sources: 곧 수집할 소스 목록
+
+    Returns:
+        백그라운드 스레드 (미리 열 호스트가 없으면 None)
+    """
+    config = config or {}
+    if not config.get('transport', {}).get('prewarm', True):
+        return None
+
+    urls = [source['url'] for source in sources if source.get('url')]
+    if config.get('telegram', {}).get('enabled', False):
+        from telegram_notifier import DEFAULT_API_BASE
+        urls.append(config['telegram'].get('api_base') or DEFAULT_API_BASE)
+    return get_transport().prewarm(urls)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+트렌드 토픽 감지 모듈
+뉴스 제목의 단어 빈도를 두 개의 지수 감쇠 카운터(최근/기준)로 유지하고,
+최근 빈도가 평소보다 급증한 단어를 트렌드로 찾습니다.
+
+카운터는 새 뉴스가 들어올 때만 갱신되며(O(새 뉴스 수)),
+전체 기록을 다시 훑지 않으므로 몇 분마다 실행해도 부담이 없습니다.
+"""
+
+import json
+import math
+import re
+import time
+from typing import List, Dict, Optional
+
+from atomic_file import atomic_write_json
+from scraper import published_epoch
+
+# 단어 추출 (영문/숫자/한글 연속 구간)
+_TOKEN = re.compile(r'[0-9a-z가-힣]+')
+
+# 한국어 단어 끝의 조사 (긴 것부터 확인)
+_PARTICLES = ('에서', '으로', '에게', '까지', '부터', '은', '는', '이', '가', '을', '를',
+              '의', '에', '와', '과', '로', '도', '만')
+
+STOPWORDS = {
+    'the', 'and', 'for', 'with', 'from', 'that', 'this', 'into', 'about', 'its', 'are', 'was',
+    'will', 'has', 'have', 'how', 'what', 'why', 'new', 'now', 'more', 'after', 'over', 'you',
+    'your', 'our', 'can', 'not', 'but', 'all', 'out', 'says', 'said',
+    '위해', '통해', '대한', '관련', '있는', '없는', '이번', '올해', '지난', '오늘', '기자', '발표', '공개',
+}
+
+
+def extract_terms(text: str) -> set:
+    """
+    제목에서 트렌드 집계용 단어를 추출합니다.
+
+    Args:
+        text: 뉴스 제목
+
+    Returns:
+        단어 집합 (한 기사에서 같은 단어는 한 번만 셈)
+    """
+    terms = set()
+    for token in _TOKEN.findall(text.lower()):
+        for particle in _PARTICLES:
+            if token.endswith(particle) and len(token) > len(particle) + 1 and not token.isascii():
+                token = token[:-len(particle)]
+                break
+        if len(token) >= 2 and token not in STOPWORDS and not token.isdigit():
+            terms.add(token)
+    return terms
+
+
+class TrendTracker:
+    """지수 감쇠 카운터 기반 트렌드 추적기"""
+
+    def __init__(self, state_file: str = 'trend_state.json',
+                 short_half_life_hours: float = 6, long_half_life_hours: float = 72,
+                 max_terms: int = 20000):
+        """
+        Args:
+            state_file: 카운터 상태 저장 파일
+            short_half_life_hours: 최근 카운터의 반감기 (시간)
+            long_half_life_hours: 기준 카운터의 반감기 (시간)
+            max_terms: 보관할 최대 단어 수 (초과 시 기준 카운터가 작은 단어부터 제거)
+        """
+        self.state_file = state_file
+        self.short_tau = short_half_life_hours * 3600 / math.log(2)
+        self.long_tau = long_half_life_hours * 3600 / math.log(2)
+        self.max_terms = max_terms
+        # 단어 → [최근 카운터, 기준 카운터, 마지막 갱신 시각(epoch)]
+        self.terms: Dict[str, List[float]] = {}
+        self._load()
+
+    def _load(self):
+        """저장된 카운터 상태를 읽어옵니다."""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                self.terms = json.load(f).get('terms', {})
+        except FileNotFoundError:
+            self.terms = {}
+        except json.JSONDecodeError:
+            print(f"⚠️  {self.state_file} 파일 형식이 잘못되어 트렌드 기록을 새로 시작합니다.")
+            self.terms = {}
+
+    def save(self):
+        """카운터 상태를 원자적으로 저장합니다."""
+        if len(self.terms) > self.max_terms:
+            now = time.time()
+            ranked = sorted(self.terms, key=lambda term: self._decayed(term, now)[1], reverse=True)
+            self.terms = {term: self.terms[term] for term in ranked[:self.max_terms]}
+
+        atomic_write_json(self.state_file, {'updated_at': time.time(), 'terms': self.terms})
+
+    def _decayed(self, term: str, now: float) -> List[float]:
+        """단어의 카운터를 현재 시각 기준으로 감쇠한 값을 반환합니다 (상태는 그대로)."""
+        short, long, updated = self.terms[term]
+        elapsed = max(0.0, now - updated)
+        return [short * math.exp(-elapsed / self.short_tau), long * math.exp(-elapsed / self.long_tau)]
+
+    def update(self, news_list: List[Dict]) -> int:
+        """
+        새 뉴스로 카운터를 갱신합니다.
+
+        이미 집계한 뉴스를 다시 넣으면 중복 집계되므로, 저장소에 새로 추가된 뉴스만 넣어야 합니다.
+
+        Args:
+            news_list: 새로 수집된 뉴스 리스트
+
+        Returns:
+            갱신된 단어 수
+        """
+        now = time.time()
+        touched = set()
+
+        for news in news_list:
+            # 발행 시각 기준으로 반영하되, 미래 시각은 현재로 맞춥니다.
+            stamp = min(published_epoch(news) or now, now)
+            for term in extract_terms(news.get('title', '')):
+                counter = self.terms.get(term)
+                if counter is None:
+                    self.terms[term] = [1.0, 1.0, stamp]
+                elif stamp >= counter[2]:
+                    elapsed = stamp - counter[2]
+                    counter[0] = counter[0] * math.exp(-elapsed / self.short_tau) + 1
+                    counter[1] = counter[1] * math.exp(-elapsed / self.long_tau) + 1
+                    counter[2] = stamp
+                else:
+                    # 늦게 들어온 과거 뉴스는 그 시점에서 감쇠한 만큼만 더합니다.
+                    elapsed = counter[2] - stamp
+                    counter[0] += math.exp(-elapsed / self.short_tau)
+                    counter[1] += math.exp(-elapsed / self.long_tau)
+                touched.add(term)
+
+        return len(touched)
+
+    def top_trends(self, top_n: int = 5, min_count: float = 3.0) -> List[Dict]:
+        """
+        최근 빈도가 평소보다 급증한 단어를 찾습니다.
+
+        급증 정도 = (최근 카운터 / 최근 시간창) ÷ (기준 카운터 / 기준 시간창)
+        1보다 크면 평소보다 자주 등장하고 있다는 뜻입니다.
+
+        Args:
+            top_n: 반환할 트렌드 개수
+            min_count: 최근 카운터의 최소값 (너무 드문 단어 제외)
+
+        Returns:
+            [{'term', 'recent', 'baseline', 'spike'}] (급증 정도 순)
+        """
+        now = time.time()
+        window_ratio = self.long_tau / self.short_tau
+        trends = []
+
+        for term in self.terms:
+            recent, baseline = self._decayed(term, now)
+            if recent < min_count:
+                continue
+            spike = (recent * window_ratio) / (baseline + 1.0)
+            trends.append({
+                'term': term,
+                'recent': round(recent, 1),
+                'baseline': round(baseline, 1),
+                'spike': round(spike, 2)
+            })
+
+        trends.sort(key=lambda trend: trend['spike'], reverse=True)
+        return trends[:top_n]
+
+
+def tracker_from_config(config: Optional[Dict]) -> Optional[TrendTracker]:
+    """설정 파일의 trends 항목으로 추적기를 만듭니다 (비활성이면 None)."""
+    trends_config = (config or {}).get('trends', {})
+    if not trends_config.get('enabled', False):
+        return None
+
+    return TrendTracker(
+        state_file=trends_config.get('state_file', 'trend_state.json'),
+        short_half_life_hours=trends_config.get('short_half_life_hours', 6),
+        long_half_life_hours=trends_config.get('long_half_life_hours', 72),
+        max_terms=trends_config.get('max_terms', 20000)
+    )
+
+
+def update_trends(config: Optional[Dict], new_news: List[Dict]) -> List[Dict]:
+    """
+    새 뉴스로 트렌드 카운터를 갱신하고 현재 트렌드를 반환합니다.
+
+    Args:
+        config: 전체 설정 딕셔너리
+        new_news: 저장소에 새로 추가된 뉴스 리스트
+
+    Returns:
+        트렌드 목록 (비활성이면 빈 리스트)
+    """
+    tracker = tracker_from_config(config)
+    if tracker is None:
+        return []
+
+    try:
+        updated = tracker.update(new_news)
+        tracker.save()
+        trends_config = config.get('trends', {})
+        trends = tracker.top_trends(
+            top_n=trends_config.get('top_n', 5),
+            min_count=trends_config.get('min_count', 3)
+        )
+        print(f"📈 트렌드 갱신: 단어 {updated}개, 급상승 {len(trends)}개\n")
+        return trends
+    except Exception as e:
+        print(f"❌ 트렌드 갱신 실패: {str(e)}\n")
+        return []
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+소스 작업 대기열 모듈
+여러 수집 노드가 sources.json의 소스를 나눠 수집할 수 있도록,
+각 소스를 실행(run) 단위 작업으로 만들어 임대(lease) 방식으로 나눠줍니다.
+
+    - 작업을 가져간 노드는 visibility_timeout 동안 그 작업을 점유합니다.
+    - 점유 중인 노드는 주기적으로 heartbeat를 보내 점유 시간을 연장합니다.
+    - 노드가 중간에 죽으면 점유 시간이 지난 뒤 다른 노드가 작업을 다시 가져갑니다.
+
+LeaseQueue는 백엔드가 구현해야 하는 인터페이스이며, 기본 구현은 SQLite 파일입니다
+(같은 호스트의 여러 프로세스/컨테이너가 공유 볼륨으로 함께 쓰는 용도).
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    run_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    source TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    token TEXT,
+    lease_expires REAL NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs (run_id, state, lease_expires);
+"""
+
+# 지난 실행의 작업 기록을 보관하는 기간 (초)
+JOB_RETENTION = 7 * 86400
+
+
+class LeaseQueue(ABC):
+    """
+    임대 방식 작업 대기열 인터페이스
+
+    다른 백엔드(예: Redis 호환 저장소)를 쓰려면 이 메서드들을 같은 의미로 구현하면 됩니다.
+    """
+
+    @abstractmethod
+    def enqueue(self, run_id: str, sources: List[Dict]) -> int:
+        """실행에 소스 작업들을 등록합니다. 이미 등록된 소스는 무시합니다 (여러 노드가 호출해도 안전)."""
+
+    @abstractmethod
+    def lease(self, run_id: str, worker_id: str, limit: int = 1) -> List[Dict]:
+        """대기 중이거나 점유 시간이 지난 작업을 최대 limit개 가져갑니다."""
+
+    @abstractmethod
+    def heartbeat(self, run_id: str, worker_id: str) -> int:
+        """worker_id가 점유한 작업들의 점유 시간을 연장하고, 연장된 작업 수를 반환합니다."""
+
+    @abstractmethod
+    def complete(self, run_id: str, name: str, worker_id: str) -> bool:
+        """작업을 완료 처리합니다. 점유를 잃은 뒤라면 False를 반환합니다."""
+
+    @abstractmethod
+    def release(self, run_id: str, name: str, worker_id: str, error: str = ''):
+        """실패한 작업을 대기열로 되돌립니다 (시도 횟수를 넘으면 실패 처리)."""
+
+    @abstractmethod
+    def remaining(self, run_id: str) -> int:
+        """아직 끝나지 않은(대기/점유 중) 작업 수를 반환합니다."""
+
+    def close(self):
+        pass
+
+
+class SQLiteLeaseQueue(LeaseQueue):
+    """SQLite 파일 기반 임대 방식 작업 대기열"""
+
+    def __init__(self, db_file: str = 'work_queue.db', visibility_timeout: float = 120,
+                 max_attempts: int = 3):
+        """
+        Args:
+            db_file: 대기열 파일 경로 (모든 노드가 같은 파일을 사용)
+            visibility_timeout: 작업 점유 시간 (초)
+            max_attempts: 작업당 최대 시도 횟수
+        """
+        self.db_file = db_file
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, timeout=30, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        """대기열 파일 연결을 닫습니다."""
+        self.conn.close()
+
+    def enqueue(self, run_id: str, sources: List[Dict]) -> int:
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM jobs WHERE created_at < ?", (now - JOB_RETENTION,))
+            return self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (run_id, name, source, created_at) VALUES (?, ?, ?, ?)",
+                [(run_id, source['name'], json.dumps(source, ensure_ascii=False), now) for source in sources]
+            ).rowcount
+
+    def _expire_exhausted(self, run_id: str, now: float):
+        """시도 횟수를 다 쓴 채 점유 시간이 지난 작업을 실패 처리합니다."""
+        self.conn.execute(
+            "UPDATE jobs SET state = 'failed', owner = NULL, error = COALESCE(error, 'lease expired') "
+            "WHERE run_id = ? AND state = 'leased' AND lease_expires < ? AND attempts >= ?",
+            (run_id, now, self.max_attempts)
+        )
+
+    def lease(self, run_id: str, worker_id: str, limit: int = 1) -> List[Dict]:
+        token = f"{worker_id}:{time.time_ns()}"
+        now = time.time()
+        with self._lock, self.conn:
+            self._expire_exhausted(run_id, now)
+            # 고르기와 점유를 한 문장으로 처리하므로 여러 노드가 같은 작업을 가져가지 않습니다.
+            self.conn.execute(
+                "UPDATE jobs SET state = 'leased', owner = ?, token = ?, lease_expires = ?, "
+                "attempts = attempts + 1 "
+                "WHERE run_id = ? AND name IN (SELECT name FROM jobs WHERE run_id = ? AND attempts < ? "
+                "AND (state = 'pending' OR (state = 'leased' AND lease_expires < ?)) "
+                "ORDER BY attempts, created_at, name LIMIT ?)",
+                (worker_id, token, now + self.visibility_timeout, run_id, run_id, self.max_attempts, now, limit)
+            )
+            rows = self.conn.execute(
+                "SELECT source FROM jobs WHERE run_id = ? AND token = ?", (run_id, token)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def heartbeat(self, run_id: str, worker_id: str) -> int:
+        with self._lock, self.conn:
+            return self.conn.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE run_id = ? AND owner = ? AND state = 'leased'",
+                (time.time() + self.visibility_timeout, run_id, worker_id)
+            ).rowcount
+
+    def complete(self, run_id: str, name: str, worker_id: str) -> bool:
+        with self._lock, self.conn:
+            return self.conn.execute(
+                "UPDATE jobs SET state = 'done', error = NULL "
+                "WHERE run_id = ? AND name = ? AND owner = ? AND state = 'leased'",
+                (run_id, name, worker_id)
+            ).rowcount == 1
+
+    def release(self, run_id: str, name: str, worker_id: str, error: str = ''):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "owner = NULL, lease_expires = 0, error = ? "
+                "WHERE run_id = ? AND name = ? AND owner = ? AND state = 'leased'",
+                (self.max_attempts, error[:500], run_id, name, worker_id)
+            )
+
+    def remaining(self, run_id: str) -> int:
+        with self._lock, self.conn:
+            self._expire_exhausted(run_id, time.time())
+            row = self.conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE run_id = ? AND state IN ('pending', 'leased')", (run_id,)
+            ).fetchone()
+        return row[0]
+
+    def stats(self, run_id: str) -> Dict[str, int]:
+        """실행의 상태별 작업 수를 반환합니다."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT state, COUNT(*) FROM jobs WHERE run_id = ? GROUP BY state", (run_id,)
+            ).fetchall()
+        return dict(rows)
+
+
+class Heartbeat:
+    """작업을 처리하는 동안 백그라운드에서 점유 시간을 연장하는 스레드"""
+
+    def __init__(self, queue: LeaseQueue, run_id: str, worker_id: str, interval: float = 30):
+        """
+        Args:
+            queue: 작업 대기열
+            run_id: 실행 id
+            worker_id: 노드 이름
+            interval: 연장 주기 (초, visibility_timeout보다 충분히 짧게)
+        """
+        self.queue = queue
+        self.run_id = run_id
+        self.worker_id = worker_id
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.queue.heartbeat(self.run_id, self.worker_id)
+            except Exception as e:
+                print(f"⚠️  heartbeat 실패: {str(e)}")
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+
+def current_run_id(interval_minutes: float = 60, now: Optional[float] = None) -> str:
+    """
+    현재 시각이 속한 실행 구간의 id를 만듭니다.
+
+    cron 등으로 여러 노드를 같은 시각에 실행하면 모두 같은 id를 얻어 같은 실행의 작업을 나눠 갖습니다.
+    """
+    now = time.time() if now is None else now
+    bucket = int(now // (interval_minutes * 60))
+    return time.strftime('%Y%m%dT%H%M', time.gmtime(bucket * interval_minutes * 60))
+
+
+def queue_from_config(config: Optional[Dict]) -> LeaseQueue:
+    """설정 파일의 cluster 항목으로 작업 대기열을 만듭니다."""
+    cluster_config = (config or {}).get('cluster', {})
+    backend = cluster_config.get('backend', 'sqlite')
+    if backend != 'sqlite':
+        raise ValueError(f"지원하지 않는 대기열 백엔드입니다: {backend}")
+
+    return SQLiteLeaseQueue(
+        db_file=cluster_config.get('queue_file', 'work_queue.db'),
+        visibility_timeout=cluster_config.get('visibility_timeout', 120),
+        max_attempts=cluster_config.get('max_attempts', 3)
+    )